@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AritmeticaModular.py — Rango exacto de matrices enteras grandes vía aritmética mod p
+• Primos aleatorios < 2³¹ (Miller-Rabin determinista): productos < 2⁶² caben en int64
+• rango mod p ≤ rango real; el máximo sobre varios primos es el rango real con
+  probabilidad muy alta (solo falla si todos los primos dividen a ciertos menores)
+• certificar=True: confirma con eliminación entera exacta reutilizando los pivotes
+  modulares (el complemento de Schur restante debe ser cero)
+• Con numpy, cada paso de eliminación es una actualización vectorizada de rango 1
+• prueba_singularidad: det(A) mod p (y opcionalmente mod q) antes de cualquier
+  trabajo con Fraction; det ≢ 0 demuestra que A es invertible
+• det_modular: det(A) exacto por residuos chinos (CRT) sobre tantos primos como
+  pida la cota de Hadamard
+"""
+
+from __future__ import annotations
+import random
+from dataclasses import dataclass
+from fractions import Fraction
+from math import lcm, log2, prod
+from typing import List, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+BITS_PRIMO = 31            # primos < 2³¹: (p−1)² < 2⁶² cabe en int64
+
+
+# --------------------- primos ---------------------
+def es_primo(n: int) -> bool:
+    """Miller-Rabin con bases fijas: determinista para n < 3.3·10²⁴."""
+    if n < 2:
+        return False
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+    for q in bases:
+        if n % q == 0:
+            return n == q
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2; s += 1
+    for a in bases:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def primos_aleatorios(k: int, bits: int = BITS_PRIMO, rng: random.Random | None = None) -> List[int]:
+    """k primos distintos elegidos al azar en [2^(bits−1), 2^bits)."""
+    rng = rng or random.Random()
+    primos: List[int] = []
+    while len(primos) < k:
+        c = rng.randrange(1 << (bits - 1), 1 << bits) | 1
+        if c not in primos and es_primo(c):
+            primos.append(c)
+    return primos
+
+
+# --------------------- rango mod p ---------------------
+def rango_mod_p(M: List[List[int]], p: int) -> Tuple[int, List[int], List[int]]:
+    """Eliminación de Gauss en 𝔽_p. Devuelve (rango, filas pivote, columnas pivote),
+    con las filas en índices de M y en el orden en que se eligieron."""
+    R = [[x % p for x in fila] for fila in M]
+    if not R or not R[0]:
+        return 0, [], []
+    if np is not None:
+        return _rango_mod_p_numpy(R, p)
+    n, m = len(R), len(R[0])
+    orden = list(range(n))
+    filas: List[int] = []; cols: List[int] = []
+    r = 0
+    for c in range(m):
+        if r == n:
+            break
+        k = next((i for i in range(r, n) if R[i][c]), None)
+        if k is None:
+            continue
+        R[r], R[k] = R[k], R[r]; orden[r], orden[k] = orden[k], orden[r]
+        inv = pow(R[r][c], p - 2, p)
+        piv = [x * inv % p for x in R[r][c:]]
+        for i in range(r + 1, n):
+            f = R[i][c]
+            if f:
+                fila = R[i]
+                fila[c:] = [(a - f * b) % p for a, b in zip(fila[c:], piv)]
+        filas.append(orden[r]); cols.append(c)
+        r += 1
+    return r, filas, cols
+
+def _rango_mod_p_numpy(R: List[List[int]], p: int) -> Tuple[int, List[int], List[int]]:
+    A = np.array(R, dtype=np.int64)
+    n, m = A.shape
+    orden = np.arange(n)
+    filas: List[int] = []; cols: List[int] = []
+    r = 0
+    for c in range(m):
+        if r == n:
+            break
+        nz = np.flatnonzero(A[r:, c])
+        if nz.size == 0:
+            continue
+        k = r + int(nz[0])
+        if k != r:
+            A[[r, k]] = A[[k, r]]; orden[[r, k]] = orden[[k, r]]
+        inv = pow(int(A[r, c]), p - 2, p)
+        A[r, c:] = A[r, c:] * inv % p
+        afectadas = r + 1 + np.flatnonzero(A[r + 1:, c])
+        if afectadas.size:
+            A[afectadas, c:] = (A[afectadas, c:] - np.outer(A[afectadas, c], A[r, c:])) % p
+        filas.append(int(orden[r])); cols.append(c)
+        r += 1
+    return r, filas, cols
+
+
+# --------------------- certificación exacta ---------------------
+def _rango_certificado(M: List[List[int]], filas: List[int], cols: List[int]) -> int:
+    """Bareiss entero con las filas/columnas pivote modulares al frente. Esos pivotes
+    son no nulos mod p, luego no nulos en ℤ: los primeros r pasos nunca fallan. Si tras
+    ellos el complemento de Schur es cero, el rango es exactamente r; si no, se sigue
+    eliminando con búsqueda de pivote hasta obtener el rango real."""
+    n, m = len(M), len(M[0])
+    orden_f = filas + [i for i in range(n) if i not in set(filas)]
+    orden_c = cols + [j for j in range(m) if j not in set(cols)]
+    A = [[M[i][j] for j in orden_c] for i in orden_f]
+    d = 1
+    r = 0
+    for c in range(m):
+        if r == n:
+            break
+        if r >= len(filas):
+            k = next((i for i in range(r, n) if A[i][c] != 0), None)
+            if k is None:
+                continue
+            A[r], A[k] = A[k], A[r]
+        piv_f = A[r]
+        piv = piv_f[c]
+        for i in range(r + 1, n):
+            fila = A[i]
+            f = fila[c]
+            for j in range(c + 1, m):
+                fila[j] = (piv * fila[j] - f * piv_f[j]) // d
+            fila[c] = 0
+        d = piv
+        r += 1
+        if r == len(filas) and all(x == 0 for fila in A[r:] for x in fila[c + 1:]):
+            return r
+    return r
+
+
+# --------------------- motor ---------------------
+@dataclass
+class RangoModular:
+    rango: int
+    primos: List[int]
+    rangos: List[int]              # rango mod cada primo
+    certificado: bool              # True si el rango está demostrado (cota superior alcanzada o verificación exacta)
+
+def rango_modular(M: List[List[int]], primos: int = 3, certificar: bool = False,
+                  semilla: int | None = None) -> RangoModular:
+    """Rango de la matriz entera M (filas) como máximo del rango mod varios primos."""
+    if not M or not M[0]:
+        return RangoModular(0, [], [], True)
+    tope = min(len(M), len(M[0]))
+    ps = primos_aleatorios(primos, rng=random.Random(semilla))
+    rangos: List[int] = []
+    mejor = (-1, [], [])
+    for p in ps:
+        res = rango_mod_p(M, p)
+        rangos.append(res[0])
+        if res[0] > mejor[0]:
+            mejor = res
+        if res[0] == tope:                     # cota superior alcanzada: no hace falta más
+            break
+    r = mejor[0]
+    if r == tope:
+        return RangoModular(r, ps[:len(rangos)], rangos, True)
+    if certificar:
+        return RangoModular(_rango_certificado(M, mejor[1], mejor[2]), ps, rangos, True)
+    return RangoModular(r, ps, rangos, False)
+
+
+# --------------------- prueba de singularidad ---------------------
+def det_mod_p(M: List[List[int]], p: int) -> int:
+    """det(M) mod p por eliminación en 𝔽_p, O(n³) con enteros de palabra."""
+    R = [[x % p for x in fila] for fila in M]
+    n = len(R)
+    det = 1
+    for c in range(n):
+        k = next((i for i in range(c, n) if R[i][c]), None)
+        if k is None:
+            return 0
+        if k != c:
+            R[c], R[k] = R[k], R[c]
+            det = p - det
+        piv = R[c][c]
+        det = det * piv % p
+        inv = pow(piv, p - 2, p)
+        fila_c = R[c]
+        for i in range(c + 1, n):
+            f = R[i][c] * inv % p
+            if f:
+                fila = R[i]
+                fila[c:] = [(a - f * b) % p for a, b in zip(fila[c:], fila_c[c:])]
+    return det
+
+def a_enteros(A: List[List]) -> List[List[int]] | None:
+    """Escala cada fila por el mcm de sus denominadores (no cambia la singularidad).
+    None si hay flotantes: la prueba solo aplica a entradas exactas."""
+    if not all(isinstance(x, (int, Fraction)) for fila in A for x in fila):
+        return None
+    M = []
+    for fila in A:
+        m = lcm(*(Fraction(x).denominator for x in fila)) if fila else 1
+        M.append([int(x * m) for x in fila])
+    return M
+
+@dataclass
+class PruebaSingular:
+    singular: bool                 # True: det ≡ 0 módulo todos los primos probados
+    primos: List[int]
+    cota_error: float              # prob. máxima de que una A invertible dé singular=True
+
+def prueba_singularidad(A: List[List], segundo_primo: bool = False,
+                        semilla: int | None = None) -> PruebaSingular | None:
+    """singular=False es definitivo (det ≢ 0 mod p ⇒ det ≠ 0): nunca se acepta una
+    matriz singular. singular=True puede fallar solo si p divide a det(A) ≠ 0; por la
+    cota de Hadamard, det tiene a lo sumo log₂|det|/30 factores primos ≥ 2³⁰, frente a
+    ~5·10⁷ primos candidatos. None si A tiene flotantes."""
+    M = a_enteros(A)
+    if M is None:
+        return None
+    rng = random.Random(semilla)
+    primos: List[int] = []
+    for p in primos_aleatorios(2 if segundo_primo else 1, rng=rng):
+        primos.append(p)
+        if det_mod_p(M, p) != 0:
+            return PruebaSingular(False, primos, 0.0)
+    bits_det = sum(0.5 * log2(max(1, sum(x * x for x in fila))) for fila in M)   # log₂ de Hadamard
+    candidatos = (1 << (BITS_PRIMO - 1)) / (BITS_PRIMO * 0.693)
+    cota = (max(1.0, bits_det / (BITS_PRIMO - 1)) / candidatos) ** len(primos)
+    return PruebaSingular(True, primos, cota)
+
+
+# --------------------- determinante por CRT ---------------------
+def det_modular(A: List[List], semilla: int | None = None) -> Fraction | None:
+    """det(A) exacto: det(M) mod p_1, …, p_k con Π p_i > 2·|det(M)| (cota de Hadamard)
+    y reconstrucción simétrica por CRT. M es A con cada fila escalada a enteros, así que
+    det(A) = det(M) / Π escalas. None si A tiene flotantes."""
+    M = a_enteros(A)
+    if M is None:
+        return None
+    escala = prod(lcm(*(Fraction(x).denominator for x in fila)) if fila else 1 for fila in A)
+    bits_det = sum(0.5 * log2(max(1, sum(x * x for x in fila))) for fila in M)
+    k = int(bits_det + 1) // (BITS_PRIMO - 1) + 1            # cada primo aporta ≥ 30 bits
+    residuo, modulo = 0, 1
+    for p in primos_aleatorios(k, rng=random.Random(semilla)):
+        d = det_mod_p(M, p)
+        # x ≡ residuo (mod modulo), x ≡ d (mod p)
+        t = (d - residuo) * pow(modulo, -1, p) % p
+        residuo += modulo * t
+        modulo *= p
+    if residuo > modulo // 2:
+        residuo -= modulo
+    return Fraction(residuo, escala)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BaseIncremental.py — Base escalonada que se actualiza vector a vector
+• Cada vector nuevo se reduce contra los pivotes actuales en O(n·r)
+• Se informa si es independiente o la combinación exacta de vectores anteriores
+• Fuentes: cualquier iterable (generador, lista), archivo de texto o socket
+  (una línea por vector, componentes separadas por espacios o comas; admite p/q)
+Uso:  python BaseIncremental.py < vectores.txt
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+@dataclass
+class VectorAgregado:
+    indice: int                      # 0-based, orden de llegada
+    independiente: bool
+    combinacion: Dict[int, Fraction] = field(default_factory=dict)   # v = Σ c_j·v_j (si dependiente)
+    rango: int = 0                   # rango tras agregarlo
+
+    def describir(self) -> str:
+        if self.independiente:
+            return f"v{self.indice+1}: independiente (rango {self.rango})"
+        if not self.combinacion:
+            return f"v{self.indice+1} = 0 (rango {self.rango})"
+        terminos = " + ".join(f"({c})·v{j+1}" for j, c in sorted(self.combinacion.items()))
+        return f"v{self.indice+1} = {terminos}"
+
+
+class BaseIncremental:
+    """Filas en forma escalonada con pivote 1. Cada fila b_i guarda además cómo se
+    escribe en términos de la base actual, como fila densa: b_i = Σ comb_i[t]·v_base[t]
+    (comb_i tiene i+1 entradas; las filas forman una matriz triangular inferior)."""
+
+    def __init__(self, n: int | None = None):
+        self.n = n
+        self.total = 0
+        self._filas: List[Tuple[int, List[Fraction], List[Fraction]]] = []   # (col pivote, fila, comb)
+        self._base: List[int] = []
+
+    @property
+    def rango(self) -> int:
+        return len(self._filas)
+
+    @property
+    def base(self) -> List[int]:
+        """Índices (0-based) de los vectores originales que forman la base."""
+        return list(self._base)
+
+    def agregar(self, v: Iterable) -> VectorAgregado:
+        w = [Fraction(x) for x in v]
+        if self.n is None:
+            self.n = len(w)
+        elif len(w) != self.n:
+            raise ValueError(f"El vector v{self.total+1} tiene dimensión {len(w)}; se esperaba {self.n}.")
+        k = self.total
+        self.total += 1
+        r = self.rango
+
+        # w = v − Σ f_i·b_i, en el orden en que entraron los pivotes
+        usados: List[Tuple[Fraction, List[Fraction]]] = []
+        for col, fila, comb in self._filas:
+            f = w[col]
+            if f == 0:
+                continue
+            for j in range(col, self.n):
+                if fila[j]:
+                    w[j] -= f * fila[j]
+            usados.append((f, comb))
+
+        # coeficientes sobre la base actual: O(r²) ≤ O(n·r)
+        pc = next((j for j, x in enumerate(w) if x != 0), None)
+        if pc is None:
+            # v = Σ f_i·b_i = Σ f_i·Σ comb_i[t]·v_base[t]
+            total = [Fraction(0)] * r
+            for f, comb in usados:
+                for t, c in enumerate(comb):
+                    if c:
+                        total[t] += f * c
+            return VectorAgregado(k, False, {self._base[t]: c for t, c in enumerate(total) if c != 0}, r)
+
+        piv = w[pc]
+        fila = [x / piv for x in w]
+        comb = [Fraction(0)] * (r + 1)
+        comb[r] = 1 / piv
+        for f, c_i in usados:
+            g = f / piv
+            for t, c in enumerate(c_i):
+                if c:
+                    comb[t] -= g * c
+        self._filas.append((pc, fila, comb))
+        self._base.append(k)
+        return VectorAgregado(k, True, {}, self.rango)
+
+
+# --------------------- fuentes ---------------------
+def parsear_vector(linea: str) -> List[Fraction] | None:
+    """'1 2 -3', '1, 1/2, 0' → [Fraction, ...]; None para líneas vacías o comentarios (#)."""
+    linea = linea.split("#", 1)[0].replace(",", " ").strip()
+    if not linea:
+        return None
+    try:
+        return [Fraction(t) for t in linea.split()]
+    except ValueError:
+        raise ValueError(f"Línea inválida: {linea!r}")
+
+def vectores_de_texto(lineas: Iterable[str]) -> Iterator[List[Fraction]]:
+    """Archivo abierto, sys.stdin, sock.makefile('r') o cualquier iterable de líneas."""
+    for linea in lineas:
+        v = parsear_vector(linea)
+        if v is not None:
+            yield v
+
+def vectores_de_socket(sock) -> Iterator[List[Fraction]]:
+    with sock.makefile("r", encoding="utf-8") as f:
+        yield from vectores_de_texto(f)
+
+def procesar_flujo(fuente: Iterable[Iterable], n: int | None = None) -> Iterator[VectorAgregado]:
+    """Consume la fuente de a un vector y va emitiendo el resultado de cada uno."""
+    base = BaseIncremental(n)
+    for v in fuente:
+        yield base.agregar(v)
+
+
+if __name__ == "__main__":
+    import sys
+    for res in procesar_flujo(vectores_de_texto(sys.stdin)):
+        print(res.describir())
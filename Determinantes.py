@@ -1,4 +1,9 @@
+from collections import OrderedDict
 from fractions import Fraction
+from operator import itemgetter
+
+from Estructura import analizar_estructura, signo_permutacion
+from Motores import determinante, elegir_motor
 
 def mostrar_matriz(matriz, titulo=""):
     """Muestra una matriz de forma ordenada usando fracciones"""
@@ -26,12 +31,111 @@ def mostrar_matriz(matriz, titulo=""):
         print(" ]")
     print()
 
+MAX_MENORES = 1 << 16   # capacidad por defecto de la caché de menores (LRU)
+MIN_VISTA = 5           # menores de menos filas se copian: pocas celdas y acceso nativo
+
+class _FilaMenor:
+    """Fila de un VistaMenor: lee la fila de la base en las columnas del menor."""
+    __slots__ = ("fila", "cols")
+
+    def __init__(self, fila, cols):
+        self.fila = fila
+        self.cols = cols
+
+    def __len__(self):
+        return len(self.cols)
+
+    def __getitem__(self, j):
+        if j.__class__ is slice:
+            return [self.fila[c] for c in self.cols[j]]
+        return self.fila[self.cols[j]]
+
+    def __iter__(self):
+        fila = self.fila
+        return (fila[c] for c in self.cols)
+
+class VistaMenor:
+    """Menor de una matriz sin copiar sus elementos: guarda la matriz base y dos tuplas
+    con los índices de las filas y columnas que quedan. Un menor de un menor vuelve a
+    apuntar a la base original, así que cada nivel de la expansión cuesta O(n) en
+    índices en lugar de O(n²) celdas nuevas. Se indexa como una lista de listas."""
+    __slots__ = ("base", "filas", "cols")
+
+    def __init__(self, base, filas=None, cols=None):
+        if isinstance(base, VistaMenor):
+            filas = base.filas if filas is None else tuple(base.filas[i] for i in filas)
+            cols = base.cols if cols is None else tuple(base.cols[j] for j in cols)
+            base = base.base
+        self.base = base
+        self.filas = tuple(range(len(base))) if filas is None else tuple(filas)
+        self.cols = tuple(range(len(base[0]) if len(base) else 0)) if cols is None else tuple(cols)
+
+    def __len__(self):
+        return len(self.filas)
+
+    def __getitem__(self, i):
+        if i.__class__ is slice:
+            return VistaMenor(self.base, self.filas[i], self.cols)
+        return _FilaMenor(self.base[self.filas[i]], self.cols)
+
+    def __iter__(self):
+        base, cols = self.base, self.cols
+        return (_FilaMenor(base[i], cols) for i in self.filas)
+
+    def sin(self, fila, col):
+        """Menor que resulta de eliminar la fila y la columna dadas (índices del menor)."""
+        menor = object.__new__(VistaMenor)          # sin validar: los índices ya son de la base
+        menor.base = self.base
+        menor.filas = self.filas[:fila] + self.filas[fila + 1:]
+        menor.cols = self.cols[:col] + self.cols[col + 1:]
+        return menor
+
+    def bloque(self, a, b):
+        """Bloque diagonal con filas y columnas a..b-1."""
+        return VistaMenor(self.base, self.filas[a:b], self.cols[a:b])
+
+    def a_lista(self):
+        base, cols = self.base, self.cols
+        if len(cols) < 2:
+            return [[base[i][c] for c in cols] for i in self.filas]
+        toma = itemgetter(*cols)
+        return [list(toma(base[i])) for i in self.filas]
+
+    def __repr__(self):
+        return f"VistaMenor({self.a_lista()!r})"
+
 def obtener_submatriz(matriz, fila_eliminar, col_eliminar):
-    """Obtiene la submatriz eliminando una fila y columna"""
-    return [
-        [matriz[i][j] for j in range(len(matriz)) if j != col_eliminar]
-        for i in range(len(matriz)) if i != fila_eliminar
-    ]
+    """Obtiene la submatriz eliminando una fila y columna: VistaMenor (sin copiar) si
+    tiene al menos MIN_VISTA filas; los menores pequeños, que son la gran mayoría de los
+    nodos de la expansión, se copian porque leer una lista es más rápido que una vista."""
+    if isinstance(matriz, VistaMenor):
+        menor = matriz.sin(fila_eliminar, col_eliminar)
+        return menor if len(menor) >= MIN_VISTA else menor.a_lista()
+    if len(matriz) > MIN_VISTA:
+        return VistaMenor(matriz).sin(fila_eliminar, col_eliminar)
+    return [fila[:col_eliminar] + fila[col_eliminar + 1:]
+            for i, fila in enumerate(matriz) if i != fila_eliminar]
+
+def elegir_linea(matriz):
+    """(es_fila, índice) de la fila o columna con más ceros; en empate, la primera fila
+    (sin ceros se expande por la primera fila, como siempre)."""
+    n = len(matriz)
+    mejor, es_fila, linea = -1, True, 0
+    for i in range(n):
+        ceros = sum(1 for x in matriz[i] if x == 0)
+        if ceros > mejor:
+            mejor, es_fila, linea = ceros, True, i
+    for j in range(n):
+        ceros = sum(1 for fila in matriz if fila[j] == 0)
+        if ceros > mejor:
+            mejor, es_fila, linea = ceros, False, j
+    return es_fila, linea
+
+def _etiqueta(i, j):
+    """Nombre del menor Aᵢⱼ en el desarrollo (A₁j para la primera fila)."""
+    if i == 0:
+        return f"A₁{'+' if j+1>9 else ''}{j+1}"
+    return f"A({i+1},{j+1})"
 
 def es_matriz_triangular(matriz):
     """Verifica si una matriz es triangular superior"""
@@ -42,9 +146,18 @@ def es_matriz_triangular(matriz):
                 return False
     return True
 
-def calcular_determinante(matriz):
-    """Calcula el determinante mostrando todos los pasos en formato de matrices"""
+def calcular_determinante(matriz, motor=None, memo=False, mejor_linea=False):
+    """Calcula el determinante mostrando todos los pasos en formato de matrices.
+    Por defecto expande por la primera fila con el formato de siempre; mejor_linea=True
+    expande por la fila o columna con más ceros y omite los términos nulos.
+    Siempre expande por cofactores, salvo que se indique otro motor con motor=... o
+    con ALGEBRA_MOTOR: entonces muestra el motor elegido y el resultado sin pasos.
+    Con memo=True los menores se calculan con calcular_determinante_memo (siempre
+    por cofactores) y los repetidos se citan en lugar de recalcularse."""
     n = len(matriz)
+    cache = CacheMenores() if memo else None
+    if memo:
+        motor = motor or "cofactor"
     
     print("=" * 60)
     print("CÁLCULO DE DETERMINANTE")
@@ -76,8 +189,11 @@ def calcular_determinante(matriz):
         print("=" * 60)
         return det
     
-    # Verificar si es matriz triangular
-    if es_matriz_triangular(matriz):
+    # Estructura (una sola pasada): triangular, permutación, diagonal por bloques
+    estructura = analizar_estructura(matriz)
+
+    # Verificar si es matriz triangular (superior o inferior)
+    if estructura.triangular:
         print("MATRIZ TRIANGULAR:")
         print("El determinante es el producto de los elementos de la diagonal principal")
         
@@ -87,7 +203,7 @@ def calcular_determinante(matriz):
             print("[", end="")
             for j, elemento in enumerate(fila):
                 if i == j:
-                    print(f" \033[1m{elemento:>6}\033[0m", end="")  # Negrita para diagonal
+                    print(f" \033[1m{str(elemento):>6}\033[0m", end="")  # Negrita para diagonal
                 else:
                     if isinstance(elemento, Fraction):
                         if elemento.denominator == 1:
@@ -126,55 +242,113 @@ def calcular_determinante(matriz):
         print("=" * 60)
         return det
     
-    # Expansión por cofactores en la primera fila
-    print("EXPANSIÓN POR COFACTORES EN LA PRIMERA FILA:")
-    print("Fórmula: det(A) = a₁₁·det(A₁₁) - a₁₂·det(A₁₂) + a₁₃·det(A₁₃) - ...")
+    if estructura.es_permutacion:
+        sigma = estructura.permutacion
+        signo = signo_permutacion(sigma)
+        print("MATRIZ DE PERMUTACIÓN:")
+        print("Cada fila y cada columna tienen un único 1: det(A) = signo de la permutación")
+        print("σ = (" + " ".join(str(c + 1) for c in sigma) + f") → signo = {signo:+d}")
+        det = signo * matriz[0][sigma[0]]
+        print("\n" + "=" * 60)
+        print(f"RESULTADO: det(A) = {det}")
+        print("=" * 60)
+        return det
+
+    if estructura.diagonal_por_bloques:
+        bloques = estructura.bloques
+        print("MATRIZ DIAGONAL POR BLOQUES:")
+        print("Fórmula: det(A) = det(B₁) × det(B₂) × ... (producto de los bloques diagonales)")
+        det = 1
+        for k in range(len(bloques) - 1):
+            a, b = bloques[k], bloques[k + 1]
+            bloque = VistaMenor(matriz).bloque(a, b)
+            print(f"\nBLOQUE B{k+1} (filas/columnas {a+1}–{b}):")
+            mostrar_matriz(bloque)
+            det_b = calcular_determinante_simple(bloque, mejor_linea=mejor_linea, analizar=False)
+            print(f"det(B{k+1}) = {det_b}")
+            det *= det_b
+        print(f"\nPRODUCTO DE LOS BLOQUES: {det}")
+        print("\n" + "=" * 60)
+        print(f"RESULTADO: det(A) = {det}")
+        print("=" * 60)
+        return det
+
+    eleccion = elegir_motor("det", matriz, motor=motor, pasos="cofactor", interactivo=True)
+    if eleccion.motor != "cofactor":
+        print(f"MATRIZ {n}×{n}: determinante sin expansión por cofactores.")
+        print(eleccion.describir())
+        det = determinante(matriz, eleccion.motor)
+        print("\n" + "=" * 60)
+        print(f"RESULTADO: det(A) = {det}")
+        print("=" * 60)
+        return det
+
+    # Expansión por cofactores en la fila o columna con más ceros
+    es_fila, linea = elegir_linea(matriz) if mejor_linea and cache is None else (True, 0)
+    if es_fila and linea == 0:
+        print("EXPANSIÓN POR COFACTORES EN LA PRIMERA FILA:")
+        print("Fórmula: det(A) = a₁₁·det(A₁₁) - a₁₂·det(A₁₂) + a₁₃·det(A₁₃) - ...")
+    else:
+        print(f"EXPANSIÓN POR COFACTORES EN LA {'FILA' if es_fila else 'COLUMNA'} {linea+1} (la de más ceros):")
+        print("Fórmula: det(A) = Σ (-1)^(i+j)·aᵢⱼ·det(Aᵢⱼ); los términos con aᵢⱼ = 0 se omiten")
     print()
     
     det_total = 0
     print("DESARROLLO:")
     
-    for j in range(n):
-        elemento = matriz[0][j]
-        signo = (-1) ** j
-        submatriz = obtener_submatriz(matriz, 0, j)
+    for t in range(n):
+        i, j = (linea, t) if es_fila else (t, linea)
+        elemento = matriz[i][j]
+        signo = (-1) ** (i + j)
+        nombre = _etiqueta(i, j)
+        
+        if elemento == 0 and mejor_linea:
+            print(f"\nTÉRMINO {t+1}: a = 0 en ({i+1},{j+1}) → se omite")
+            continue
+        submatriz = obtener_submatriz(matriz, i, j)
         
         # Mostrar el término actual
-        print(f"\nTÉRMINO {j+1}:")
+        print(f"\nTÉRMINO {t+1}:")
         if signo > 0:
-            print(f" + ({elemento}) × det(A₁{'+' if j+1>9 else ''}{j+1})")
+            print(f" + ({elemento}) × det({nombre})")
         else:
-            print(f" - ({elemento}) × det(A₁{'+' if j+1>9 else ''}{j+1})")
+            print(f" - ({elemento}) × det({nombre})")
         
         # Mostrar la submatriz
-        print(f"Submatriz A₁{'+' if j+1>9 else ''}{j+1} (eliminar fila 1, columna {j+1}):")
+        print(f"Submatriz {nombre} (eliminar fila {i+1}, columna {j+1}):")
         mostrar_matriz(submatriz)
         
         # Calcular determinante de la submatriz
         if len(submatriz) == 1:
             det_sub = submatriz[0][0]
-            print(f"det(A₁{'+' if j+1>9 else ''}{j+1}) = {det_sub}")
+            print(f"det({nombre}) = {det_sub}")
         elif len(submatriz) == 2:
             a, b = submatriz[0]
             c, d = submatriz[1]
             det_sub = a * d - b * c
-            print(f"det(A₁{'+' if j+1>9 else ''}{j+1}) = ({a})×({d}) - ({b})×({c})")
+            print(f"det({nombre}) = ({a})×({d}) - ({b})×({c})")
             print(f"                = {a*d} - {b*c}")
             print(f"                = {det_sub}")
+        elif cache is not None:
+            print(f"Cálculo de det({nombre}):")
+            det_sub = calcular_determinante_memo(matriz, 2, cache, ((1 << n) - 1) & ~(1 << j))
+            print(f"det({nombre}) = {det_sub}")
         else:
             # Para submatrices más grandes, calcular recursivamente
-            print(f"Cálculo de det(A₁{'+' if j+1>9 else ''}{j+1}):")
-            det_sub = calcular_determinante_simple(submatriz)
-            print(f"det(A₁{'+' if j+1>9 else ''}{j+1}) = {det_sub}")
+            print(f"Cálculo de det({nombre}):")
+            det_sub = calcular_determinante_simple(submatriz, mejor_linea=mejor_linea, analizar=False)
+            print(f"det({nombre}) = {det_sub}")
         
         termino = signo * elemento * det_sub
-        print(f"Término {j+1} = {signo} × {elemento} × {det_sub} = {termino}")
+        print(f"Término {t+1} = {signo} × {elemento} × {det_sub} = {termino}")
         det_total += termino
         
-        if j < n - 1:
+        if t < n - 1:
             print("-" * 40)
     
     print(f"\nSUMA DE TÉRMINOS: {det_total}")
+    if cache is not None:
+        print(f"Menores distintos calculados: {cache.fallos}; reutilizados: {cache.aciertos}")
     
     print("\n" + "=" * 60)
     print(f"RESULTADO: det(A) = {det_total}")
@@ -182,8 +356,11 @@ def calcular_determinante(matriz):
     
     return det_total
 
-def calcular_determinante_simple(matriz, nivel=1):
-    """Calcula el determinante mostrando los pasos de 2×2 dentro del cálculo recursivo"""
+def calcular_determinante_simple(matriz, nivel=1, mejor_linea=False, analizar=True):
+    """Calcula el determinante mostrando los pasos de 2×2 dentro del cálculo recursivo.
+    mejor_linea=True: por la fila o columna con más ceros, sin los términos nulos.
+    analizar=True: análisis de estructura completo (solo en la matriz de entrada); los
+    menores se llaman con analizar=False y solo miran si son triangulares superiores."""
     n = len(matriz)
 
     # Si es 1×1
@@ -201,27 +378,42 @@ def calcular_determinante_simple(matriz, nivel=1):
         print(" " * (nivel * 2) + f"det = ({a})×({d}) - ({b})×({c}) = {a*d} - {b*c} = {det}")
         return det
     
-    # Si es triangular, simplificar
-    if es_matriz_triangular(matriz):
+    # Atajos por estructura: triangular, permutación o diagonal por bloques
+    estructura = analizar_estructura(matriz) if analizar else None
+    if estructura.triangular if estructura else es_matriz_triangular(matriz):
         producto = 1
         for i in range(n):
             producto *= matriz[i][i]
         return producto
+    if estructura and estructura.es_permutacion:
+        sigma = estructura.permutacion
+        return signo_permutacion(sigma) * matriz[0][sigma[0]]
+    if estructura and estructura.diagonal_por_bloques:
+        bloques = estructura.bloques
+        print(" " * (nivel * 2) + f"→ Diagonal por bloques: det = producto de {len(bloques) - 1} bloques")
+        det = 1
+        for a, b in zip(bloques, bloques[1:]):
+            det *= calcular_determinante_simple(VistaMenor(matriz).bloque(a, b), nivel + 1, mejor_linea, False)
+        return det
 
-    # Expansión por cofactores en la primera fila
+    # Expansión por cofactores en la primera fila (o en la de más ceros, sin los nulos)
+    es_fila, linea = elegir_linea(matriz) if mejor_linea else (True, 0)
     det = 0
-    for j in range(n):
-        signo = (-1) ** j
-        submatriz = obtener_submatriz(matriz, 0, j)
-        elemento = matriz[0][j]
-        print(" " * (nivel * 2) + f"→ Expandiendo elemento ({elemento}) en posición (1,{j+1})")
+    for t in range(n):
+        i, j = (linea, t) if es_fila else (t, linea)
+        elemento = matriz[i][j]
+        if elemento == 0 and mejor_linea:
+            continue
+        signo = (-1) ** (i + j)
+        submatriz = obtener_submatriz(matriz, i, j)
+        print(" " * (nivel * 2) + f"→ Expandiendo elemento ({elemento}) en posición ({i+1},{j+1})")
         print(" " * (nivel * 2) + f"Submatriz resultante:")
         mostrar_matriz(submatriz)
-        det_sub = calcular_determinante_simple(submatriz, nivel + 1)
+        det_sub = calcular_determinante_simple(submatriz, nivel + 1, mejor_linea, False)
         termino = signo * elemento * det_sub
         print(" " * (nivel * 2) + f"Término = {signo} × {elemento} × {det_sub} = {termino}")
         det += termino
-        if j < n - 1:
+        if t < n - 1:
             print(" " * (nivel * 2) + "-" * 30)
     
     if nivel == 1:
@@ -229,6 +421,81 @@ def calcular_determinante_simple(matriz, nivel=1):
     return det
 
 
+class CacheMenores:
+    """Caché LRU acotada de determinantes de menores. Al expandir siempre por la primera
+    fila restante, un menor queda determinado por sus columnas: la clave es la máscara
+    de bits de las columnas que quedan. Hay 2ⁿ máscaras, no n! caminos.
+    capacidad=None: sin límite (nunca se desaloja)."""
+
+    def __init__(self, capacidad=MAX_MENORES):
+        self.capacidad = capacidad
+        self.datos = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def get(self, clave):
+        if clave not in self.datos:
+            self.fallos += 1
+            return None
+        self.datos.move_to_end(clave)
+        self.aciertos += 1
+        return self.datos[clave]
+
+    def put(self, clave, valor):
+        self.datos[clave] = valor
+        self.datos.move_to_end(clave)
+        if self.capacidad is not None and len(self.datos) > self.capacidad:
+            self.datos.popitem(last=False)
+
+def _nombre_menor(matriz, mascara):
+    n = len(matriz)
+    cols = [j for j in range(n) if mascara >> j & 1]
+    fila0 = n - len(cols)
+    return f"M[F{fila0+1}–F{n}; C{','.join(str(c + 1) for c in cols)}]"
+
+def calcular_determinante_memo(matriz, nivel=1, cache=None, mascara=None):
+    """Laplace por la primera fila restante con memoria de menores: O(2ⁿ·n) en lugar de
+    O(n!). El menor de `matriz` con filas desde n − |mascara| y columnas en `mascara`
+    se calcula una vez; las siguientes veces se imprime la referencia al valor ya hallado."""
+    n = len(matriz)
+    cache = cache if cache is not None else CacheMenores()
+    mascara = (1 << n) - 1 if mascara is None else mascara
+    cols = [j for j in range(n) if mascara >> j & 1]
+    k = len(cols)
+    fila = matriz[n - k]
+    sangria = " " * (nivel * 2)
+
+    if k == 1:
+        return fila[cols[0]]
+    previo = cache.get(mascara)
+    if previo is not None:
+        print(sangria + f"↺ det {_nombre_menor(matriz, mascara)} ya calculado = {previo}")
+        return previo
+    if k == 2:
+        a, b = fila[cols[0]], fila[cols[1]]
+        c, d = matriz[n - 1][cols[0]], matriz[n - 1][cols[1]]
+        det = a * d - b * c
+        print(sangria + f"{_nombre_menor(matriz, mascara)}: det = ({a})×({d}) - ({b})×({c}) = {det}")
+        cache.put(mascara, det)
+        return det
+
+    print(sangria + f"Menor {_nombre_menor(matriz, mascara)}:")
+    det = 0
+    for t, j in enumerate(cols):
+        signo = (-1) ** t
+        elemento = fila[j]
+        if elemento == 0:
+            continue
+        print(sangria + f"→ Expandiendo elemento ({elemento}) en posición ({n-k+1},{j+1})")
+        det_sub = calcular_determinante_memo(matriz, nivel + 1, cache, mascara & ~(1 << j))
+        termino = signo * elemento * det_sub
+        print(sangria + f"Término = {signo} × {elemento} × {det_sub} = {termino}")
+        det += termino
+    print(sangria + f"det {_nombre_menor(matriz, mascara)} = {det}")
+    cache.put(mascara, det)
+    return det
+
+
 def ingresar_matriz():
     """Función para que el usuario ingrese una matriz"""
     print("\n" + "=" * 40)
@@ -280,13 +547,15 @@ def main():
         try:
             print("\nOPCIONES:")
             print("1. Calcular determinante")
-            print("2. Salir")
+            print("2. Calcular determinante (cofactores con memoria de menores)")
+            print("3. Calcular determinante (expansión por la línea con más ceros)")
+            print("4. Salir")
             
-            opcion = input("\nSeleccione una opción (1-2): ").strip()
+            opcion = input("\nSeleccione una opción (1-4): ").strip()
             
-            if opcion == "1":
+            if opcion in ("1", "2", "3"):
                 matriz = ingresar_matriz()
-                det = calcular_determinante(matriz)
+                det = calcular_determinante(matriz, memo=opcion == "2", mejor_linea=opcion == "3")
                 
                 # Mostrar interpretación del resultado
                 print("\n" + "=" * 60)
@@ -302,12 +571,12 @@ def main():
                     print("   • El sistema Ax=0 tiene solo la solución trivial")
                 print("=" * 60)
                 
-            elif opcion == "2":
+            elif opcion == "4":
                 print("¡Hasta luego!")
                 break
                 
             else:
-                print("Opción no válida. Por favor seleccione 1-2.")
+                print("Opción no válida. Por favor seleccione 1-4.")
                 continue
             
             # Preguntar si desea continuar
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Estructura.py — Detección de estructura de una matriz cuadrada en una pasada
+• Etiquetas: diagonal, triangular superior/inferior, permutación, simétrica,
+  diagonal por bloques
+• Los núcleos (Gauss, Gauss-Jordan, Inversa, Determinantes, Cramer) despachan
+  según estas etiquetas a rutinas O(n) u O(n²)
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import List, Tuple
+
+
+@dataclass(frozen=True)
+class EstructuraMatriz:
+    n: int
+    triangular_superior: bool
+    triangular_inferior: bool
+    permutacion: Tuple[int, ...] | None   # σ con A[i][σ(i)] = 1, o None
+    simetrica: bool
+    bloques: Tuple[int, ...]              # límites de los bloques diagonales: 0 = b0 < b1 < … < bk = n
+
+    @property
+    def diagonal(self) -> bool:
+        return self.triangular_superior and self.triangular_inferior
+
+    @property
+    def triangular(self) -> bool:
+        return self.triangular_superior or self.triangular_inferior
+
+    @property
+    def es_permutacion(self) -> bool:
+        return self.permutacion is not None
+
+    @property
+    def diagonal_por_bloques(self) -> bool:
+        return len(self.bloques) > 2
+
+    @property
+    def etiquetas(self) -> List[str]:
+        et = []
+        if self.diagonal: et.append("diagonal")
+        elif self.triangular_superior: et.append("triangular superior")
+        elif self.triangular_inferior: et.append("triangular inferior")
+        if self.es_permutacion: et.append("permutación")
+        if self.simetrica: et.append("simétrica")
+        if self.diagonal_por_bloques and not self.diagonal:
+            et.append(f"diagonal por bloques ({len(self.bloques) - 1} bloques)")
+        return et
+
+
+def analizar_estructura(A: List[List]) -> EstructuraMatriz:
+    """Recorre A (n×n) una sola vez y devuelve todas sus etiquetas estructurales."""
+    n = len(A)
+    sup = inf = sim = True
+    es_perm = True
+    sigma = [-1] * n
+    col_usada = [False] * n
+    alcance = list(range(n))      # alcance[i]: índice más lejano ligado a i por un no cero
+    for i in range(n):
+        fila = A[i]
+        for j in range(n):
+            x = fila[j]
+            if j > i and sim and x != A[j][i]:
+                sim = False
+            if x == 0:
+                continue
+            if j < i:
+                sup = False
+                if i > alcance[j]: alcance[j] = i
+            elif j > i:
+                inf = False
+                if j > alcance[i]: alcance[i] = j
+            if es_perm:
+                if x != 1 or sigma[i] != -1 or col_usada[j]:
+                    es_perm = False
+                else:
+                    sigma[i] = j; col_usada[j] = True
+    es_perm = es_perm and n > 0 and all(s != -1 for s in sigma)
+
+    # un límite k separa bloques si ningún no cero une [0, k) con [k, n)
+    bloques = [0]
+    lejos = -1
+    for k in range(n):
+        lejos = max(lejos, alcance[k])
+        if lejos == k:
+            bloques.append(k + 1)
+    return EstructuraMatriz(n, sup, inf, tuple(sigma) if es_perm else None, sim, tuple(bloques))
+
+
+def signo_permutacion(sigma: Tuple[int, ...]) -> int:
+    """(-1)^(n - ciclos), O(n)."""
+    visto = [False] * len(sigma)
+    transp = 0
+    for inicio in range(len(sigma)):
+        largo, j = 0, inicio
+        while not visto[j]:
+            visto[j] = True; j = sigma[j]; largo += 1
+        if largo:
+            transp += largo - 1
+    return -1 if transp % 2 else 1
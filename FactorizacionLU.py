@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FactorizacionLU.py — LU flotante con pivoteo parcial y refinamiento iterativo mixto
+• La factorización (O(n³)) se hace una sola vez, en float
+• Cada iteración: residuo r = b − A·x EXACTO (Fraction), corrección A·d ≈ r con la LU
+  flotante (O(n²)) y x ← x + d sumando d exactamente
+• Entradas exactas: tras cada iteración se intenta la reconstrucción racional de x
+  (limit_denominator) y se acepta solo si A·x = b se cumple exactamente
+• Sistemas bien condicionados: respuesta exacta a casi la velocidad del modo flotante
+• estimar_condicion: κ₁(A) al estilo Hager/Higham en O(n²) reutilizando la LU; con él
+  elegir_precision decide si el modo flotante es fiable o hay que pasar a fracciones
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from fractions import Fraction
+from math import frexp, isfinite, lcm, ldexp
+from operator import mul
+from typing import List, Union
+
+Number = Union[Fraction, float]
+MAX_ITER = 40
+TOL_REFINAMIENTO = 1e-15       # ‖d‖∞ / ‖x‖∞ para cortar con entradas flotantes
+UMBRAL_COND = 1e8              # κ₁ mayor: el flotante pierde más de ~8 de sus ~16 cifras → exacto
+
+
+@dataclass
+class FactorLU:
+    LU: List[List[float]]          # L (diagonal unitaria, bajo la diagonal) y U compactadas
+    perm: List[int]                # fila i de P·A = fila perm[i] de A
+
+    @property
+    def n(self) -> int:
+        return len(self.LU)
+
+    def adelante(self, b: List[float]) -> List[float]:
+        """y = L⁻¹·P·b."""
+        LU = self.LU
+        y = [float(b[p]) for p in self.perm]
+        for i in range(self.n):
+            fila = LU[i]
+            s = y[i]
+            for k in range(i):
+                s -= fila[k] * y[k]
+            y[i] = s
+        return y
+
+    def resolver(self, b: List[float]) -> List[float]:
+        LU, n = self.LU, self.n
+        y = self.adelante(b)
+        for i in range(n - 1, -1, -1):
+            fila = LU[i]
+            s = y[i]
+            for k in range(i + 1, n):
+                s -= fila[k] * y[k]
+            y[i] = s / fila[i]
+        return y
+
+    def resolver_transpuesta(self, b: List[float]) -> List[float]:
+        """Aᵀ·x = b con la misma factorización: Uᵀ·z = b, Lᵀ·w = z, x = Pᵀ·w."""
+        LU, n = self.LU, self.n
+        z = [float(v) for v in b]
+        for i in range(n):
+            s = z[i]
+            for k in range(i):
+                s -= LU[k][i] * z[k]
+            z[i] = s / LU[i][i]
+        for i in range(n - 1, -1, -1):
+            s = z[i]
+            for k in range(i + 1, n):
+                s -= LU[k][i] * z[k]
+            z[i] = s
+        x = [0.0] * n
+        for i, p in enumerate(self.perm):
+            x[p] = z[i]
+        return x
+
+
+def factorizar_lu(A: List[List[Number]], tol: float = 1e-12) -> FactorLU | None:
+    """P·A = L·U en float con pivoteo parcial. None si algún pivote es ≤ tol·max|a_ij|."""
+    n = len(A)
+    LU = [[float(x) for x in fila] for fila in A]
+    escala = max((abs(x) for fila in LU for x in fila), default=0.0)
+    if escala == 0.0:
+        return None
+    perm = list(range(n))
+    for k in range(n):
+        p = max(range(k, n), key=lambda i: abs(LU[i][k]))
+        if abs(LU[p][k]) <= tol * escala:
+            return None
+        if p != k:
+            LU[k], LU[p] = LU[p], LU[k]
+            perm[k], perm[p] = perm[p], perm[k]
+        fila_k = LU[k]
+        piv = fila_k[k]
+        for i in range(k + 1, n):
+            fila = LU[i]
+            f = fila[k] / piv
+            fila[k] = f
+            if f != 0.0:
+                for j in range(k + 1, n):
+                    fila[j] -= f * fila_k[j]
+    return FactorLU(LU, perm)
+
+
+# --------------------- refinamiento iterativo ---------------------
+@dataclass
+class RefinamientoResultado:
+    soluciones: List[Number] | None    # None si no convergió (o A singular en float)
+    exacta: bool                       # True: A·x = b verificado exactamente
+    iteraciones: int
+    residuos: List[float] = field(default_factory=list)   # ‖b − A·x‖∞ tras cada iteración
+    factor: FactorLU | None = None
+
+def _a_enteros(A: List[List[Number]], b: List[Number]) -> tuple:
+    """Escala cada fila de [A|b] por el mcm de sus denominadores: misma solución, todo int.
+    Devuelve (Ai, bi, escalas)."""
+    Ai, bi, escalas = [], [], []
+    for fila, v in zip(A, b):
+        q = [Fraction(x) for x in fila] + [Fraction(v)]      # float → Fraction es exacto
+        m = lcm(*(x.denominator for x in q))
+        Ai.append([int(x * m) for x in q[:-1]]); bi.append(int(q[-1] * m)); escalas.append(m)
+    return Ai, bi, escalas
+
+def _residuo(A: List[List[int]], b: List[int], X: List[int], D: int) -> List[int]:
+    """D·b − A·X: residuo de x = X/D escalado por D, en enteros."""
+    return [bi * D - sum(map(mul, fila, X)) for fila, bi in zip(A, b)]
+
+def resolver_refinado(A: List[List[Number]], b: List[Number], max_iter: int = MAX_ITER,
+                      tol: float = TOL_REFINAMIENTO, factor: FactorLU | None = None) -> RefinamientoResultado:
+    """Ax = b (A cuadrada) por LU flotante + refinamiento con residuo exacto.
+    x se guarda como X / 2^e con X entero; el residuo se calcula en enteros.
+    `factor`: LU de A ya calculada (p. ej. por elegir_precision); se reutiliza
+    resolviendo A·d = D⁻¹·r, con D las escalas enteras de las filas."""
+    n = len(A)
+    exacta = all(isinstance(v, (int, Fraction)) for fila in A for v in fila) and \
+             all(isinstance(v, (int, Fraction)) for v in b)
+    Ai, bi, escalas = _a_enteros(A, b)
+    if factor is not None:
+        F = factor
+        corregir = lambda r: F.resolver([v / m for v, m in zip(r, escalas)])
+    else:
+        F = factorizar_lu(Ai)
+        corregir = F.resolver if F is not None else None
+    if F is None:
+        return RefinamientoResultado(None, False, 0)
+    X = [0] * n
+    e = 0
+    r: List[float] = [float(v) for v in bi]
+    residuos: List[float] = []
+    previo = float("inf")
+    for it in range(1, max_iter + 1):
+        d = corregir(r)
+        if not all(isfinite(v) for v in d):
+            break
+        paso = max(abs(v) for v in d)
+        if paso == 0.0:                                      # r por debajo del rango de float
+            break
+        # d redondeada a 53 bits relativos a ‖d‖: basta para que el refinamiento contraiga
+        e2 = max(e, 53 - frexp(paso)[1])
+        X = [(x << (e2 - e)) + round(ldexp(v, e2)) for x, v in zip(X, d)]
+        e = e2
+        D = 1 << e
+        R = _residuo(Ai, bi, X, D)
+        r = [v / D for v in R]
+        residuos.append(max(abs(v) for v in r))
+        if exacta:
+            if not any(R):
+                return RefinamientoResultado([Fraction(x, D) for x in X], True, it, residuos, F)
+            # x está a distancia ~paso de la solución: reconstruir con denominador ≤ √(1/2·paso)
+            cota = int((0.5 / paso) ** 0.5)
+            if cota >= 1:
+                cand = [Fraction(x, D).limit_denominator(cota) for x in X]
+                m = lcm(*(c.denominator for c in cand))
+                if not any(_residuo(Ai, bi, [int(c * m) for c in cand], m)):
+                    return RefinamientoResultado(cand, True, it, residuos, F)
+        elif paso <= tol * max(max(abs(x) for x in X) / D, 1e-300):
+            return RefinamientoResultado([x / D for x in X], False, it, residuos, F)
+        if it > 2 and paso > 0.5 * previo:                  # no contrae: A mal condicionada
+            break
+        previo = paso
+    return RefinamientoResultado(None, False, len(residuos), residuos, F)
+
+
+# --------------------- número de condición ---------------------
+def norma_1(A: List[List[Number]]) -> float:
+    """Máxima suma absoluta por columnas."""
+    return max(sum(abs(float(fila[j])) for fila in A) for j in range(len(A[0])))
+
+def estimar_condicion(A: List[List[Number]], F: FactorLU | None = None, max_iter: int = 5) -> float:
+    """κ₁(A) = ‖A‖₁·‖A⁻¹‖₁ sin formar A⁻¹: estimador de Hager (ascenso en los vértices
+    de la bola ‖x‖₁ = 1) más el vector alternante de Higham. Cada paso es un par de
+    sustituciones con la LU: O(n²). inf si A es singular en float."""
+    F = F or factorizar_lu(A)
+    if F is None:
+        return float("inf")
+    n = F.n
+    x = [1.0 / n] * n
+    est = 0.0
+    for k in range(max_iter):
+        y = F.resolver(x)
+        est = max(est, sum(abs(v) for v in y))
+        z = F.resolver_transpuesta([1.0 if v >= 0 else -1.0 for v in y])
+        j = max(range(n), key=lambda i: abs(z[i]))
+        if k > 0 and abs(z[j]) <= sum(a * b for a, b in zip(z, x)):
+            break
+        x = [0.0] * n; x[j] = 1.0
+    if n > 1:
+        alt = F.resolver([(-1) ** i * (1 + i / (n - 1)) for i in range(n)])
+        est = max(est, 2 * sum(abs(v) for v in alt) / (3 * n))
+    return norma_1(A) * est
+
+def elegir_precision(A: List[List[Number]]) -> tuple:
+    """(usar_flotante, κ₁ estimado o None si A no es cuadrada, LU flotante de A o None).
+    Flotante solo si κ₁ ≤ UMBRAL_COND. La LU se devuelve para que el cálculo que sigue
+    (refinamiento, inversa por LU) no vuelva a factorizar."""
+    if not A or len(A) != len(A[0]):
+        return False, None, None
+    F = factorizar_lu(A)
+    kappa = estimar_condicion(A, F)
+    return kappa <= UMBRAL_COND, kappa, F
+
+def texto_condicion(kappa: float | None, flotante: bool) -> str:
+    modo = "modo flotante (resultado fiable)" if flotante else "modo exacto (fracciones)"
+    if kappa is None:
+        return f"κ₁(A): no aplica (A no cuadrada) → {modo}"
+    if kappa == float("inf"):
+        return f"κ₁(A) = ∞ (singular en punto flotante) → {modo}"
+    return f"κ₁(A) ≈ {kappa:.3g} → {modo}"
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Freivalds.py — Verificación aleatoria de productos e inversas en O(n²) por ronda
+• C = A·B  ⇔  A·(B·r) = C·r para todo r; se prueba con unos pocos r aleatorios
+• A⁻¹ correcta  ⇔  A·(A⁻¹·r) = r
+• Exactas (Fraction/int): r con enteros en [−2¹⁵, 2¹⁵]; si C ≠ A·B, cada ronda
+  falla en detectarlo con probabilidad ≤ 1/(2¹⁶+1) (Schwartz-Zippel)
+• Flotantes: r uniforme en [−1, 1] y tolerancia relativa a la magnitud de los términos
+• Acepta listas densas o MatrizCSR (A·x en O(nnz))
+"""
+
+from __future__ import annotations
+import random
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import List, Union
+
+from MatrizDispersa import MatrizCSR, spmv
+
+Number = Union[Fraction, float]
+RONDAS = 3
+RANGO_EXACTO = 1 << 15
+
+
+@dataclass
+class VerificacionFreivalds:
+    ok: bool
+    rondas: int                    # rondas ejecutadas (se corta en la primera que falla)
+    residuo_max: float             # max |A·(B·r) − C·r| relativo (0 en exactas correctas)
+    prob_error: float              # cota de que ok=True con un resultado incorrecto (exactas)
+
+
+def _es_exacta(*Ms) -> bool:
+    for M in Ms:
+        datos = M.datos if isinstance(M, MatrizCSR) else (x for fila in M for x in fila)
+        if not all(isinstance(x, (int, Fraction)) for x in datos):
+            return False
+    return True
+
+def _matvec(M, x: List[Number]) -> List[Number]:
+    if isinstance(M, MatrizCSR):
+        return spmv(M, x)
+    return [sum(a * b for a, b in zip(fila, x)) for fila in M]
+
+def _escala(M, x: List[Number]) -> List[float]:
+    """Σ_j |m_ij|·|x_j| por fila: magnitud de los términos que se suman en M·x."""
+    ax = [abs(float(v)) for v in x]
+    if isinstance(M, MatrizCSR):
+        ind, dat, ptr = M.indices, M.datos, M.indptr
+        return [sum(abs(float(dat[p])) * ax[ind[p]] for p in range(ptr[i], ptr[i + 1]))
+                for i in range(M.forma[0])]
+    return [sum(abs(float(a)) * b for a, b in zip(fila, ax)) for fila in M]
+
+def _verificar(A, B, C, rondas: int, tol: float, rng: random.Random) -> VerificacionFreivalds:
+    """A·(B·r) = C·r; C=None significa la identidad (verificación de inversa)."""
+    exacta = _es_exacta(A, B) and (C is None or _es_exacta(C))
+    n = B.forma[1] if isinstance(B, MatrizCSR) else len(B[0])
+    peor = 0.0
+    for k in range(1, rondas + 1):
+        if exacta:
+            r = [rng.randint(-RANGO_EXACTO, RANGO_EXACTO) for _ in range(n)]
+        else:
+            r = [rng.uniform(-1.0, 1.0) for _ in range(n)]
+        Br = _matvec(B, r)
+        ABr = _matvec(A, Br)
+        Cr = r if C is None else _matvec(C, r)
+        if exacta:
+            if any(u != v for u, v in zip(ABr, Cr)):
+                return VerificacionFreivalds(False, k, float("inf"), 0.0)
+            continue
+        escala = _escala(A, Br)
+        for u, v, s in zip(ABr, Cr, escala):
+            rel = abs(float(u) - float(v)) / max(s, abs(float(v)), 1e-300)
+            peor = max(peor, rel)
+        if peor > tol:
+            return VerificacionFreivalds(False, k, peor, 0.0)
+    prob = (1.0 / (2 * RANGO_EXACTO + 1)) ** rondas if exacta else 0.0
+    return VerificacionFreivalds(True, rondas, peor, prob)
+
+def verificar_producto(A, B, C, rondas: int = RONDAS, tol: float = 1e-9,
+                       rng: random.Random | None = None) -> VerificacionFreivalds:
+    """¿C = A·B? En O(rondas·(nnz(A)+nnz(B)+nnz(C))) en lugar de O(n³)."""
+    return _verificar(A, B, C, rondas, tol, rng or random.Random())
+
+def verificar_inversa(A, Ainv, rondas: int = RONDAS, tol: float = 1e-9,
+                      rng: random.Random | None = None) -> VerificacionFreivalds:
+    """¿A·A⁻¹ = I? Prueba A·(A⁻¹·r) = r."""
+    return _verificar(A, Ainv, None, rondas, tol, rng or random.Random())
@@ -13,6 +13,13 @@ from fractions import Fraction
 from dataclasses import dataclass
 from typing import List, Union
 
+from Cholesky import factorizar_cholesky
+from FactorizacionLU import FactorLU, elegir_precision, resolver_refinado, texto_condicion
+from Iterativos import MAX_ITER_ITERATIVO, TOL_ITERATIVO, resolver_iterativo, traza_residuos
+from Estructura import EstructuraMatriz, analizar_estructura
+from Motores import elegir_motor, np
+from MatrizDispersa import MatrizCSR, densidad, lu_dispersa, sustitucion_adelante, sustitucion_regresiva
+
 Number = Union[Fraction, float]
 UI_SCALE = 1.25
 
@@ -35,22 +42,328 @@ def copiar_matriz(M: List[List[Number]]) -> List[List[Number]]:
 @dataclass
 class GaussResultado:
     triangular: List[List[Number]]
-    estado: str                    # "unica" | "infinitas" | "incompatible"
+    estado: str                    # "unica" | "infinitas" | "incompatible" | "no_converge" (iterativos)
     variables_libres: List[int]
     soluciones: List[Number]
     logs: List[str]                # <- paso a paso
+    columnas: List[int] | None = None   # variable de cada columna de `triangular` si se reordenaron
+
+# ---------- Camino disperso ----------
+def _gauss_disperso(matriz: List[List[Number]], usar_tol: bool) -> GaussResultado | None:
+    """Sistema cuadrado y disperso: LU dispersa con orden de mínimo grado.
+    None si A es singular (el llamador sigue con la eliminación densa)."""
+    n = len(matriz)
+    A = [fila[:-1] for fila in matriz]; b = [fila[-1] for fila in matriz]
+    csr = MatrizCSR.desde_densa(A)
+    F = lu_dispersa(csr, usar_tol=usar_tol)
+    if F is None:
+        return None
+    y = sustitucion_adelante(F, b)
+    sol = sustitucion_regresiva(F, y)
+
+    logs = [f"\n— Matriz dispersa: {csr.nnz} no ceros (densidad {densidad(A):.1%}).",
+            "LU dispersa con orden de mínimo grado (columnas): " +
+            ", ".join(f"C{c+1}" for c in F.col_piv[:20]) + (" …" if n > 20 else ""),
+            f"No ceros en L+U: {F.relleno} (relleno {F.relleno - csr.nnz:+d})."]
+    # [U | c] con las columnas en el orden de pivoteo: así sí es triangular superior
+    cero = csr.cero
+    lugar = {c: k for k, c in enumerate(F.col_piv)}
+    triangular = []
+    for k, fila in enumerate(F.U):
+        r = [cero] * (n + 1)
+        for j, u in fila.items(): r[lugar[j]] = u
+        r[n] = y[F.fila_piv[k]]
+        triangular.append(r)
+    logs.append("Triangular mostrada con las columnas en ese orden (columna k ↔ variable "
+                "del k-ésimo pivote), no en el orden x1, x2, …")
+    for c in reversed(F.col_piv):
+        logs.append(f"x{c+1} = {formatear_num(sol[c])}")
+    return GaussResultado(triangular=triangular, estado="unica", variables_libres=[],
+                          soluciones=sol, logs=logs, columnas=list(F.col_piv))
+
+# ---------- Camino simétrico definido positivo ----------
+def _gauss_cholesky(matriz: List[List[Number]], usar_tol: bool) -> GaussResultado | None:
+    """A simétrica: intenta LDLᵀ (exacta) / LLᵀ (flotante). Si A es definida positiva,
+    U = D·Lᵀ es justo lo que dejaría la eliminación sin pivoteo; None si no lo es."""
+    n = len(matriz)
+    F = factorizar_cholesky([fila[:-1] for fila in matriz], 1e-12 if usar_tol else 0.0)
+    if F is None:
+        return None
+    y = F.adelante([fila[-1] for fila in matriz])
+    L = F.L
+    escala = F.D if F.exacta else [L[i][i] for i in range(n)]
+    cero = L[0][0] - L[0][0]
+    U = [[cero] * i + [escala[i] * L[j][i] for j in range(i, n)] + [y[i] if F.exacta else escala[i] * y[i]]
+         for i in range(n)]
+    tipo = "LDLᵀ exacta" if F.exacta else "LLᵀ"
+    logs = [f"\n— Matriz simétrica definida positiva → factorización de Cholesky ({tipo}).",
+            "Pivotes (todos positivos): " + ", ".join(formatear_num(d) for d in F.pivotes)]
+    sol = _regresiva_banda(U, n, n, logs, lambda v: es_cero(v, 1e-12 if usar_tol else 0.0))
+    return GaussResultado(triangular=U, estado="unica", variables_libres=[], soluciones=sol, logs=logs)
+
+# ---------- Camino en banda ----------
+class FilaBanda:
+    """Fila de [A|b] guardada solo en su banda: columnas ini … ini+len(vals)−1 y b
+    aparte. Fuera de la banda se lee cero; escribir fuera la ensancha (relleno)."""
+    __slots__ = ("ini", "vals", "b", "n", "cero")
+
+    def __init__(self, ini: int, vals: List[Number], b: Number, n: int, cero: Number):
+        self.ini, self.vals, self.b, self.n, self.cero = ini, vals, b, n, cero
+
+    def __getitem__(self, j: int) -> Number:
+        if j == self.n or j == -1:
+            return self.b
+        k = j - self.ini
+        return self.vals[k] if 0 <= k < len(self.vals) else self.cero
+
+    def __setitem__(self, j: int, v: Number) -> None:
+        if j == self.n or j == -1:
+            self.b = v; return
+        k = j - self.ini
+        if k < 0:
+            self.vals[:0] = [self.cero] * -k; self.ini = j; k = 0
+        elif k >= len(self.vals):
+            self.vals.extend([self.cero] * (k + 1 - len(self.vals)))
+        self.vals[k] = v
+
+    def __len__(self) -> int:
+        return self.n + 1
+
+    def __iter__(self):
+        return iter(self.densa())
+
+    def densa(self) -> List[Number]:
+        r = [self.cero] * (self.n + 1)
+        r[self.ini:self.ini + len(self.vals)] = self.vals
+        r[self.n] = self.b
+        return r
+
+class TriangularBanda:
+    """[U | c] de los caminos en banda: memoria O(n·ancho); cada fila se expande a
+    n+1 celdas solo cuando se lee (p. ej. al mostrarla)."""
+    def __init__(self, filas: List[FilaBanda]):
+        self.filas = filas
+
+    def __len__(self) -> int:
+        return len(self.filas)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [f.densa() for f in self.filas[i]]
+        return self.filas[i].densa()
+
+    def __iter__(self):
+        return (f.densa() for f in self.filas)
+
+def _a_banda(matriz: List[List[Number]], p: int, q: int) -> List[FilaBanda]:
+    """[A|b] a filas en banda: la fila j guarda las columnas j−p … j+q."""
+    n = len(matriz)
+    cero = Fraction(0) if all(isinstance(x, Fraction) for fila in matriz for x in fila) else 0.0
+    filas = []
+    for j, fila in enumerate(matriz):
+        ini, fin = max(0, j - p), min(n - 1, j + q)
+        filas.append(FilaBanda(ini, fila[ini:fin + 1], fila[n], n, cero))
+    return filas
+
+def ancho_de_banda(matriz: List[List[Number]]) -> tuple:
+    """(p, q): anchos de banda inferior y superior de la parte A de [A|b]."""
+    n = len(matriz[0]) - 1
+    p = q = 0
+    for i, fila in enumerate(matriz):
+        for j in range(n):
+            if fila[j] != 0:
+                if i - j > p: p = i - j
+                if j - i > q: q = j - i
+    return p, q
+
+def _regresiva_banda(A: List[List[Number]], n: int, ancho: int, logs: List[str], _zero) -> List[Number]:
+    """Sustitución regresiva mirando solo las `ancho` columnas a la derecha del pivote."""
+    sol: List[Number] = [Fraction(0) if isinstance(A[0][0], Fraction) else 0.0 for _ in range(n)]
+    for i in range(n - 1, -1, -1):
+        suma = A[i][n]
+        for j in range(i + 1, min(i + ancho, n - 1) + 1):
+            if not _zero(A[i][j]): suma = suma - A[i][j] * sol[j]
+        sol[i] = suma / A[i][i]
+        logs.append(f"x{i+1} = {formatear_num(suma)} / {formatear_num(A[i][i])} = {formatear_num(sol[i])}")
+    return sol
+
+def _gauss_tridiagonal(matriz: List[List[Number]], usar_tol: bool) -> GaussResultado | None:
+    """Algoritmo de Thomas. Coincide con la eliminación con pivoteo parcial mientras
+    ninguna columna pida intercambio (|a_ii| ≥ |a_i+1,i|); si no, devuelve None.
+    Solo se guardan las tres diagonales (FilaBanda)."""
+    A = _a_banda(matriz, 1, 1); n = len(A); logs: List[str] = []
+    def _zero(v: Number) -> bool:
+        return es_cero(v, 1e-12 if usar_tol else 0.0)
+    for i in range(n):
+        logs.append(f"\n— Iteración {i+1}: columna {i+1}")
+        piv = A[i][i]
+        if i + 1 < n and abs(float(A[i+1][i])) > abs(float(piv)):
+            return None
+        if _zero(piv):
+            return None
+        logs.append(f"Pivote: {formatear_num(piv)} (F{i+1}, C{i+1})")
+        j = i + 1
+        if j == n or _zero(A[j][i]):
+            continue
+        factor = A[j][i] / piv
+        logs.append(f"F{j+1} = F{j+1} - ({formatear_num(factor)})·F{i+1}")
+        A[j][i] = A[j][i] - factor * piv
+        A[j][j] = A[j][j] - factor * A[i][j]
+        A[j][n] = A[j][n] - factor * A[i][n]
+    sol = _regresiva_banda(A, n, 1, logs, _zero)
+    return GaussResultado(triangular=TriangularBanda(A), estado="unica", variables_libres=[],
+                          soluciones=sol, logs=logs)
+
+def _gauss_banda(matriz: List[List[Number]], usar_tol: bool, p: int, q: int) -> GaussResultado | None:
+    """Eliminación con pivoteo parcial restringida a la banda: O(n·p·(p+q)).
+    Con pivoteo, la banda inferior sigue siendo p y la superior crece a lo sumo a p+q,
+    así que el resultado es el mismo que el de la eliminación completa. Cada fila se
+    guarda solo en su banda (FilaBanda): memoria O(n·(p+q)) en lugar de O(n²).
+    None si alguna columna no tiene pivote (se usa el camino general)."""
+    A = _a_banda(matriz, p, q); n = len(A); logs: List[str] = []
+    sup = p + q
+    def _zero(v: Number) -> bool:
+        return es_cero(v, 1e-12 if usar_tol else 0.0)
+    for i in range(n):
+        logs.append(f"\n— Iteración {i+1}: columna {i+1}")
+        fin = min(i + p, n - 1)
+        max_row = max(range(i, fin + 1), key=lambda r: abs(float(A[r][i])))
+        if _zero(A[max_row][i]):
+            return None
+        if max_row != i:
+            A[i], A[max_row] = A[max_row], A[i]
+            logs.append(f"Swap: F{i+1} ↔ F{max_row+1}")
+        piv = A[i][i]
+        logs.append(f"Pivote: {formatear_num(piv)} (F{i+1}, C{i+1})")
+        cols = list(range(i, min(i + sup, n - 1) + 1)) + [n]
+        for j in range(i + 1, fin + 1):
+            if _zero(A[j][i]):
+                continue
+            factor = A[j][i] / piv
+            logs.append(f"F{j+1} = F{j+1} - ({formatear_num(factor)})·F{i+1}")
+            for k in cols:
+                A[j][k] = A[j][k] - factor * A[i][k]
+    sol = _regresiva_banda(A, n, sup, logs, _zero)
+    return GaussResultado(triangular=TriangularBanda(A), estado="unica", variables_libres=[],
+                          soluciones=sol, logs=logs)
+
+# ---------- Eliminación por estructura ----------
+def _eliminacion_estructurada(A: List[List[Number]], est: EstructuraMatriz, logs: List[str], _zero) -> bool:
+    """Fase hacia adelante en O(n) / O(n²) para A triangular superior o de permutación.
+    Reproduce exactamente lo que haría el pivoteo parcial; False si no aplica."""
+    n = est.n
+    if est.triangular_superior:
+        if any(_zero(A[i][i]) for i in range(n)):
+            return False
+        logs.append(f"Estructura detectada: {', '.join(est.etiquetas)} → no hay nada que eliminar.")
+        for i in range(n):
+            logs.append(f"\n— Iteración {i+1}: columna {i+1}")
+            logs.append(f"Pivote: {formatear_num(A[i][i])} (F{i+1}, C{i+1})")
+        return True
+    if est.es_permutacion:
+        logs.append("Estructura detectada: permutación → solo intercambios de filas.")
+        donde = [0] * n                  # donde[c]: fila actual cuyo 1 está en la columna c
+        for r, c in enumerate(est.permutacion):
+            donde[c] = r
+        col_de = list(est.permutacion)   # col_de[r]: columna del 1 de la fila actual r
+        for i in range(n):
+            logs.append(f"\n— Iteración {i+1}: columna {i+1}")
+            r = donde[i]
+            if r != i:
+                A[i], A[r] = A[r], A[i]
+                col_de[i], col_de[r] = col_de[r], col_de[i]
+                donde[col_de[r]] = r; donde[i] = i
+                logs.append(f"Swap: F{i+1} ↔ F{r+1}")
+            logs.append(f"Pivote: {formatear_num(A[i][i])} (F{i+1}, C{i+1})")
+        return True
+    return False
+
+# ---------- Camino NumPy (flotante, sin pasos) ----------
+def _gauss_numpy(matriz: List[List[Number]]) -> GaussResultado | None:
+    """Eliminación con pivoteo parcial sobre [A|b] vectorizada con NumPy: n pasos, cada
+    uno una actualización O(n²) en C. Devuelve [U | c] (c = L⁻¹·P·b) como triangular,
+    igual que el camino general. None si A es singular o el residuo no cuadra:
+    entonces decide la eliminación con pasos."""
+    M = np.array(matriz, dtype=float)
+    n = M.shape[0]
+    escala = float(np.abs(M[:, :n]).max()) if n else 0.0
+    if escala == 0.0:
+        return None
+    intercambios = 0
+    for k in range(n):
+        p = k + int(np.argmax(np.abs(M[k:, k])))
+        if abs(M[p, k]) <= 1e-12 * escala:
+            return None
+        if p != k:
+            M[[k, p]] = M[[p, k]]
+            intercambios += 1
+        f = M[k + 1:, k] / M[k, k]
+        M[k + 1:, k:] -= np.outer(f, M[k, k:])
+        M[k + 1:, k] = 0.0
+    x = np.zeros(n)
+    for i in range(n - 1, -1, -1):
+        x[i] = (M[i, n] - M[i, i + 1:n] @ x[i + 1:]) / M[i, i]
+    A = np.array([fila[:-1] for fila in matriz], dtype=float)
+    b = np.array([fila[-1] for fila in matriz], dtype=float)
+    if not np.allclose(A @ x, b, rtol=1e-9, atol=1e-9):
+        return None
+    sol = [float(v) for v in x]
+    logs = [f"Eliminación con pivoteo parcial vectorizada en NumPy ({intercambios} intercambios "
+            "de filas); no se muestran los pasos intermedios."]
+    logs += [f"x{i+1} = {formatear_num(v)}" for i, v in enumerate(sol)]
+    return GaussResultado(triangular=M.tolist(), estado="unica",
+                          variables_libres=[], soluciones=sol, logs=logs)
 
 # ---------- Núcleo (con logs) ----------
-def gauss_resolver(matriz: List[List[Number]], usar_tol: bool = True) -> GaussResultado:
+def gauss_resolver(matriz: List[List[Number]], usar_tol: bool = True, motor: str | None = None,
+                   interactivo: bool = False, factor: FactorLU | None = None) -> GaussResultado:
+    """Eliminación con pasos. Con A cuadrada, Motores elige entre la eliminación general
+    (gauss), los caminos estructurales (banda, disperso, cholesky) y, si ninguno con
+    pasos cabe en el presupuesto, el refinamiento mixto (exactas) o NumPy (flotantes).
+    Si el camino elegido no aplica (pivote nulo, A no definida positiva…) se sigue con
+    la eliminación general; motor="gauss" la fija. interactivo=True (la vista) y las
+    entradas exactas se quedan siempre con un camino con pasos, que es exacto; el
+    refinamiento (triangular flotante) solo se usa con motor="refinado". `factor`
+    (LU flotante de A, p. ej. la de elegir_precision) se reutiliza si se elige el
+    refinamiento."""
+    m = len(matriz); n = len(matriz[0]) - 1
+    if m == n:
+        exacta = all(isinstance(x, (int, Fraction)) for fila in matriz for x in fila)
+        eleccion = elegir_motor("resolver", [fila[:-1] for fila in matriz], motor=motor,
+                                pasos=("gauss", "banda", "disperso", "cholesky"),
+                                interactivo=interactivo or exacta)
+        elegido = eleccion.motor
+        res = None
+        if elegido == "refinado":
+            res = gauss_refinado(matriz, usar_tol, factor)
+        elif elegido == "numpy":
+            res = _gauss_numpy(matriz)
+        elif elegido == "banda":
+            p, q = ancho_de_banda(matriz)
+            if p <= 1 and q <= 1:
+                res = _gauss_tridiagonal(matriz, usar_tol)
+            if res is None:
+                res = _gauss_banda(matriz, usar_tol, p, q)
+        elif elegido == "disperso":
+            res = _gauss_disperso(matriz, usar_tol)
+        elif elegido == "cholesky":
+            res = _gauss_cholesky(matriz, usar_tol)
+        if res is not None:
+            if elegido in ("refinado", "numpy"):
+                res.logs.insert(0, eleccion.describir())
+            return res
+    est = analizar_estructura([fila[:-1] for fila in matriz]) if m == n else None
+
     logs: List[str] = []
     A = copiar_matriz(matriz)
-    m = len(A); n = len(A[0]) - 1; filas, cols = m, n + 1
+    filas, cols = m, n + 1
 
     def _zero(v: Number) -> bool:
         return es_cero(v, 1e-12 if usar_tol else 0.0)
 
-    # Eliminación a triangular superior (pivoteo parcial)
-    for i in range(min(filas, n)):
+    # Eliminación a triangular superior (pivoteo parcial), salvo atajo por estructura
+    estructurada = est is not None and _eliminacion_estructurada(A, est, logs, _zero)
+    for i in range(0 if estructurada else min(filas, n)):
         logs.append(f"\n— Iteración {i+1}: columna {i+1}")
         max_row = max(range(i, filas), key=lambda r: abs(float(A[r][i])))
         if _zero(A[max_row][i]):
@@ -107,6 +420,58 @@ def gauss_resolver(matriz: List[List[Number]], usar_tol: bool = True) -> GaussRe
     return GaussResultado(triangular=A, estado=estado,
                           variables_libres=variables_libres, soluciones=sol, logs=logs)
 
+# ---------- Refinamiento iterativo mixto ----------
+def gauss_refinado(matriz: List[List[Number]], usar_tol: bool = True,
+                   factor: FactorLU | None = None) -> GaussResultado:
+    """Sistema cuadrado: LU flotante + refinamiento con residuo exacto (FactorizacionLU).
+    Con entradas exactas la respuesta es exacta; si A es singular o está tan mal
+    condicionada que el refinamiento no contrae, se usa gauss_resolver."""
+    m = len(matriz); n = len(matriz[0]) - 1
+    if m != n:
+        return gauss_resolver(matriz, usar_tol, motor="gauss")
+    R = resolver_refinado([fila[:-1] for fila in matriz], [fila[-1] for fila in matriz], factor=factor)
+    if R.soluciones is None:
+        res = gauss_resolver(matriz, usar_tol, motor="gauss")
+        res.logs.insert(0, "Refinamiento mixto sin convergencia (A singular o mal condicionada) "
+                           "→ eliminación de Gauss.")
+        return res
+    F = R.factor
+    x = [float(v) for v in R.soluciones]
+    U = [[0.0] * i + F.LU[i][i:] + [sum(u * xj for u, xj in zip(F.LU[i][i:], x[i:]))]
+         for i in range(n)]                                   # [U | c] con U·x = c (U de la LU usada)
+    logs = ["\n— LU flotante con pivoteo parcial (P·A = L·U, orden de filas: " +
+            ", ".join(f"F{p+1}" for p in F.perm) + ").",
+            "Refinamiento: r = b − A·x exacto, A·d = r con la LU, x ← x + d."]
+    for k, res in enumerate(R.residuos, 1):
+        logs.append(f"Iteración {k}: ‖b − A·x‖∞ = {res:.3e}")
+    logs.append("Solución EXACTA (A·x = b verificado con fracciones)." if R.exacta
+                else "Solución flotante refinada hasta precisión de máquina.")
+    for i, v in enumerate(R.soluciones):
+        logs.append(f"x{i+1} = {formatear_num(v)}")
+    return GaussResultado(triangular=U, estado="unica", variables_libres=[],
+                          soluciones=R.soluciones, logs=logs)
+
+# ---------- Métodos iterativos ----------
+METODOS_VISTA = {"Eliminación (directo)": None, "Jacobi": "jacobi", "Gauss-Seidel": "gauss-seidel",
+                 "SOR (ω = 1.25)": "sor", "Gradiente conjugado (SPD)": "cg"}
+
+def gauss_iterativo(matriz: List[List[Number]], metodo: str = "cg", tol: float = TOL_ITERATIVO,
+                    max_iter: int = MAX_ITER_ITERATIVO) -> GaussResultado:
+    """[A|b] cuadrado resuelto con Iterativos (flotante); los pasos son la traza del residuo."""
+    m = len(matriz); n = len(matriz[0]) - 1
+    if m != n:
+        raise ValueError("Los métodos iterativos requieren un sistema cuadrado (m = n).")
+    R = resolver_iterativo([fila[:-1] for fila in matriz], [fila[-1] for fila in matriz],
+                           metodo, tol=tol, max_iter=max_iter)
+    logs = [f"\n— Método iterativo: {R.metodo} (tolerancia {tol:g}, máx. {max_iter} iteraciones)."]
+    logs += traza_residuos(R)
+    if R.convergio:
+        logs.append(f"Convergió en {R.iteraciones} iteraciones.")
+    else:
+        logs.append(f"NO convergió: {R.motivo}.")
+    return GaussResultado(triangular=[], estado="unica" if R.convergio else "no_converge",
+                          variables_libres=[], soluciones=R.soluciones, logs=logs)
+
 # ---------- Vista Tk ----------
 class GaussView(ttk.Frame):
     def __init__(self, parent, on_back=None):
@@ -162,6 +527,21 @@ class GaussView(ttk.Frame):
         ttk.Label(ctrl, text="Incógnitas (n):", style="Sec.TLabel").grid(row=row, column=2, padx=(0,6), pady=4, sticky="w")
         ttk.Spinbox(ctrl, from_=1, to=10, textvariable=self.var_n, width=5).grid(row=row, column=3, padx=(0,16), pady=4)
         ttk.Checkbutton(ctrl, text="Fracciones exactas", variable=self.var_frac).grid(row=row, column=4, padx=(0,16), pady=4)
+        self.var_refinar = tk.BooleanVar(value=False)
+        ttk.Checkbutton(ctrl, text="Refinamiento mixto (float + residuo exacto)",
+                        variable=self.var_refinar).grid(row=row+1, column=4, columnspan=4, padx=(0,16), pady=4, sticky="w")
+        self.var_auto = tk.BooleanVar(value=False)
+        ttk.Checkbutton(ctrl, text="Precisión automática (según κ₁(A))",
+                        variable=self.var_auto).grid(row=row+2, column=4, columnspan=4, padx=(0,16), pady=4, sticky="w")
+        self.var_metodo = tk.StringVar(value="Eliminación (directo)")
+        self.var_tol = tk.StringVar(value=f"{TOL_ITERATIVO:g}"); self.var_iter = tk.IntVar(value=MAX_ITER_ITERATIVO)
+        ttk.Label(ctrl, text="Método:", style="Sec.TLabel").grid(row=row+1, column=0, padx=(0,6), pady=4, sticky="w")
+        ttk.Combobox(ctrl, textvariable=self.var_metodo, values=list(METODOS_VISTA), state="readonly",
+                     width=24).grid(row=row+1, column=1, columnspan=3, padx=(0,16), pady=4, sticky="w")
+        ttk.Label(ctrl, text="Tolerancia:", style="Sec.TLabel").grid(row=row+2, column=0, padx=(0,6), pady=4, sticky="w")
+        ttk.Entry(ctrl, textvariable=self.var_tol, width=8).grid(row=row+2, column=1, padx=(0,16), pady=4)
+        ttk.Label(ctrl, text="Máx. iter.:", style="Sec.TLabel").grid(row=row+2, column=2, padx=(0,6), pady=4, sticky="w")
+        ttk.Spinbox(ctrl, from_=1, to=10**6, textvariable=self.var_iter, width=8).grid(row=row+2, column=3, padx=(0,16), pady=4)
         ttk.Button(ctrl, text="Generar", style="Ghost.TButton", command=self._generar_grids).grid(row=row, column=5, padx=4, pady=4)
         ttk.Button(ctrl, text="Ejemplo", style="Ghost.TButton", command=self._cargar_ejemplo).grid(row=row, column=6, padx=4, pady=4)
         ttk.Button(ctrl, text="Limpiar", style="Ghost.TButton", command=self._limpiar_todo).grid(row=row, column=7, padx=4, pady=4)
@@ -285,7 +665,7 @@ class GaussView(ttk.Frame):
 
     def _leer_matriz(self) -> List[List[Number]]:
         m = len(self.ent_A); n = len(self.ent_A[0]) if m else 0
-        usar_frac = self.var_frac.get(); M: List[List[Number]] = []
+        usar_frac = self.var_frac.get() or self.var_refinar.get() or self.var_auto.get(); M: List[List[Number]] = []
         for i in range(m):
             fila: List[Number] = []
             for j in range(n):
@@ -302,12 +682,29 @@ class GaussView(ttk.Frame):
             M = self._leer_matriz()
         except Exception as e:
             messagebox.showerror("Entrada inválida", f"Revisa los valores: {e}"); return
-        res = gauss_resolver(M, usar_tol=not self.var_frac.get())
-        self._render_triangular(res.triangular)
+        metodo = METODOS_VISTA.get(self.var_metodo.get())
+        if metodo is not None:
+            try:
+                res = gauss_iterativo(M, metodo, tol=float(self.var_tol.get()), max_iter=int(self.var_iter.get()))
+            except (ValueError, tk.TclError) as e:
+                messagebox.showerror("Método iterativo", str(e)); return
+        elif self.var_refinar.get():
+            res = gauss_refinado(M)
+        elif self.var_auto.get():
+            # Entrada leída exacta; se pasa a float solo si κ₁(A) lo permite
+            flotante, kappa, F = elegir_precision([fila[:-1] for fila in M])
+            if flotante:
+                M = [[float(x) for x in fila] for fila in M]
+            res = gauss_resolver(M, usar_tol=flotante, interactivo=True, factor=F)
+        else:
+            res = gauss_resolver(M, usar_tol=not self.var_frac.get(), interactivo=True)
+        self._render_triangular(res.triangular, res.columnas)
 
         # Soluciones / Estado
         sol_txt = self._texto_estado(res)
-        if res.estado == "unica":
+        if metodo is None and not self.var_refinar.get() and self.var_auto.get():
+            sol_txt = texto_condicion(kappa, flotante) + "\n" + sol_txt
+        if res.estado in ("unica", "no_converge"):
             for i, v in enumerate(res.soluciones, 1): sol_txt += f"\nx{i} = {formatear_num(v)}"
         elif res.estado == "infinitas" and res.variables_libres:
             sol_txt += "\nVariables libres: " + ", ".join(f"x{j+1}" for j in res.variables_libres)
@@ -318,13 +715,13 @@ class GaussView(ttk.Frame):
         self._scroll_to_top()
 
     # ----- helpers render -----
-    def _render_triangular(self, T: List[List[Number]]):
+    def _render_triangular(self, T: List[List[Number]], columnas: List[int] | None = None):
         for c in self.tbl.get_children(): self.tbl.delete(c)
         self.tbl["columns"] = ()
         if not T: return
         cols = len(T[0]); self.tbl["columns"] = [f"c{k}" for k in range(cols)]
         for k in range(cols):
-            hdr = f"a{k+1}" if k < cols-1 else "b"
+            hdr = f"a{(columnas[k] if columnas else k)+1}" if k < cols-1 else "b"
             self.tbl.heading(f"c{k}", text=hdr); self.tbl.column(f"c{k}", width=90, anchor="center")
         for row in T: self.tbl.insert("", "end", values=[formatear_num(x) for x in row])
 
@@ -334,6 +731,7 @@ class GaussView(ttk.Frame):
     def _texto_estado(self, res: GaussResultado) -> str:
         if res.estado == "incompatible": return "Conclusión: sistema INCOMPATIBLE (sin solución)."
         if res.estado == "infinitas":     return "Conclusión: sistema con INFINITAS soluciones."
+        if res.estado == "no_converge":   return "Conclusión: el método iterativo NO convergió (ver pasos); última aproximación:"
         return "Conclusión: sistema con SOLUCIÓN ÚNICA."
 
 # ---------- API pública ----------
@@ -14,6 +14,9 @@ from dataclasses import dataclass
 from typing import List, Union, Dict, Tuple
 from fractions import Fraction
 
+from Estructura import EstructuraMatriz, analizar_estructura
+from FactorizacionLU import elegir_precision, texto_condicion
+
 Number = Union[Fraction, float]
 UI_SCALE = 1.25
 
@@ -44,7 +47,9 @@ class GJResult:
     logs: List[str]
 
 # ===================== núcleo Gauss-Jordan =====================
-def rref_with_logs(M: List[List[Number]], use_tol: bool = True) -> GJResult:
+def rref_with_logs(M: List[List[Number]], use_tol: bool = True, dos_fases: bool = False) -> GJResult:
+    """RREF de [A|b] con pasos. dos_fases=True: eliminación hacia adelante y luego
+    hacia atrás sobre la forma escalonada (misma RREF y mismas columnas pivote)."""
     A = deepcopy_matrix(M)
     m = len(A)
     n = len(A[0]) - 1
@@ -60,6 +65,14 @@ def rref_with_logs(M: List[List[Number]], use_tol: bool = True) -> GJResult:
     for r in A:
         logs.append("  [ " + "  ".join(fmt(x) for x in r[:-1]) + " | " + fmt(r[-1]) + " ]")
 
+    if m == n:
+        res = _rref_estructurada(A, analizar_estructura([r[:-1] for r in A]), logs, z)
+        if res is not None:
+            return res
+
+    if dos_fases:
+        return _rref_dos_fases(A, logs, z)
+
     for col in range(n):
         if row >= m:
             break
@@ -99,6 +112,79 @@ def rref_with_logs(M: List[List[Number]], use_tol: bool = True) -> GJResult:
         col_to_row[col] = row
         row += 1
 
+    return _cerrar_rref(A, pivot_cols, col_to_row, logs)
+
+def _rref_dos_fases(A: List[List[Number]], logs: List[str], z) -> GJResult:
+    """Fase 1: forma escalonada con pivotes 1 (mismos pivotes que el método clásico).
+    Fase 2: de la última columna pivote a la primera, anular por encima.
+    Actualizaciones en sitio y solo desde la columna pivote hacia la derecha; en la
+    fase 2 además se saltan las columnas pivote posteriores (ya son cero en la fila)."""
+    m = len(A)
+    n = len(A[0]) - 1
+    row = 0
+    pivot_cols: List[int] = []
+    col_to_row: Dict[int, int] = {}
+
+    logs.append("Fase 1: eliminación hacia adelante")
+    for col in range(n):
+        if row >= m:
+            break
+        sel = None
+        for r in range(row, m):
+            if not z(A[r][col]):
+                sel = r
+                break
+        if sel is None:
+            continue
+        if sel != row:
+            A[row], A[sel] = A[sel], A[row]
+            logs.append(f"Swap: F{row+1} ↔ F{sel+1}")
+
+        fila_p = A[row]
+        piv = fila_p[col]
+        if not (isinstance(piv, Fraction) and piv == 1) and not (not isinstance(piv, Fraction) and abs(float(piv)-1.0) < 1e-15):
+            factor = (Fraction(1, 1) / piv) if isinstance(piv, Fraction) else 1.0/float(piv)
+            for k in range(col, n + 1):
+                fila_p[k] = fila_p[k] * factor
+            logs.append(f"F{row+1} = ({fmt(factor)}) · F{row+1}")
+
+        for r in range(row + 1, m):
+            fila = A[r]
+            fac = fila[col]
+            if z(fac):
+                continue
+            for k in range(col, n + 1):
+                fila[k] = fila[k] - fac * fila_p[k]
+            logs.append(f"F{r+1} = F{r+1} - ({fmt(fac)}) · F{row+1}")
+
+        pivot_cols.append(col)
+        col_to_row[col] = row
+        row += 1
+
+    logs.append("Fase 2: eliminación hacia atrás")
+    es_pivote = [False] * (n + 1)
+    for c in pivot_cols:
+        es_pivote[c] = True
+    for col in reversed(pivot_cols):
+        prow = col_to_row[col]
+        fila_p = A[prow]
+        vivas = [col] + [k for k in range(col + 1, n + 1) if not es_pivote[k]]
+        for r in range(prow):
+            fila = A[r]
+            fac = fila[col]
+            if z(fac):
+                continue
+            for k in vivas:
+                fila[k] = fila[k] - fac * fila_p[k]
+            logs.append(f"F{r+1} = F{r+1} - ({fmt(fac)}) · F{prow+1}")
+
+    return _cerrar_rref(A, pivot_cols, col_to_row, logs)
+
+def _cerrar_rref(A: List[List[Number]], pivot_cols: List[int], col_to_row: Dict[int, int],
+                 logs: List[str]) -> GJResult:
+    """Registra la RREF y clasifica el sistema (única / infinitas / inconsistente)."""
+    m = len(A)
+    n = len(A[0]) - 1
     logs.append("Matriz en RREF:")
     for r in A:
         logs.append("  [ " + "  ".join(fmt(x) for x in r[:-1]) + " | " + fmt(r[-1]) + " ]")
@@ -144,6 +230,46 @@ def rref_with_logs(M: List[List[Number]], use_tol: bool = True) -> GJResult:
         sol[c] = A[r][-1]
     return GJResult(A, pivot_cols, col_to_row, "unica", sol, logs)
 
+def _rref_estructurada(A: List[List[Number]], est: EstructuraMatriz, logs: List[str], z) -> GJResult | None:
+    """Atajos por estructura (A cuadrada):
+    • permutación → solo intercambios, los mismos que haría la eliminación
+    • triangular (sup. o inf.) no singular → sustitución en O(n²); la RREF es [I | x]
+    None si no aplica."""
+    n = est.n
+    if est.es_permutacion:
+        logs.append("Estructura detectada: permutación → solo intercambios de filas.")
+        donde = [0] * n
+        for r, c in enumerate(est.permutacion):
+            donde[c] = r
+        col_de = list(est.permutacion)
+        for i in range(n):
+            r = donde[i]
+            if r != i:
+                A[i], A[r] = A[r], A[i]
+                col_de[i], col_de[r] = col_de[r], col_de[i]
+                donde[col_de[r]] = r; donde[i] = i
+                logs.append(f"Swap: F{i+1} ↔ F{r+1}")
+        return _cerrar_rref(A, list(range(n)), {c: c for c in range(n)}, logs)
+
+    if est.triangular and not any(z(A[i][i]) for i in range(n)):
+        superior = est.triangular_superior
+        logs.append(f"Estructura detectada: {', '.join(est.etiquetas)} → sustitución "
+                    f"{'regresiva' if superior else 'hacia adelante'} (O(n²)).")
+        exacta = all(isinstance(x, Fraction) for fila in A for x in fila)
+        uno: Number = Fraction(1) if exacta else 1.0
+        cero: Number = uno - uno
+        x: List[Number] = [cero] * n
+        for i in (range(n - 1, -1, -1) if superior else range(n)):
+            js = range(i + 1, n) if superior else range(i)
+            s = A[i][-1]
+            for j in js:
+                if not z(A[i][j]): s = s - A[i][j] * x[j]
+            x[i] = s / A[i][i]
+            logs.append(f"x{i+1} = {fmt(s)} / {fmt(A[i][i])} = {fmt(x[i])}")
+        R = [[uno if j == i else cero for j in range(n)] + [x[i]] for i in range(n)]
+        return _cerrar_rref(R, list(range(n)), {c: c for c in range(n)}, logs)
+    return None
+
 # ===================== UI =====================
 class GaussJordanView(ttk.Frame):
     def __init__(self, parent, on_back=None):
@@ -196,6 +322,7 @@ class GaussJordanView(ttk.Frame):
         self.var_m = tk.IntVar(value=3)
         self.var_n = tk.IntVar(value=3)
         self.var_frac = tk.BooleanVar(value=True)
+        self.var_auto = tk.BooleanVar(value=False)
 
         row = 0
         ttk.Label(ctrl, text="Ecuaciones (m):", style="Sec.TLabel").grid(row=row, column=0, padx=(0,6), pady=4, sticky="w")
@@ -203,6 +330,8 @@ class GaussJordanView(ttk.Frame):
         ttk.Label(ctrl, text="Incógnitas (n):", style="Sec.TLabel").grid(row=row, column=2, padx=(0,6), pady=4, sticky="w")
         ttk.Spinbox(ctrl, from_=1, to=10, textvariable=self.var_n, width=5).grid(row=row, column=3, padx=(0,16), pady=4)
         ttk.Checkbutton(ctrl, text="Fracciones exactas", variable=self.var_frac).grid(row=row, column=4, padx=(0,16), pady=4)
+        ttk.Checkbutton(ctrl, text="Precisión automática (según κ₁(A))",
+                        variable=self.var_auto).grid(row=row+1, column=4, columnspan=4, padx=(0,16), pady=4, sticky="w")
         ttk.Button(ctrl, text="Generar", style="Ghost.TButton", command=self._generar).grid(row=row, column=5, padx=4, pady=4)
         ttk.Button(ctrl, text="Ejemplo", style="Ghost.TButton", command=self._ejemplo).grid(row=row, column=6, padx=4, pady=4)
         ttk.Button(ctrl, text="Limpiar",  style="Ghost.TButton", command=self._limpiar).grid(row=row, column=7, padx=4, pady=4)
@@ -315,7 +444,7 @@ class GaussJordanView(ttk.Frame):
 
     def _leer(self) -> List[List[Number]]:
         m = len(self.ent_A); n = len(self.ent_A[0]) if m else 0
-        use_frac = self.var_frac.get()
+        use_frac = self.var_frac.get() or self.var_auto.get()
         M: List[List[Number]] = []
         for i in range(m):
             row: List[Number] = []
@@ -333,7 +462,16 @@ class GaussJordanView(ttk.Frame):
         except Exception as e:
             messagebox.showerror("Entrada inválida", f"Revisa los valores: {e}")
             return
-        res = rref_with_logs(M, use_tol=not self.var_frac.get())
+        cond_txt = ""
+        if self.var_auto.get():
+            # Entrada leída exacta; se pasa a float solo si κ₁(A) lo permite
+            flotante, kappa, _ = elegir_precision([fila[:-1] for fila in M])
+            if flotante:
+                M = [[float(x) for x in fila] for fila in M]
+            res = rref_with_logs(M, use_tol=flotante)
+            cond_txt = texto_condicion(kappa, flotante) + "\n"
+        else:
+            res = rref_with_logs(M, use_tol=not self.var_frac.get())
         self._render_rref(res.rref)
 
         # soluciones / estado
@@ -356,7 +494,7 @@ class GaussJordanView(ttk.Frame):
                 else:
                     sol_txt += f"\n x{c+1} = 0"
 
-        self._set_text(self.txt_sol, sol_txt)
+        self._set_text(self.txt_sol, cond_txt + sol_txt)
         self._set_text(self.txt_log, "\n".join(res.logs))
         self._scroll_top()
 
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Iterativos.py — Métodos iterativos para sistemas grandes y dispersos (flotante)
+• Jacobi, Gauss-Seidel / SOR (ω) y Gradiente Conjugado con precondicionador de Jacobi
+• Trabajan sobre MatrizCSR: cada iteración cuesta O(nnz), no O(n²)
+• Tolerancia relativa ‖b − A·x‖₂ / ‖b‖₂ y tope de iteraciones configurables
+• El residuo de cada iteración queda en `residuos`; traza_residuos() lo convierte
+  en líneas para el panel de pasos
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from math import sqrt
+from operator import mul
+from typing import List
+
+from MatrizDispersa import MatrizCSR
+
+TOL_ITERATIVO = 1e-10
+MAX_ITER_ITERATIVO = 1000
+MAX_LINEAS_TRAZA = 200
+METODOS = ("jacobi", "gauss-seidel", "sor", "cg")
+
+
+@dataclass
+class IterativoResultado:
+    metodo: str
+    soluciones: List[float]
+    convergio: bool
+    iteraciones: int
+    residuos: List[float] = field(default_factory=list)   # ‖b − A·x‖₂ / ‖b‖₂ tras cada iteración
+    motivo: str = ""
+
+
+# --------------------- utilidades ---------------------
+def _a_csr(A) -> MatrizCSR:
+    if isinstance(A, MatrizCSR):
+        return A
+    return MatrizCSR.desde_densa([[float(x) for x in fila] for fila in A])
+
+def _diagonal(A: MatrizCSR) -> List[float]:
+    ind, dat, ptr = A.indices, A.datos, A.indptr
+    d = [0.0] * A.forma[0]
+    for i in range(A.forma[0]):
+        for p in range(ptr[i], ptr[i + 1]):
+            if ind[p] == i:
+                d[i] = float(dat[p])
+    return d
+
+def _spmv(A: MatrizCSR, x: List[float]) -> List[float]:
+    ind, dat, ptr = A.indices, A.datos, A.indptr
+    get = x.__getitem__
+    return [sum(map(mul, dat[ptr[i]:ptr[i + 1]], map(get, ind[ptr[i]:ptr[i + 1]])))
+            for i in range(A.forma[0])]
+
+def _norma(v: List[float]) -> float:
+    return sqrt(sum(x * x for x in v))
+
+def _preparar(A, b, x0):
+    A = _a_csr(A)
+    n = A.forma[0]
+    if A.forma[1] != n or len(b) != n:
+        raise ValueError("Los métodos iterativos requieren A cuadrada y largo(b) = n.")
+    b = [float(v) for v in b]
+    x = [float(v) for v in x0] if x0 is not None else [0.0] * n
+    nb = _norma(b) or 1.0
+    return A, b, x, nb
+
+def _diagonal_no_nula(A: MatrizCSR, metodo: str) -> List[float]:
+    d = _diagonal(A)
+    if any(v == 0.0 for v in d):
+        raise ValueError(f"{metodo}: la diagonal tiene ceros (se requiere a_ii ≠ 0).")
+    return d
+
+
+# --------------------- métodos ---------------------
+def jacobi(A, b, tol: float = TOL_ITERATIVO, max_iter: int = MAX_ITER_ITERATIVO,
+           x0=None) -> IterativoResultado:
+    """x ← x + D⁻¹·(b − A·x). Converge si A es diagonalmente dominante."""
+    A, b, x, nb = _preparar(A, b, x0)
+    d = _diagonal_no_nula(A, "Jacobi")
+    residuos: List[float] = []
+    r = [bi - ai for bi, ai in zip(b, _spmv(A, x))]
+    for k in range(1, max_iter + 1):
+        x = [xi + ri / di for xi, ri, di in zip(x, r, d)]
+        r = [bi - ai for bi, ai in zip(b, _spmv(A, x))]
+        residuos.append(_norma(r) / nb)
+        if residuos[-1] <= tol:
+            return IterativoResultado("jacobi", x, True, k, residuos)
+    return IterativoResultado("jacobi", x, False, max_iter, residuos, "tope de iteraciones")
+
+def gauss_seidel(A, b, omega: float = 1.0, tol: float = TOL_ITERATIVO,
+                 max_iter: int = MAX_ITER_ITERATIVO, x0=None) -> IterativoResultado:
+    """Barrido en sitio fila por fila; omega ≠ 1 da SOR (sobre-relajación)."""
+    if not 0.0 < omega < 2.0:
+        raise ValueError("SOR: ω debe estar en (0, 2).")
+    A, b, x, nb = _preparar(A, b, x0)
+    d = _diagonal_no_nula(A, "Gauss-Seidel")
+    ind, dat, ptr = A.indices, A.datos, A.indptr
+    metodo = "gauss-seidel" if omega == 1.0 else "sor"
+    get = x.__getitem__
+    residuos: List[float] = []
+    for k in range(1, max_iter + 1):
+        for i in range(A.forma[0]):
+            a, z = ptr[i], ptr[i + 1]
+            s = b[i] - sum(map(mul, dat[a:z], map(get, ind[a:z]))) + d[i] * x[i]
+            x[i] += omega * (s / d[i] - x[i])
+        r = [bi - ai for bi, ai in zip(b, _spmv(A, x))]
+        residuos.append(_norma(r) / nb)
+        if residuos[-1] <= tol:
+            return IterativoResultado(metodo, x, True, k, residuos)
+    return IterativoResultado(metodo, x, False, max_iter, residuos, "tope de iteraciones")
+
+def gradiente_conjugado(A, b, tol: float = TOL_ITERATIVO, max_iter: int = MAX_ITER_ITERATIVO,
+                        x0=None, precondicionar: bool = True) -> IterativoResultado:
+    """CG para A simétrica definida positiva, con M = diag(A) como precondicionador.
+    Si aparece una dirección con pᵀ·A·p ≤ 0, A no es SPD y se detiene."""
+    A, b, x, nb = _preparar(A, b, x0)
+    minv = [1.0 / v for v in _diagonal_no_nula(A, "CG")] if precondicionar else None
+    r = [bi - ai for bi, ai in zip(b, _spmv(A, x))]
+    z = [ri * mi for ri, mi in zip(r, minv)] if minv else r[:]
+    p = z[:]
+    rz = sum(map(mul, r, z))
+    residuos: List[float] = []
+    for k in range(1, max_iter + 1):
+        Ap = _spmv(A, p)
+        pAp = sum(map(mul, p, Ap))
+        if pAp <= 0.0:
+            return IterativoResultado("cg", x, False, k - 1, residuos,
+                                      "pᵀ·A·p ≤ 0: la matriz no es simétrica definida positiva")
+        alfa = rz / pAp
+        x = [xi + alfa * pi for xi, pi in zip(x, p)]
+        r = [ri - alfa * qi for ri, qi in zip(r, Ap)]
+        residuos.append(_norma(r) / nb)
+        if residuos[-1] <= tol:
+            return IterativoResultado("cg", x, True, k, residuos)
+        z = [ri * mi for ri, mi in zip(r, minv)] if minv else r[:]
+        rz_nuevo = sum(map(mul, r, z))
+        beta = rz_nuevo / rz
+        rz = rz_nuevo
+        p = [zi + beta * pi for zi, pi in zip(z, p)]
+    return IterativoResultado("cg", x, False, max_iter, residuos, "tope de iteraciones")
+
+
+# --------------------- API ---------------------
+def resolver_iterativo(A, b, metodo: str = "cg", tol: float = TOL_ITERATIVO,
+                       max_iter: int = MAX_ITER_ITERATIVO, omega: float = 1.25,
+                       x0=None) -> IterativoResultado:
+    """A densa o MatrizCSR. metodo ∈ {'jacobi', 'gauss-seidel', 'sor', 'cg'}."""
+    if metodo == "jacobi":
+        return jacobi(A, b, tol, max_iter, x0)
+    if metodo == "gauss-seidel":
+        return gauss_seidel(A, b, 1.0, tol, max_iter, x0)
+    if metodo == "sor":
+        return gauss_seidel(A, b, omega, tol, max_iter, x0)
+    if metodo == "cg":
+        return gradiente_conjugado(A, b, tol, max_iter, x0)
+    raise ValueError(f"Método iterativo desconocido: {metodo!r} (opciones: {', '.join(METODOS)}).")
+
+def traza_residuos(res: IterativoResultado, max_lineas: int = MAX_LINEAS_TRAZA) -> List[str]:
+    """Una línea por iteración (submuestreada si hay más de max_lineas)."""
+    k = len(res.residuos)
+    paso = max(1, -(-k // max_lineas))
+    lineas = [f"Iteración {i+1}: ‖r‖/‖b‖ = {res.residuos[i]:.3e}"
+              for i in range(0, k, paso)]
+    if k and (k - 1) % paso:
+        lineas.append(f"Iteración {k}: ‖r‖/‖b‖ = {res.residuos[-1]:.3e}")
+    return lineas
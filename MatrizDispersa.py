@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MatrizDispersa.py — Matrices dispersas CSR/CSC (sin dependencias)
+• MatrizCSR: suma, producto matriz-vector (SpMV) y matriz-matriz (SpGEMM)
+• LU dispersa con orden de mínimo grado (reduce el relleno) + sustituciones
+• UMBRAL_DENSIDAD / UMBRAL_TAM_DISPERSO: criterio del despacho denso/disperso (Motores)
+"""
+
+from __future__ import annotations
+import heapq
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Dict, List, Tuple, Union
+
+Number = Union[Fraction, float]
+
+UMBRAL_DENSIDAD = 0.10      # a lo sumo 10 % de no ceros → se trata como dispersa
+UMBRAL_TAM_DISPERSO = 64    # por debajo de este tamaño el denso siempre gana
+
+# --------------------------- utilidades ---------------------------
+
+def _cero_de(x: Number) -> Number:
+    return Fraction(0) if isinstance(x, Fraction) else 0.0
+
+def es_cero(x: Number, tol: float = 1e-12) -> bool:
+    if isinstance(x, Fraction): return x == 0
+    return abs(float(x)) < tol
+
+def densidad(M: List[List[Number]]) -> float:
+    """Fracción de elementos no nulos de una matriz densa."""
+    total = len(M) * len(M[0])
+    return sum(1 for fila in M for x in fila if x != 0) / total if total else 0.0
+
+# --------------------------- CSR ---------------------------
+
+class MatrizCSR:
+    """Compressed Sparse Row: la fila i ocupa indices/datos[indptr[i]:indptr[i+1]],
+    con columnas en orden creciente."""
+
+    def __init__(self, forma: Tuple[int, int], indptr: List[int], indices: List[int],
+                 datos: List[Number], cero: Number = 0.0):
+        self.forma = forma
+        self.indptr, self.indices, self.datos = indptr, indices, datos
+        self.cero = cero
+
+    @classmethod
+    def desde_densa(cls, M: List[List[Number]]) -> "MatrizCSR":
+        indptr, indices, datos = [0], [], []
+        for fila in M:
+            for j, x in enumerate(fila):
+                if x != 0:
+                    indices.append(j); datos.append(x)
+            indptr.append(len(indices))
+        return cls((len(M), len(M[0])), indptr, indices, datos, _cero_de(M[0][0]))
+
+    @classmethod
+    def desde_filas(cls, forma: Tuple[int, int], filas: List[Dict[int, Number]], cero: Number) -> "MatrizCSR":
+        indptr, indices, datos = [0], [], []
+        for fila in filas:
+            for j in sorted(fila):
+                x = fila[j]
+                if x != 0:
+                    indices.append(j); datos.append(x)
+            indptr.append(len(indices))
+        return cls(forma, indptr, indices, datos, cero)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.datos)
+
+    def densidad(self) -> float:
+        m, n = self.forma
+        return self.nnz / (m * n) if m * n else 0.0
+
+    def fila(self, i: int) -> Tuple[List[int], List[Number]]:
+        a, b = self.indptr[i], self.indptr[i + 1]
+        return self.indices[a:b], self.datos[a:b]
+
+    def filas_dict(self) -> List[Dict[int, Number]]:
+        return [dict(zip(*self.fila(i))) for i in range(self.forma[0])]
+
+    def a_densa(self) -> List[List[Number]]:
+        m, n = self.forma
+        M = [[self.cero] * n for _ in range(m)]
+        for i in range(m):
+            for p in range(self.indptr[i], self.indptr[i + 1]):
+                M[i][self.indices[p]] = self.datos[p]
+        return M
+
+    def transpuesta(self) -> "MatrizCSR":
+        """Aᵀ en CSR (equivale a A en CSC). Conteo por columnas, O(nnz)."""
+        m, n = self.forma
+        cuenta = [0] * (n + 1)
+        for j in self.indices:
+            cuenta[j + 1] += 1
+        for j in range(n):
+            cuenta[j + 1] += cuenta[j]
+        indptr = cuenta[:]
+        pos = cuenta[:-1]
+        indices = [0] * self.nnz; datos: List[Number] = [self.cero] * self.nnz
+        for i in range(m):
+            for p in range(self.indptr[i], self.indptr[i + 1]):
+                j = self.indices[p]; q = pos[j]
+                indices[q] = i; datos[q] = self.datos[p]; pos[j] += 1
+        return MatrizCSR((n, m), indptr, indices, datos, self.cero)
+
+    def __add__(self, otra: "MatrizCSR") -> "MatrizCSR":
+        return suma_csr(self, otra)
+
+    def __matmul__(self, otra):
+        if isinstance(otra, MatrizCSR):
+            return spgemm(self, otra)
+        return spmv(self, otra)
+
+    def __repr__(self) -> str:
+        return f"MatrizCSR({self.forma[0]}×{self.forma[1]}, nnz={self.nnz})"
+
+def suma_csr(A: MatrizCSR, B: MatrizCSR) -> MatrizCSR:
+    """A + B fila a fila mezclando las columnas ordenadas."""
+    if A.forma != B.forma:
+        raise ValueError("Para sumar, A y B deben tener la misma dimensión.")
+    indptr, indices, datos = [0], [], []
+    for i in range(A.forma[0]):
+        p, pf = A.indptr[i], A.indptr[i + 1]
+        q, qf = B.indptr[i], B.indptr[i + 1]
+        while p < pf or q < qf:
+            ja = A.indices[p] if p < pf else None
+            jb = B.indices[q] if q < qf else None
+            if jb is None or (ja is not None and ja < jb):
+                j, x = ja, A.datos[p]; p += 1
+            elif ja is None or jb < ja:
+                j, x = jb, B.datos[q]; q += 1
+            else:
+                j, x = ja, A.datos[p] + B.datos[q]; p += 1; q += 1
+            if x != 0:
+                indices.append(j); datos.append(x)
+        indptr.append(len(indices))
+    return MatrizCSR(A.forma, indptr, indices, datos, A.cero)
+
+def spmv(A: MatrizCSR, v: List[Number]) -> List[Number]:
+    """A·v (v denso) en O(nnz)."""
+    if A.forma[1] != len(v):
+        raise ValueError("Para A·v, largo(v) = n (columnas de A).")
+    ind, dat, ptr = A.indices, A.datos, A.indptr
+    out = []
+    for i in range(A.forma[0]):
+        s = A.cero
+        for p in range(ptr[i], ptr[i + 1]):
+            s = s + dat[p] * v[ind[p]]
+        out.append(s)
+    return out
+
+def spgemm(A: MatrizCSR, B: MatrizCSR) -> MatrizCSR:
+    """A×B (Gustavson): cada fila de C acumula a_it·B[t,:] en un diccionario."""
+    if A.forma[1] != B.forma[0]:
+        raise ValueError("Para A×B, columnas de A = filas de B.")
+    indptr, indices, datos = [0], [], []
+    for i in range(A.forma[0]):
+        acc: Dict[int, Number] = {}
+        for p in range(A.indptr[i], A.indptr[i + 1]):
+            a = A.datos[p]; t = A.indices[p]
+            for q in range(B.indptr[t], B.indptr[t + 1]):
+                j = B.indices[q]
+                acc[j] = acc.get(j, A.cero) + a * B.datos[q]
+        for j in sorted(acc):
+            if acc[j] != 0:
+                indices.append(j); datos.append(acc[j])
+        indptr.append(len(indices))
+    return MatrizCSR((A.forma[0], B.forma[1]), indptr, indices, datos, A.cero)
+
+# --------------------------- LU dispersa ---------------------------
+
+def orden_minimo_grado(A: MatrizCSR) -> List[int]:
+    """Orden de eliminación de mínimo grado sobre el patrón de A + Aᵀ.
+    Al eliminar un nodo sus vecinos forman un clique (el relleno que produciría)."""
+    n = A.forma[0]
+    vecinos: List[set] = [set() for _ in range(n)]
+    for i in range(n):
+        for p in range(A.indptr[i], A.indptr[i + 1]):
+            j = A.indices[p]
+            if i != j:
+                vecinos[i].add(j); vecinos[j].add(i)
+    heap = [(len(vecinos[i]), i) for i in range(n)]
+    heapq.heapify(heap)
+    eliminado = [False] * n
+    orden: List[int] = []
+    while heap:
+        g, v = heapq.heappop(heap)
+        if eliminado[v] or g != len(vecinos[v]):
+            continue                      # entrada obsoleta
+        eliminado[v] = True
+        orden.append(v)
+        vs = vecinos[v]
+        for u in vs:
+            vecinos[u].discard(v)
+            vecinos[u] |= vs - {u}
+            heapq.heappush(heap, (len(vecinos[u]), u))
+        vecinos[v] = set()
+    return orden
+
+@dataclass
+class LUDispersa:
+    forma: Tuple[int, int]
+    fila_piv: List[int]                      # fila original que pivotea en el paso k
+    col_piv: List[int]                       # columna original eliminada en el paso k
+    L: List[List[Tuple[int, Number]]]        # paso k → [(fila, multiplicador)]
+    U: List[Dict[int, Number]]               # paso k → fila pivote restante {col: valor}
+    cero: Number
+
+    @property
+    def relleno(self) -> int:
+        return sum(len(l) for l in self.L) + sum(len(u) for u in self.U)
+
+def lu_dispersa(A: MatrizCSR, orden: List[int] | None = None, usar_tol: bool = True) -> LUDispersa | None:
+    """Eliminación por columnas en el orden dado (mínimo grado por defecto).
+    Pivote: entre las filas candidatas de la columna, las que superan 0.1·máx |a|
+    (exacto: cualquiera no nula) y de ellas la de menos no ceros (Markowitz).
+    Devuelve None si A es singular."""
+    n = A.forma[0]
+    if n != A.forma[1]:
+        raise ValueError("La LU dispersa requiere una matriz cuadrada.")
+    tol = 1e-12 if usar_tol else 0.0
+    orden = orden if orden is not None else orden_minimo_grado(A)
+    filas = A.filas_dict()
+    en_col: List[set] = [set() for _ in range(n)]
+    for i, f in enumerate(filas):
+        for j in f:
+            en_col[j].add(i)
+
+    fila_piv, L, U = [], [], []
+    for c in orden:
+        cand = [r for r in en_col[c] if not es_cero(filas[r][c], tol)]
+        if not cand:
+            return None
+        amax = max(abs(filas[r][c]) for r in cand)
+        aceptables = [r for r in cand if abs(filas[r][c]) >= 0.1 * amax] if usar_tol else cand
+        p = min(aceptables, key=lambda r: (len(filas[r]), r))
+        fp = filas[p]; piv = fp[c]
+        for j in fp:
+            en_col[j].discard(p)
+        multiplicadores = []
+        for r in list(en_col[c]):
+            fr = filas[r]
+            l = fr.pop(c) / piv
+            en_col[c].discard(r)
+            if es_cero(l, 0.0):
+                continue
+            for j, x in fp.items():
+                if j == c:
+                    continue
+                if j in fr:
+                    fr[j] = fr[j] - l * x
+                else:
+                    fr[j] = -l * x
+                    en_col[j].add(r)
+            multiplicadores.append((r, l))
+        fila_piv.append(p); L.append(multiplicadores); U.append(fp)
+        filas[p] = {}
+    return LUDispersa(A.forma, fila_piv, list(orden), L, U, A.cero)
+
+def sustitucion_adelante(F: LUDispersa, b: List[Number]) -> List[Number]:
+    """Aplica L a b (mismas operaciones de fila que la eliminación); indexado por fila original."""
+    y = list(b)
+    for p, mult in zip(F.fila_piv, F.L):
+        yp = y[p]
+        for r, l in mult:
+            y[r] = y[r] - l * yp
+    return y
+
+def sustitucion_regresiva(F: LUDispersa, y: List[Number]) -> List[Number]:
+    x: List[Number] = [F.cero] * F.forma[1]
+    for k in range(len(F.U) - 1, -1, -1):
+        c, fila = F.col_piv[k], F.U[k]
+        s = y[F.fila_piv[k]]
+        for j, u in fila.items():
+            if j != c:
+                s = s - u * x[j]
+        x[c] = s / fila[c]
+    return x
+
+def resolver_lu_dispersa(F: LUDispersa, b: List[Number]) -> List[Number]:
+    """x tal que A·x = b usando la factorización: L (hacia adelante) y U (regresiva)."""
+    return sustitucion_regresiva(F, sustitucion_adelante(F, b))
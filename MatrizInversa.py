@@ -13,6 +13,13 @@ from tkinter import ttk, messagebox
 from fractions import Fraction
 from typing import List, Union, Tuple
 
+from AritmeticaModular import prueba_singularidad
+from Cholesky import factorizar_cholesky
+from Freivalds import verificar_inversa
+from Estructura import EstructuraMatriz, analizar_estructura
+from FactorizacionLU import FactorLU, elegir_precision, factorizar_lu, texto_condicion
+from Motores import elegir_motor, np
+
 # --------------------- tipos / config ---------------------
 Number = Union[Fraction, float]
 UI_SCALE = 1.25
@@ -33,12 +40,72 @@ def to_str(x: Number, dec: int = 6) -> str:
 def deepcopy(M: List[List[Number]]) -> List[List[Number]]:
     return [row[:] for row in M]
 
+# --------------------- atajos por estructura ---------------------
+def _inversa_estructurada(A: List[List[Number]], est: EstructuraMatriz, z, tol: float = 1e-12
+                          ) -> Tuple[List[List[Number]], str] | None:
+    """A⁻¹ sin eliminación cuando la estructura lo permite:
+    • diagonal → recíprocos de la diagonal, O(n)
+    • permutación → A⁻¹ = Aᵀ, O(n²)
+    • triangular → sustitución columna por columna (la inversa es triangular del mismo tipo)
+    • simétrica definida positiva → Cholesky, A⁻¹ = L⁻ᵀ·D⁻¹·L⁻¹
+    Devuelve (A⁻¹, descripción) o None si no aplica (incluye diagonal con ceros)."""
+    n = est.n
+    exacta = all(isinstance(x, Fraction) for fila in A for x in fila)
+    uno: Number = Fraction(1) if exacta else 1.0
+    cero: Number = uno - uno
+    if est.es_permutacion:
+        return [[A[j][i] for j in range(n)] for i in range(n)], "permutación → A⁻¹ = Aᵀ"
+    if est.simetrica and not est.triangular:
+        F = factorizar_cholesky(A, tol)
+        if F is None:
+            return None
+        tipo = "LDLᵀ exacta" if F.exacta else "LLᵀ"
+        return F.inversa(), f"simétrica definida positiva → Cholesky ({tipo}), A⁻¹ = L⁻ᵀ·D⁻¹·L⁻¹"
+    if not est.triangular or any(z(A[i][i]) for i in range(n)):
+        return None
+    if est.diagonal:
+        return ([[uno / A[i][i] if i == j else cero for j in range(n)] for i in range(n)],
+                "diagonal → A⁻¹ = diag(1/aᵢᵢ)")
+    superior = est.triangular_superior
+    inv = [[cero] * n for _ in range(n)]
+    for j in range(n):
+        # columna j de A⁻¹: T·x = e_j; solo las filas del lado no nulo de la diagonal
+        filas = range(j, -1, -1) if superior else range(j, n)
+        for i in filas:
+            s = uno if i == j else cero
+            for t in (range(i + 1, j + 1) if superior else range(j, i)):
+                if not z(A[i][t]): s = s - A[i][t] * inv[t][j]
+            inv[i][j] = s / A[i][i]
+    tipo = "triangular superior" if superior else "triangular inferior"
+    return inv, f"{tipo} → sustitución por columnas (A⁻¹ también es {tipo})"
+
 # --------------------- núcleo inversa con logs ---------------------
-def inverse_with_logs(A_in: List[List[Number]], use_tol_for_float: bool = True
+def _log_aumentada(logs: List[str], aug: List[List[Number]], n: int) -> None:
+    for r in aug:
+        logs.append("  [ " + "  ".join(to_str(x) for x in r[:n]) + " | " +
+                    "  ".join(to_str(x) for x in r[n:]) + " ]")
+
+def inverse_with_logs(A_in: List[List[Number]], use_tol_for_float: bool = True, trazar: bool = True,
+                      prueba_modular: bool = True, motor: str | None = None, interactivo: bool = False,
+                      factor: FactorLU | None = None
                       ) -> Tuple[List[List[Number]] | None, List[str], List[List[Number]]]:
     """
     Devuelve (A_inv, logs, augmented_final). Si no es invertible, A_inv=None.
     Mantiene exactitud si todos los elementos son Fraction.
+    Cada operación de fila solo toca las columnas vivas: a la izquierda las de la
+    columna pivote en adelante (las anteriores ya son identidad) y a la derecha el
+    soporte no nulo de la fila pivote, que parte de una sola columna de I.
+    Con trazar=False se omiten los pasos y las aumentadas del log.
+    Con entradas exactas y prueba_modular=True, det(A) mod dos primos descarta las
+    matrices singulares antes de la eliminación (después de los atajos estructurales;
+    ver AritmeticaModular.prueba_singularidad).
+    Fuera de la vista (interactivo=False) y sin `motor`, las estructuras diagonal,
+    permutación, triangular y SPD se invierten sin eliminación (_inversa_estructurada).
+    Sin atajo estructural, Motores elige entre Gauss-Jordan, LU flotante y NumPy
+    (las dos últimas solo con flotantes; con trazar, Gauss-Jordan mientras quepa en el
+    presupuesto de pasos, o siempre con interactivo=True); motor="gauss_jordan" fuerza
+    los pasos. `factor` (LU flotante de A, p. ej. la de elegir_precision) se reutiliza
+    si se elige la LU.
     """
     A = deepcopy(A_in)
     n = len(A)
@@ -57,11 +124,44 @@ def inverse_with_logs(A_in: List[List[Number]], use_tol_for_float: bool = True
     def z(v: Number) -> bool:
         return is_zero(v, 1e-12 if use_tol_for_float else 0.0)
 
-    logs.append("Matriz aumentada inicial [A | I]:")
-    for r in aug:
-        logs.append("  [ " + "  ".join(to_str(x) for x in r[:n]) + " | " +
-                    "  ".join(to_str(x) for x in r[n:]) + " ]")
+    if trazar:
+        logs.append("Matriz aumentada inicial [A | I]:")
+        _log_aumentada(logs, aug, n)
+
+    # los atajos estructurales no muestran pasos: la vista (interactivo) y un motor
+    # pedido explícitamente van siempre por el selector
+    atajo = None if interactivo or motor else \
+        _inversa_estructurada(A, analizar_estructura(A), z, 1e-12 if use_tol_for_float else 0.0)
+    if atajo is not None:
+        Ainv, desc = atajo
+        logs.append(f"Estructura detectada: {desc}.")
+        aug = [r[n:] + fila for r, fila in zip(aug, Ainv)]   # [I | A⁻¹]
+        if trazar:
+            logs.append("Aumentada final (debería ser [I | A⁻¹]):")
+            _log_aumentada(logs, aug, n)
+        logs.append("La matriz ES invertible. A⁻¹ extraída de la parte derecha.")
+        return Ainv, logs, aug
+
+    # O(n³) en enteros de palabra: solo si no hubo atajo estructural O(n)/O(n²)
+    prueba = prueba_singularidad(A, segundo_primo=True) if prueba_modular else None
+    if prueba is not None and prueba.singular:
+        logs.append("Prueba modular: det(A) ≡ 0 (mod " + ", ".join(map(str, prueba.primos)) +
+                    f") → matriz NO invertible (error ≤ {prueba.cota_error:.1e}).")
+        return None, logs, aug
+
+    eleccion = elegir_motor("inversa", A, motor=motor, pasos="gauss_jordan" if trazar else None,
+                            interactivo=interactivo)
+    if eleccion.motor != "gauss_jordan":
+        logs.append(eleccion.describir())
+        Ainv = _inversa_motor(A, eleccion.motor, 1e-12 if use_tol_for_float else 0.0, factor)
+        if Ainv is None:
+            logs.append(f"{eleccion.motor}: A singular en punto flotante → matriz NO invertible.")
+            return None, logs, aug
+        aug = [r[n:] + fila for r, fila in zip(aug, Ainv)]   # [I | A⁻¹]
+        logs.append("La matriz ES invertible. A⁻¹ calculada sin pasos intermedios.")
+        return Ainv, logs, aug
 
+    soporte = [{n + i} for i in range(n)]   # columnas no nulas de la mitad derecha, por fila
     row = 0
     for col in range(n):
         if row >= n:
@@ -80,38 +180,60 @@ def inverse_with_logs(A_in: List[List[Number]], use_tol_for_float: bool = True
         # swap si hace falta
         if sel != row:
             aug[row], aug[sel] = aug[sel], aug[row]
-            logs.append(f"Swap: F{row+1} ↔ F{sel+1}")
+            soporte[row], soporte[sel] = soporte[sel], soporte[row]
+            if trazar: logs.append(f"Swap: F{row+1} ↔ F{sel+1}")
+
+        fila_p = aug[row]
+        vivas = list(range(col, n)) + sorted(soporte[row])
 
         # normalizar pivote a 1
-        piv = aug[row][col]
+        piv = fila_p[col]
         piv_is_one = (isinstance(piv, Fraction) and piv == 1) or (not isinstance(piv, Fraction) and abs(float(piv) - 1.0) < 1e-15)
         if not piv_is_one:
             factor = (Fraction(1, 1) / piv) if isinstance(piv, Fraction) else 1.0 / float(piv)
-            aug[row] = [x * factor for x in aug[row]]
-            logs.append(f"F{row+1} = ({to_str(factor)}) · F{row+1}")
+            for k in vivas:
+                fila_p[k] = fila_p[k] * factor
+            if trazar: logs.append(f"F{row+1} = ({to_str(factor)}) · F{row+1}")
 
         # eliminar arriba y abajo
         for r in range(n):
             if r == row:
                 continue
-            fac = aug[r][col]
+            fila = aug[r]
+            fac = fila[col]
             if z(fac):
                 continue
-            aug[r] = [a - fac * b for a, b in zip(aug[r], aug[row])]
-            logs.append(f"F{r+1} = F{r+1} - ({to_str(fac)}) · F{row+1}")
+            for k in vivas:
+                fila[k] = fila[k] - fac * fila_p[k]
+            soporte[r] |= soporte[row]
+            if trazar: logs.append(f"F{r+1} = F{r+1} - ({to_str(fac)}) · F{row+1}")
 
         row += 1
 
-    logs.append("Aumentada final (debería ser [I | A⁻¹]):")
-    for r in aug:
-        logs.append("  [ " + "  ".join(to_str(x) for x in r[:n]) + " | " +
-                    "  ".join(to_str(x) for x in r[n:]) + " ]")
+    if trazar:
+        logs.append("Aumentada final (debería ser [I | A⁻¹]):")
+        _log_aumentada(logs, aug, n)
 
     # extraer A^-1
     Ainv = [r[n:] for r in aug]
     logs.append("La matriz ES invertible. A⁻¹ extraída de la parte derecha.")
     return Ainv, logs, aug
 
+def _inversa_motor(A: List[List[Number]], motor: str, tol: float,
+                   F: FactorLU | None = None) -> List[List[float]] | None:
+    """A⁻¹ flotante sin pasos: columnas A⁻¹·e_j con la LU (O(n³) en total) o numpy.linalg.inv."""
+    if motor == "numpy":
+        try:
+            return np.linalg.inv(np.array(A, dtype=float)).tolist()
+        except np.linalg.LinAlgError:
+            return None
+    F = F or factorizar_lu(A, tol)
+    if F is None:
+        return None
+    n = F.n
+    cols = [F.resolver([1.0 if i == j else 0.0 for i in range(n)]) for j in range(n)]
+    return [list(fila) for fila in zip(*cols)]
+
 def matmul(A: List[List[Number]], B: List[List[Number]]) -> List[List[Number]]:
     m, k, n = len(A), len(A[0]), len(B[0])
     use_frac = all(isinstance(x, Fraction) for row in A for x in row) and \
@@ -159,6 +281,10 @@ class InversaView(ttk.Frame):
         self.bg = "#eef4ff"; self.card = "#ffffff"; self.primary = "#1f4fd6"
         self.text = "#0f172a"; self.muted = "#475569"
 
+        self._A_calc: List[List[Number]] | None = None   # A y A⁻¹ del último cálculo (en memoria)
+        self._A_leida: List[List[Number]] | None = None  # A tal como se leyó (difiere de _A_calc si κ eligió float)
+        self._inv: List[List[Number]] | None = None
+
         self._styles()
         self._ui()
 
@@ -202,6 +328,7 @@ class InversaView(ttk.Frame):
 
         self.var_n = tk.IntVar(value=3)
         self.var_frac = tk.BooleanVar(value=True)
+        self.var_auto = tk.BooleanVar(value=False)
         ttk.Label(ctrl, text="Tamaño n:", style="Sec.TLabel").grid(row=0, column=0, padx=(0, 6))
         ttk.Spinbox(ctrl, from_=1, to=8, textvariable=self.var_n, width=5).grid(row=0, column=1, padx=(0, 16))
         ttk.Checkbutton(ctrl, text="Fracciones exactas", variable=self.var_frac).grid(row=0, column=2, padx=(0, 16))
@@ -209,6 +336,8 @@ class InversaView(ttk.Frame):
         ttk.Button(ctrl, text="Ejemplo",  style="Ghost.TButton", command=self._ejemplo).grid(row=0, column=4, padx=4)
         ttk.Button(ctrl, text="Limpiar",   style="Ghost.TButton", command=self._limpiar).grid(row=0, column=5, padx=4)
         ttk.Button(ctrl, text="Regresar", style="Ghost.TButton", command=self._back).grid(row=0, column=6, padx=4)
+        ttk.Checkbutton(ctrl, text="Precisión automática (según κ₁(A))",
+                        variable=self.var_auto).grid(row=1, column=2, columnspan=5, padx=(0, 16), pady=(6, 0), sticky="w")
 
         # Grid de A
         gshadow = tk.Frame(container, bg="#dfe7fb"); gshadow.pack(fill="x", pady=(14, 10))
@@ -275,6 +404,7 @@ class InversaView(ttk.Frame):
             self.on_back()
 
     def _limpiar(self):
+        self._A_calc = self._A_leida = self._inv = None
         for w in self.frameA.winfo_children(): w.destroy()
         self._generar()
         self._render_inv([])
@@ -308,7 +438,7 @@ class InversaView(ttk.Frame):
 
     def _leer_A(self) -> List[List[Number]]:
         n = len(self.ent_A)
-        use_frac = self.var_frac.get()
+        use_frac = self.var_frac.get() or self.var_auto.get()
         M: List[List[Number]] = []
         for i in range(n):
             row: List[Number] = []
@@ -326,16 +456,27 @@ class InversaView(ttk.Frame):
         except Exception as e:
             messagebox.showerror("Entrada inválida", f"Revisa los valores: {e}")
             return
-        inv, logs, _aug = inverse_with_logs(A, use_tol_for_float=not self.var_frac.get())
+        self._A_leida = A
+        cond_txt = ""
+        if self.var_auto.get():
+            # Entrada leída exacta; se pasa a float solo si κ₁(A) lo permite
+            flotante, kappa, F = elegir_precision(A)
+            if flotante:
+                A = [[float(x) for x in fila] for fila in A]
+            inv, logs, _aug = inverse_with_logs(A, use_tol_for_float=flotante, interactivo=True, factor=F)
+            cond_txt = texto_condicion(kappa, flotante) + "\n\n"
+        else:
+            inv, logs, _aug = inverse_with_logs(A, use_tol_for_float=not self.var_frac.get(), interactivo=True)
+        self._A_calc, self._inv = A, inv
         if inv is None:
             self._render_inv([])
             self._set_text(self.txt_log, "\n".join(logs) + "\n\nConclusión: la matriz NO es invertible.")
-            self._set_text(self.txt_ver, "")
+            self._set_text(self.txt_ver, cond_txt)
             self._scroll_top()
             return
         self._render_inv(inv)
         self._set_text(self.txt_log, "\n".join(logs))
-        self._set_text(self.txt_ver, "Aún no verificado. Presione “Verificar A×A⁻¹”.")
+        self._set_text(self.txt_ver, cond_txt + "Aún no verificado. Presione “Verificar A×A⁻¹”.")
         self._scroll_top()
 
     def _verificar(self):
@@ -344,22 +485,23 @@ class InversaView(ttk.Frame):
         except Exception as e:
             messagebox.showerror("Entrada inválida", f"Revisa los valores: {e}")
             return
-        vals = [self.tbl_inv.item(iid, "values") for iid in self.tbl_inv.get_children()]
-        if not vals:
+        if self._inv is None:
             messagebox.showinfo("Verificar", "Primero calcule A⁻¹.")
             return
-        # reconstruir Ainv desde tabla
-        Ainv: List[List[Number]] = []
-        use_frac = self.var_frac.get()
-        for row in vals:
-            Ainv.append([Fraction(x) if use_frac else float(x) for x in row])
-
-        P = matmul(A, Ainv)
-        ok = is_identity(P)
-        txt = "Resultado de A × A⁻¹:\n"
-        for r in P:
-            txt += "[ " + "  ".join(to_str(x) for x in r) + " ]\n"
-        txt += "\n✅ Verificación EXITOSA: A × A⁻¹ = I" if ok else "\n❌ No es la identidad."
+        if A != self._A_leida:
+            messagebox.showinfo("Verificar", "A cambió desde el último cálculo; vuelva a calcular A⁻¹.")
+            return
+        A = self._A_calc
+
+        # Freivalds: A·(A⁻¹·r) = r para r aleatorios, O(n²) por ronda, con la A⁻¹ en memoria
+        res = verificar_inversa(A, self._inv)
+        txt = f"Verificación de Freivalds: A·(A⁻¹·r) = r con {res.rondas} vector(es) r aleatorio(s).\n"
+        if res.ok:
+            txt += "\n✅ Verificación EXITOSA: A × A⁻¹ = I"
+            txt += (f"\n(probabilidad de error ≤ {res.prob_error:.1e})" if res.prob_error
+                    else f"\n(residuo relativo máximo {res.residuo_max:.1e})")
+        else:
+            txt += f"\n❌ No es la identidad (falló en la ronda {res.rondas})."
         self._set_text(self.txt_ver, txt)
         self._scroll_top()
 
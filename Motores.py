@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motores.py — Selección automática del motor de cálculo con un modelo de costos
+• Operaciones: det | resolver | inversa | mult
+• Motores: cofactor, bareiss, modular (CRT), lu (float), numpy, disperso, y los propios
+  de cada operación (gauss, banda, cholesky, refinado, gauss_jordan, clasico, bloques,
+  strassen, paralelo)
+• Costo estimado = fijo + c · trabajo(perfil), con el perfil (tamaño, tipo, bits de las
+  entradas, densidad, anchos de banda, simetría) de la matriz; se elige el motor
+  aplicable de menor costo
+• Los motores con pasos (cofactor, gauss, banda, cholesky, gauss_jordan) se prefieren
+  mientras su costo estimado quepa en el presupuesto de pasos. Las vistas interactivas
+  (interactivo=True) se quedan siempre con ellos: mostrar el desarrollo es su razón de ser
+• Presupuesto de pasos: clave "presupuesto_pasos" (segundos) del mismo JSON; por
+  defecto PRESUPUESTO_PASOS. python Motores.py --presupuesto S lo guarda
+• (fijo, c) se calibran con un benchmark local (python Motores.py --calibrar) y se
+  guardan en JSON: $ALGEBRA_MOTORES_CONFIG o ~/.config/algebra_lineal/motores.json
+• Reproducibilidad: parámetro motor=... o ALGEBRA_MOTOR="det=bareiss,mult=clasico"
+  (un nombre solo, p. ej. ALGEBRA_MOTOR=numpy, vale para todas las operaciones)
+"""
+
+from __future__ import annotations
+import json
+import os
+from dataclasses import dataclass, field
+from fractions import Fraction
+from math import log2, prod
+from typing import Dict, List, Tuple, Union
+
+from AritmeticaModular import det_modular
+from Estructura import signo_permutacion
+from FactorizacionLU import factorizar_lu
+from MatrizDispersa import UMBRAL_DENSIDAD, UMBRAL_TAM_DISPERSO, MatrizCSR, lu_dispersa
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+Number = Union[Fraction, float]
+VERSION_MODELO = 1
+UMBRAL_BANDA = 8           # sistemas desde este tamaño pueden ir por el camino en banda
+PRESUPUESTO_PASOS = 0.05   # s, valor de fábrica de "presupuesto_pasos" (ver presupuesto_pasos())
+VAR_CONFIG = "ALGEBRA_MOTORES_CONFIG"
+VAR_MOTOR = "ALGEBRA_MOTOR"
+
+MOTORES = {
+    "det": ("cofactor", "bareiss", "modular", "lu", "numpy", "disperso"),
+    "resolver": ("gauss", "banda", "disperso", "cholesky", "refinado", "numpy"),
+    "inversa": ("gauss_jordan", "lu", "numpy"),
+    "mult": ("exacto", "clasico", "bloques", "strassen", "numpy", "paralelo", "disperso"),
+}
+
+# (fijo en s, s por unidad de trabajo): CPython 3.11, un núcleo; calibrar() los reemplaza.
+CONSTANTES_BASE: Dict[str, Tuple[float, float]] = {
+    "det.cofactor": (5e-6, 3.7e-6), "det.bareiss": (1.7e-5, 1.3e-7), "det.modular": (1.2e-4, 3.7e-7),
+    "det.lu": (7e-6, 5e-8), "det.numpy": (2e-5, 2e-10), "det.disperso": (2.4e-5, 5.7e-6),
+    "resolver.gauss": (6e-5, 1.9e-6), "resolver.banda": (3.7e-5, 1.3e-6),
+    "resolver.disperso": (6e-5, 2.3e-6), "resolver.cholesky": (7.8e-5, 2.1e-6),
+    "resolver.refinado": (1e-4, 3.2e-7), "resolver.numpy": (2e-5, 2e-10),
+    "inversa.gauss_jordan": (4.3e-5, 1.6e-6), "inversa.lu": (2.6e-5, 6.4e-8),
+    "inversa.numpy": (2e-5, 2e-10),
+    "mult.exacto": (2.4e-5, 8.5e-7), "mult.clasico": (3.5e-6, 5.5e-8), "mult.bloques": (7e-6, 3.2e-8),
+    "mult.strassen": (6e-6, 9e-8), "mult.numpy": (2e-5, 1e-10), "mult.paralelo": (0.15, 4e-8),
+    "mult.disperso": (1.2e-5, 1.3e-6),
+}
+
+
+# --------------------- perfil de la entrada ---------------------
+@dataclass
+class Perfil:
+    m: int                 # A es m×k; B (si hay) es k×n, si no n = k
+    k: int
+    n: int
+    nnz: int
+    exacta: bool           # todo int/Fraction
+    bits: int              # bits de la mayor entrada (numerador + denominador), exactas
+    inf: int = 0           # anchos de banda inferior y superior (A cuadrada, sin B)
+    sup: int = 0
+    simetrica: bool = False
+
+    @property
+    def densidad(self) -> float:
+        return self.nnz / max(1, self.m * self.k)
+
+    @property
+    def palabras(self) -> float:
+        """Tamaño relativo de los números intermedios de la eliminación exacta: las
+        entradas crecen hasta ~m·bits bits, y cada operación cuesta en proporción."""
+        return 1.0 + self.m * self.bits / 60 if self.exacta else 1.0
+
+def _bits(x) -> int:
+    if isinstance(x, Fraction):
+        return abs(x.numerator).bit_length() + x.denominator.bit_length()
+    return abs(x).bit_length() if isinstance(x, int) else 53
+
+def perfilar(A, B=None) -> Perfil:
+    datos = A.datos if isinstance(A, MatrizCSR) else [x for fila in A for x in fila]
+    m, k = A.forma if isinstance(A, MatrizCSR) else (len(A), len(A[0]) if A else 0)
+    n = (B.forma[1] if isinstance(B, MatrizCSR) else len(B[0])) if B is not None else k
+    exacta = all(isinstance(x, (int, Fraction)) for x in datos)
+    if B is not None:
+        datos_b = B.datos if isinstance(B, MatrizCSR) else [x for fila in B for x in fila]
+        exacta = exacta and all(isinstance(x, (int, Fraction)) for x in datos_b)
+    nnz = sum(1 for x in datos if x != 0)
+    bits = max((_bits(x) for x in datos), default=0) if exacta else 53
+    inf = sup = 0
+    simetrica = False
+    if B is None and m == k:
+        if isinstance(A, MatrizCSR):
+            for i in range(m):
+                for j in A.indices[A.indptr[i]:A.indptr[i + 1]]:
+                    inf, sup = max(inf, i - j), max(sup, j - i)
+        else:
+            for i, fila in enumerate(A):
+                for j, x in enumerate(fila):
+                    if x != 0:
+                        inf, sup = max(inf, i - j), max(sup, j - i)
+            simetrica = all(A[i][j] == A[j][i] for i in range(m) for j in range(i))
+    return Perfil(m, k, n, nnz, exacta, bits, inf, sup, simetrica)
+
+
+# --------------------- modelo de costos ---------------------
+def _trabajo(op: str, motor: str, p: Perfil, nnz_b: int = 0) -> float:
+    """Unidades de trabajo (≈ operaciones elementales del motor) para el perfil."""
+    n = p.m
+    cubo = n ** 3 / 3
+    if op == "det":
+        if motor == "cofactor":
+            # se expande por la línea con más ceros y se omiten los términos nulos:
+            # ~k·densidad menores por nivel en lugar de k (densidad 1 → n!)
+            d = p.densidad
+            return prod(max(1.0, k * d) for k in range(2, n + 1)) * p.palabras ** 0.5
+        if motor == "bareiss":
+            return cubo * p.palabras
+        if motor == "modular":
+            bits_det = n * (p.bits + 0.5 * log2(max(n, 2)))        # Hadamard
+            return cubo * (bits_det // 30 + 1)
+        if motor == "disperso":
+            return p.nnz ** 2 / max(1, n) * p.palabras             # relleno estimado
+        return cubo
+    if op == "resolver":
+        if motor == "refinado":
+            return cubo / 20 + 10 * n * n * p.palabras             # LU float + residuos enteros
+        if motor == "banda":                                        # pivoteo: la banda superior llega a inf+sup
+            return n * max(1, p.inf) * (p.inf + p.sup + 1) * p.palabras
+        if motor == "disperso":
+            return p.nnz ** 2 / max(1, n) * p.palabras
+        if motor == "cholesky":
+            return cubo / 2 * p.palabras
+        if motor == "gauss" and (p.inf == 0 or p.nnz == n):        # triangular o permutación: sin eliminar
+            return n * n * p.palabras
+        return cubo * (p.palabras if motor == "gauss" else 1.0)
+    if op == "inversa":
+        return 3 * cubo * (p.palabras if motor == "gauss_jordan" else 1.0)
+    # mult
+    m, k, nn = p.m, p.k, p.n
+    if motor == "strassen":
+        return max(m, k, nn) ** 2.807
+    if motor == "disperso":
+        return p.nnz * max(nnz_b, 1) / max(1, k)
+    if motor == "paralelo":
+        return m * k * nn / (os.cpu_count() or 1)
+    return m * k * nn * (p.palabras if motor == "exacto" else 1.0)
+
+def _aplicable(op: str, motor: str, p: Perfil) -> bool:
+    if motor == "numpy" and np is None:
+        return False
+    if motor == "disperso":
+        if op == "resolver" and (p.inf == 0 or p.nnz == p.m):      # ya resueltos sin eliminar
+            return False
+        return max(p.m, p.k, p.n) >= UMBRAL_TAM_DISPERSO and p.densidad <= UMBRAL_DENSIDAD
+    if op == "det":
+        if motor == "cofactor":
+            return True
+        if motor in ("bareiss", "modular"):
+            return p.exacta
+        return not p.exacta                                        # lu, numpy: solo flotantes
+    if op == "resolver":
+        if motor == "refinado":
+            return p.exacta
+        if motor == "banda":
+            return p.m >= UMBRAL_BANDA and 2 * p.inf + p.sup + 1 <= p.m // 2
+        if motor == "cholesky":
+            return p.simetrica and p.m > 1
+        return motor == "gauss" or not p.exacta
+    if op == "inversa":
+        return motor == "gauss_jordan" or not p.exacta
+    if motor == "exacto":
+        return p.exacta
+    if motor == "strassen":                    # bajo UMBRAL_STRASSEN (128) delega en bloques
+        return not p.exacta and p.m == p.k == p.n > 128
+    if motor == "paralelo":
+        return not p.exacta and (os.cpu_count() or 1) > 1
+    return not p.exacta
+
+def ruta_config() -> str:
+    return os.environ.get(VAR_CONFIG) or os.path.join(
+        os.path.expanduser("~"), ".config", "algebra_lineal", "motores.json")
+
+_modelo: Dict[str, Tuple[float, float]] | None = None
+_presupuesto = PRESUPUESTO_PASOS
+
+def cargar_modelo(recargar: bool = False) -> Dict[str, Tuple[float, float]]:
+    """Constantes calibradas (o las de fábrica si no hay archivo o es de otra versión)."""
+    global _modelo, _presupuesto
+    if _modelo is None or recargar:
+        _modelo = dict(CONSTANTES_BASE)
+        _presupuesto = PRESUPUESTO_PASOS
+        try:
+            with open(ruta_config(), encoding="utf-8") as f:
+                datos = json.load(f)
+            if datos.get("presupuesto_pasos") is not None:
+                _presupuesto = float(datos["presupuesto_pasos"])
+            if datos.get("version") == VERSION_MODELO:
+                _modelo.update({c: (float(v[0]), float(v[1])) for c, v in datos.get("constantes", {}).items()
+                                if c in CONSTANTES_BASE})
+        except (OSError, ValueError, TypeError, IndexError):
+            pass
+    return _modelo
+
+def presupuesto_pasos() -> float:
+    """Segundos estimados hasta los que un motor con pasos le gana a uno más rápido."""
+    cargar_modelo()
+    return _presupuesto
+
+def guardar_modelo(constantes: Dict[str, Tuple[float, float]], ruta: str | None = None,
+                   presupuesto: float | None = None) -> str:
+    ruta = ruta or ruta_config()
+    presupuesto = presupuesto_pasos() if presupuesto is None else presupuesto
+    os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump({"version": VERSION_MODELO, "numpy": np is not None, "cpus": os.cpu_count() or 1,
+                   "presupuesto_pasos": presupuesto, "constantes": constantes}, f, indent=2, sort_keys=True)
+    cargar_modelo(recargar=True)
+    return ruta
+
+def motor_forzado(op: str) -> str | None:
+    """Motor fijado por ALGEBRA_MOTOR para `op` (None si no hay)."""
+    valor = os.environ.get(VAR_MOTOR, "").strip()
+    if not valor:
+        return None
+    if "=" not in valor:
+        return valor if valor in MOTORES[op] else None
+    for par in valor.split(","):
+        clave, _, motor = par.partition("=")
+        if clave.strip() == op:
+            return motor.strip()
+    return None
+
+
+@dataclass
+class Eleccion:
+    op: str
+    motor: str
+    costos: Dict[str, float] = field(default_factory=dict)   # segundos estimados por motor aplicable
+    forzado: str = ""                                          # "", "parámetro" o VAR_MOTOR
+
+    def describir(self) -> str:
+        if self.forzado:
+            return f"Motor: {self.motor} (fijado por {self.forzado})"
+        otros = ", ".join(f"{m} ≈ {c:.2g} s" for m, c in sorted(self.costos.items(), key=lambda t: t[1])
+                          if m != self.motor)
+        return f"Motor: {self.motor} (≈ {self.costos[self.motor]:.2g} s estimado" + \
+               (f"; {otros})" if otros else ")")
+
+def estimar_costos(op: str, A, B=None) -> Dict[str, float]:
+    if op not in MOTORES:
+        raise ValueError(f"Operación desconocida: {op!r} (opciones: {', '.join(MOTORES)}).")
+    p = perfilar(A, B)
+    nnz_b = perfilar(B).nnz if B is not None else 0
+    modelo = cargar_modelo()
+    costos = {}
+    for mot in MOTORES[op]:
+        if _aplicable(op, mot, p):
+            fijo, c = modelo[f"{op}.{mot}"]
+            costos[mot] = fijo + c * _trabajo(op, mot, p, nnz_b)
+    return costos
+
+def elegir_motor(op: str, A, B=None, motor: str | None = None, pasos=None,
+                 interactivo: bool = False) -> Eleccion:
+    """Motor de menor costo estimado para `op` con estas matrices. `motor` (o la
+    variable ALGEBRA_MOTOR) lo fija sin consultar el modelo. `pasos` es el motor (o
+    tupla de motores) que muestra el desarrollo: se queda con el más barato de ellos
+    si cuesta ≤ presupuesto_pasos(), o siempre con interactivo=True."""
+    origen = "parámetro" if motor else ""
+    if not motor:
+        motor = motor_forzado(op)
+        origen = VAR_MOTOR if motor else ""
+    if motor:
+        if motor not in MOTORES[op]:
+            raise ValueError(f"Motor {motor!r} no existe para '{op}' (opciones: {', '.join(MOTORES[op])}).")
+        if motor == "numpy" and np is None:
+            raise ValueError("NumPy no está instalado.")
+        return Eleccion(op, motor, {}, origen)
+    costos = estimar_costos(op, A, B)
+    con_pasos = [m for m in ((pasos,) if isinstance(pasos, str) else pasos or ()) if m in costos]
+    if con_pasos:
+        mejor = min(con_pasos, key=costos.get)
+        if interactivo or costos[mejor] <= presupuesto_pasos():
+            return Eleccion(op, mejor, costos)
+    return Eleccion(op, min(costos, key=costos.get), costos)
+
+
+# --------------------- motores de determinante ---------------------
+def det_cofactor(A: List[List[Number]]) -> Number:
+    """Laplace sin pasos por la fila o columna con más ceros; los términos nulos se omiten."""
+    n = len(A)
+    if n == 1:
+        return A[0][0]
+    if n == 2:
+        return A[0][0] * A[1][1] - A[0][1] * A[1][0]
+    ceros_f = [sum(1 for x in fila if x == 0) for fila in A]
+    ceros_c = [sum(1 for fila in A if fila[j] == 0) for j in range(n)]
+    if max(ceros_c) > max(ceros_f):
+        A = [list(col) for col in zip(*A)]               # det(Aᵀ) = det(A)
+        ceros_f = ceros_c
+    i = max(range(n), key=ceros_f.__getitem__)
+    resto = A[:i] + A[i + 1:]
+    det = 0
+    for j, a in enumerate(A[i]):
+        if a != 0:
+            menor = [fila[:j] + fila[j + 1:] for fila in resto]
+            det += (-a if (i + j) % 2 else a) * det_cofactor(menor)
+    return det
+
+def det_bareiss(A: List[List[Number]]) -> Fraction:
+    """Eliminación libre de fracciones sobre las filas escaladas a enteros: cada división
+    (piv·a − f·b) / d_anterior es exacta y los enteros crecen solo linealmente."""
+    filas = [[Fraction(x) for x in fila] for fila in A]
+    escalas = [prod(x.denominator for x in fila) for fila in filas]
+    M = [[int(x * e) for x in fila] for fila, e in zip(filas, escalas)]
+    n, signo, d = len(M), 1, 1
+    for c in range(n):
+        k = next((i for i in range(c, n) if M[i][c]), None)
+        if k is None:
+            return Fraction(0)
+        if k != c:
+            M[c], M[k] = M[k], M[c]
+            signo = -signo
+        fc, piv = M[c], M[c][c]
+        for i in range(c + 1, n):
+            fila, f = M[i], M[i][c]
+            for j in range(c + 1, n):
+                fila[j] = (piv * fila[j] - f * fc[j]) // d
+        d = piv
+    return Fraction(signo * d, prod(escalas))
+
+def det_lu(A: List[List[Number]]) -> float:
+    F = factorizar_lu(A, tol=0.0)
+    if F is None:
+        return 0.0
+    return signo_permutacion(F.perm) * prod(F.LU[i][i] for i in range(F.n))
+
+def det_numpy(A: List[List[Number]]) -> float:
+    return float(np.linalg.det(np.array(A, dtype=float)))
+
+def det_disperso(A) -> Number:
+    """P·A·Q = L·U con la LU dispersa: det = sgn(P)·sgn(Q)·Π u_kk."""
+    csr = A if isinstance(A, MatrizCSR) else MatrizCSR.desde_densa(A)
+    F = lu_dispersa(csr, usar_tol=not perfilar(csr).exacta)
+    if F is None:
+        return csr.cero
+    det = signo_permutacion(F.fila_piv) * signo_permutacion(F.col_piv)
+    for c, fila in zip(F.col_piv, F.U):
+        det = det * fila[c]
+    return det
+
+_MOTORES_DET = {
+    "cofactor": det_cofactor, "bareiss": det_bareiss, "modular": det_modular,
+    "lu": det_lu, "numpy": det_numpy, "disperso": det_disperso,
+}
+
+def determinante(A, motor: str | None = None) -> Number:
+    """det(A) con el motor elegido por el modelo (o el indicado)."""
+    mot = elegir_motor("det", A, motor=motor).motor
+    if isinstance(A, MatrizCSR) and mot != "disperso":
+        A = A.a_densa()
+    return _MOTORES_DET[mot](A)
+
+
+# --------------------- calibración ---------------------
+def _azar(n: int, m: int, exacta: bool, rng, densidad: float = 1.0, forma: str = "") -> List[List[Number]]:
+    """forma: "" (general), "banda" (tridiagonal) o "spd" (simétrica definida positiva)."""
+    def x():
+        if rng.random() > densidad:
+            return Fraction(0) if exacta else 0.0
+        return Fraction(rng.randint(-9, 9)) if exacta else rng.uniform(-1, 1)
+    M = [[x() for _ in range(m)] for _ in range(n)]
+    cero = Fraction(0) if exacta else 0.0
+    if forma == "banda":
+        M = [[v if abs(i - j) <= 1 else cero for j, v in enumerate(fila)] for i, fila in enumerate(M)]
+    elif forma == "spd":
+        M = [[M[min(i, j)][max(i, j)] for j in range(m)] for i in range(n)]
+    fuerte = 10 * m if forma == "spd" else 20       # diagonal dominante: nunca singular (y SPD)
+    for i in range(min(n, m)):
+        M[i][i] += fuerte if exacta else fuerte / 10
+    return M
+
+def _ejecutor(op: str, motor: str):
+    """Función (A, B) → resultado que ejecuta el motor; los de Gauss, Gauss-Jordan y A×B
+    se importan aquí para que esos módulos puedan importar Motores sin ciclos."""
+    if op == "det":
+        return lambda A, B: _MOTORES_DET[motor](A)
+    if op == "resolver":
+        from Gauss import gauss_refinado, gauss_resolver
+        if motor == "numpy":
+            return lambda A, B: np.linalg.solve(np.array(A, dtype=float), np.array(B, dtype=float))
+        if motor == "refinado":
+            return lambda A, B: gauss_refinado([f + [b] for f, b in zip(A, B)])
+        return lambda A, B: gauss_resolver([f + [b] for f, b in zip(A, B)], motor=motor)
+    if op == "inversa":
+        from MatrizInversa import inverse_with_logs
+        return lambda A, B: inverse_with_logs(A, trazar=False, prueba_modular=False, motor=motor)
+    from SumayMultiplicaciondeMatrices import mult_matrices
+    return lambda A, B: mult_matrices(A, B, motor=motor)
+
+# (op, motor) → tamaños de prueba, exacta, densidad; _FORMAS: estructura de la matriz de prueba
+_PRUEBAS = {
+    "det.cofactor": ((6, 7, 8), True, 1.0), "det.bareiss": ((16, 24, 32), True, 1.0),
+    "det.modular": ((16, 24, 32), True, 1.0), "det.lu": ((32, 64, 96), False, 1.0),
+    "det.numpy": ((128, 256, 384), False, 1.0), "det.disperso": ((100, 200, 300), False, 0.02),
+    "resolver.gauss": ((8, 12, 16), True, 1.0), "resolver.banda": ((50, 100, 200), True, 1.0),
+    "resolver.disperso": ((50, 100, 150), True, 0.03), "resolver.cholesky": ((8, 12, 16), True, 1.0),
+    "resolver.refinado": ((16, 24, 32), True, 1.0),
+    "resolver.numpy": ((128, 256, 384), False, 1.0),
+    "inversa.gauss_jordan": ((8, 12, 16), True, 1.0), "inversa.lu": ((32, 48, 64), False, 1.0),
+    "inversa.numpy": ((128, 256, 384), False, 1.0),
+    "mult.exacto": ((16, 24, 32), True, 1.0), "mult.clasico": ((32, 64, 96), False, 1.0),
+    "mult.bloques": ((32, 64, 96), False, 1.0), "mult.strassen": ((128, 192, 256), False, 1.0),
+    "mult.numpy": ((128, 256, 384), False, 1.0), "mult.paralelo": ((256, 384), False, 1.0),
+    "mult.disperso": ((100, 200, 300), False, 0.02),
+}
+
+_FORMAS = {"resolver.banda": "banda", "resolver.cholesky": "spd"}
+
+def calibrar(guardar: bool = True, semilla: int = 0, verbose: bool = True) -> Dict[str, Tuple[float, float]]:
+    """Benchmark local por motor: fijo = mejor de 5 corridas con n = 2; c = mediana de
+    (t − fijo) / trabajo en tres tamaños. Con guardar=True lo escribe en ruta_config()."""
+    import random
+    import time
+
+    rng = random.Random(semilla)
+    constantes = dict(cargar_modelo())
+    for clave, (tamanos, exacta, densidad) in _PRUEBAS.items():
+        op, motor = clave.split(".")
+        if motor == "numpy" and np is None or motor == "paralelo" and (os.cpu_count() or 1) < 2:
+            continue
+        ejecutar = _ejecutor(op, motor)
+
+        def medir(n: int) -> Tuple[float, float]:
+            A = _azar(n, n, exacta, rng, densidad, _FORMAS.get(clave, ""))
+            B = [v[0] for v in _azar(n, 1, exacta, rng)] if op == "resolver" else \
+                _azar(n, n, exacta, rng, densidad) if op == "mult" else None
+            t = time.perf_counter()
+            ejecutar(A, B)
+            t = time.perf_counter() - t
+            p, nnz_b = (perfilar(A, B), perfilar(B).nnz) if op == "mult" else (perfilar(A), 0)
+            return _trabajo(op, motor, p, nnz_b), t
+
+        fijo = min(medir(2)[1] for _ in range(5))
+        razones = sorted(max(t - fijo, 0.0) / w for w, t in map(medir, tamanos))
+        constantes[clave] = (fijo, razones[len(razones) // 2])
+        if verbose:
+            fijo, c = constantes[clave]
+            print(f"{clave:<22} fijo = {fijo:.1e} s   c = {c:.3e} s/unidad")
+    if guardar:
+        ruta = guardar_modelo(constantes)
+        if verbose:
+            print(f"Modelo guardado en {ruta}")
+    return constantes
+
+if __name__ == "__main__":
+    import sys
+    if "--calibrar" in sys.argv:
+        calibrar()
+    elif "--presupuesto" in sys.argv[:-1]:
+        segundos = float(sys.argv[sys.argv.index("--presupuesto") + 1])
+        print(f"Presupuesto de pasos = {segundos:g} s guardado en {guardar_modelo(cargar_modelo(), presupuesto=segundos)}")
+    else:
+        print(f"Uso: python Motores.py --calibrar | --presupuesto S   (modelo actual: {ruta_config()}, "
+              f"presupuesto de pasos {presupuesto_pasos():g} s)")
@@ -1,5 +1,13 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from fractions import Fraction
 
+from AritmeticaModular import prueba_singularidad
+from Determinantes import CacheMenores, VistaMenor, obtener_submatriz
+from Estructura import analizar_estructura, signo_permutacion
+
 def mostrar_matriz(matriz, titulo=""):
     """Muestra una matriz de forma ordenada usando fracciones"""
     if titulo:
@@ -26,13 +34,6 @@ def mostrar_matriz(matriz, titulo=""):
         print(" ]")
     print()
 
-def obtener_submatriz(matriz, fila_eliminar, col_eliminar):
-    """Obtiene la submatriz eliminando una fila y columna"""
-    return [
-        [matriz[i][j] for j in range(len(matriz)) if j != col_eliminar]
-        for i in range(len(matriz)) if i != fila_eliminar
-    ]
-
 def es_matriz_triangular(matriz):
     """Verifica si una matriz es triangular superior"""
     n = len(matriz)
@@ -42,8 +43,10 @@ def es_matriz_triangular(matriz):
                 return False
     return True
 
-def calcular_determinante_simple(matriz):
-    """Calcula el determinante sin mostrar el proceso"""
+def calcular_determinante_simple(matriz, analizar=True):
+    """Calcula el determinante sin mostrar el proceso. El análisis de estructura completo
+    se hace solo en la matriz de entrada; los menores (analizar=False) solo miran si
+    son triangulares superiores."""
     n = len(matriz)
     
     if n == 1:
@@ -54,24 +57,190 @@ def calcular_determinante_simple(matriz):
         c, d = matriz[1]
         return a * d - b * c
     
-    if es_matriz_triangular(matriz):
+    estructura = analizar_estructura(matriz) if analizar else None
+    if estructura.triangular if estructura else es_matriz_triangular(matriz):
         producto = 1
         for i in range(n):
             producto *= matriz[i][i]
         return producto
+    if estructura and estructura.es_permutacion:
+        sigma = estructura.permutacion
+        return signo_permutacion(sigma) * matriz[0][sigma[0]]
+    if estructura and estructura.diagonal_por_bloques:
+        bloques = estructura.bloques
+        det = 1
+        for a, b in zip(bloques, bloques[1:]):
+            det *= calcular_determinante_simple(VistaMenor(matriz).bloque(a, b), False)
+        return det
     
     # Expansión por cofactores en la primera fila
     det = 0
     for j in range(n):
         signo = (-1) ** j
         submatriz = obtener_submatriz(matriz, 0, j)
-        det += signo * matriz[0][j] * calcular_determinante_simple(submatriz)
+        det += signo * matriz[0][j] * calcular_determinante_simple(submatriz, False)
     
     return det
 
-def resolver_sistema_cramer(A, b):
-    """Resuelve un sistema de ecuaciones usando la Regla de Cramer"""
+# ---- menores compartidos entre A y las A_i ----
+def _det_menor(A, filas, cols, cache):
+    """det del menor de A con las filas y columnas marcadas en las máscaras de bits,
+    expandiendo por la primera fila restante. La clave (filas, cols) no depende de
+    cuál A_i pidió el menor: mientras no contenga la columna reemplazada, es de A."""
+    i = (filas & -filas).bit_length() - 1
+    resto = filas & ~(1 << i)
+    if not resto:
+        return A[i][cols.bit_length() - 1]
+    previo = cache.get((filas, cols))
+    if previo is not None:
+        return previo
+    fila = A[i]
+    det = 0
+    signo = 1
+    c = cols
+    while c:
+        j = (c & -c).bit_length() - 1
+        c &= c - 1
+        if fila[j] != 0:
+            det += signo * fila[j] * _det_menor(A, resto, cols & ~(1 << j), cache)
+        signo = -signo
+    cache.put((filas, cols), det)
+    return det
+
+def det_por_columna(A, col, valores, cache):
+    """det de A con la columna `col` sustituida por `valores`, desarrollando por esa
+    columna: Σ_r valores[r]·C_r,col. Los cofactores C_r,col son de A (no contienen la
+    columna), así que det(A) y todas las det(A_i) comparten los menores de `cache`."""
+    n = len(A)
+    todas = (1 << n) - 1
+    det = 0
+    for r in range(n):
+        if valores[r] != 0:
+            menor = _det_menor(A, todas & ~(1 << r), todas & ~(1 << col), cache) if n > 1 else 1
+            det += (-1) ** (r + col) * valores[r] * menor
+    return det
+
+# ---- menores en paralelo: por niveles de tamaño ----
+MIN_MENORES_POOL = 64   # niveles con menos menores se evalúan en el proceso principal
+
+def _hijos(A, filas, cols):
+    """Menores que consulta _det_menor al expandir (filas, cols): tamaño ≥ 2, a ≠ 0."""
+    i = (filas & -filas).bit_length() - 1
+    resto = filas & ~(1 << i)
+    if resto & (resto - 1) == 0:                     # hijos de 1×1: no pasan por la caché
+        return []
+    fila = A[i]
+    return [(resto, cols & ~(1 << j)) for j in range(len(fila)) if cols >> j & 1 and fila[j] != 0]
+
+def _evaluar_menores(A, claves, inferiores):
+    """Trabajador: det de cada menor de `claves`; sus hijos ya están en `inferiores`."""
+    cache = CacheMenores(None)
+    cache.datos.update(inferiores)
+    return [_det_menor(A, f, c, cache) for f, c in claves]
+
+def _evaluar_nivel(A, nivel, datos, pool, procesos):
+    if pool is None or len(nivel) < MIN_MENORES_POOL:
+        local = CacheMenores(None)
+        local.datos = datos                          # lee los hijos sin tocar los contadores
+        return [_det_menor(A, f, c, local) for f, c in nivel]
+    tam = -(-len(nivel) // procesos)
+    trozos = [nivel[k:k + tam] for k in range(0, len(nivel), tam)]
+    pendientes = [pool.submit(_evaluar_menores, A, trozo,
+                              {h: datos[h] for f, c in trozo for h in _hijos(A, f, c)})
+                  for trozo in trozos]
+    return [v for p in pendientes for v in p.result()]
+
+def _precalcular_menores(A, raices, cache, procesos):
+    """Llena `cache` con todos los menores que la evaluación en serie consultaría a
+    partir de `raices`, repartiendo cada nivel de tamaño entre `procesos` procesos
+    (un nivel solo depende del inferior). Los contadores quedan como en serie: cada
+    menor distinto es un fallo; cada consulta interna restante, un acierto (las de las
+    raíces las cuenta det_por_columna al leerlas)."""
+    nivel, visto = [], set(cache.datos)
+    for r in raices:
+        if r not in visto:
+            visto.add(r); nivel.append(r)
+    niveles, internas = [], 0
+    while nivel:
+        niveles.append(nivel)
+        siguiente = []
+        for f, c in nivel:
+            for h in _hijos(A, f, c):
+                internas += 1
+                if h not in visto:
+                    visto.add(h); siguiente.append(h)
+        nivel = siguiente
+    nuevos = sum(map(len, niveles))
+    grande = procesos > 1 and any(len(nivel) >= MIN_MENORES_POOL for nivel in niveles)
+    pool = ProcessPoolExecutor(max_workers=procesos) if grande else None
+    try:
+        for nivel in reversed(niveles):              # de los menores 2×2 hacia arriba
+            cache.datos.update(zip(nivel, _evaluar_nivel(A, nivel, cache.datos, pool, procesos)))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    cache.fallos += nuevos
+    cache.aciertos += internas - nuevos
+    return cache
+
+# ---- pasos por columna (serie o en un pool de procesos) ----
+def _paso_cramer(A, b, i, det_A, compartir, cache):
+    """Imprime el PASO de x_{i+1} y devuelve x_{i+1}."""
     n = len(A)
+    print(f"PASO {i+2}: Calcular x{i+1}")
+    print(f"x{i+1} = det(A{i+1}) / det(A)")
+    print(f"     = det(A{i+1}) / {det_A}")
+    print()
+    
+    # Crear matriz A_i (reemplazar columna i por vector b)
+    A_i = [fila[:] for fila in A]  # Copiar A
+    for j in range(n):
+        A_i[j][i] = b[j]
+    
+    print(f"Matriz A{i+1} (columna {i+1} reemplazada por b):")
+    mostrar_matriz(A_i)
+    
+    # Calcular determinante de A_i
+    if compartir:
+        det_A_i = det_por_columna(A, i, b, cache)
+        print(f"Desarrollo por la columna {i+1}: det(A{i+1}) = Σ b_r·C_r{i+1} "
+              "(cofactores de A, menores compartidos)")
+    else:
+        det_A_i = calcular_determinante_simple(A_i)
+    print(f"det(A{i+1}) = {det_A_i}")
+    
+    # Calcular x_i
+    x_i = det_A_i / det_A
+    print(f"x{i+1} = {det_A_i} / {det_A} = {x_i}")
+    print("-" * 50)
+    return x_i
+
+def _paso_cramer_aislado(A, b, i, det_A):
+    """Trabajador del pool (sin menores compartidos): el paso de x_{i+1} capturando lo
+    impreso. Devuelve (texto, x_i)."""
+    with redirect_stdout(io.StringIO()) as salida:
+        x_i = _paso_cramer(A, b, i, det_A, False, None)
+    return salida.getvalue(), x_i
+
+def _raices(A, col, valores):
+    """Menores que det_por_columna(A, col, valores) consulta en la caché."""
+    n = len(A)
+    if n < 3:
+        return []
+    todas = (1 << n) - 1
+    return [(todas & ~(1 << r), todas & ~(1 << col)) for r in range(n) if valores[r] != 0]
+
+def resolver_sistema_cramer(A, b, compartir=True, paralelo=False, procesos=None):
+    """Resuelve un sistema de ecuaciones usando la Regla de Cramer.
+    compartir=True: det(A) y cada det(A_i) se desarrollan por la columna reemplazada
+    con una sola caché de menores; False: cada determinante se calcula por separado.
+    paralelo=True usa un pool de `procesos` (por defecto, uno por núcleo). Con menores
+    compartidos, los menores se calculan por niveles de tamaño repartidos entre los
+    procesos y los pasos se imprimen después desde la caché llena: la salida, incluidas
+    las estadísticas de menores, es la de la versión en serie. Sin compartir, cada
+    det(A_i) va a un proceso que imprime en su propio búfer y se emiten en orden."""
+    n = len(A)
+    procesos = min(procesos or os.cpu_count() or 1, max(n, 1)) if paralelo else 1
     
     print("=" * 70)
     print("RESOLUCIÓN DE SISTEMA DE ECUACIONES - REGLA DE CRAMER")
@@ -113,7 +282,24 @@ def resolver_sistema_cramer(A, b):
     
     # Calcular determinante de A
     print("PASO 1: Calcular el determinante de la matriz A")
-    det_A = calcular_determinante_simple(A)
+    prueba = prueba_singularidad(A, segundo_primo=True)
+    if prueba is not None and prueba.singular:
+        print("Prueba rápida: det(A) ≡ 0 (mod " + ", ".join(map(str, prueba.primos)) +
+              f") → det(A) = 0 (error ≤ {prueba.cota_error:.1e})")
+        print("\n" + "=" * 70)
+        print("EL SISTEMA NO TIENE SOLUCIÓN ÚNICA")
+        print("   porque el determinante de A es cero")
+        print("=" * 70)
+        return None
+    cache = CacheMenores(None) if compartir else None
+    if compartir:
+        col_1 = [fila[0] for fila in A]
+        if procesos > 1:
+            _precalcular_menores(A, _raices(A, 0, col_1), cache, procesos)
+        det_A = det_por_columna(A, 0, col_1, cache)
+        print("Desarrollo por la columna 1 (sus menores se reutilizan para A1)")
+    else:
+        det_A = calcular_determinante_simple(A)
     print(f"det(A) = {det_A}")
     
     if det_A == 0:
@@ -129,36 +315,26 @@ def resolver_sistema_cramer(A, b):
     # Resolver para cada variable usando la Regla de Cramer
     soluciones = []
     
-    for i in range(n):
-        print(f"PASO {i+2}: Calcular x{i+1}")
-        print(f"x{i+1} = det(A{i+1}) / det(A)")
-        print(f"     = det(A{i+1}) / {det_A}")
-        print()
-        
-        # Crear matriz A_i (reemplazar columna i por vector b)
-        A_i = [fila[:] for fila in A]  # Copiar A
-        for j in range(n):
-            A_i[j][i] = b[j]
-        
-        print(f"Matriz A{i+1} (columna {i+1} reemplazada por b):")
-        mostrar_matriz(A_i)
-        
-        # Calcular determinante de A_i
-        det_A_i = calcular_determinante_simple(A_i)
-        print(f"det(A{i+1}) = {det_A_i}")
-        
-        # Calcular x_i
-        x_i = det_A_i / det_A
-        soluciones.append(x_i)
-        
-        print(f"x{i+1} = {det_A_i} / {det_A} = {x_i}")
-        print("-" * 50)
+    if procesos > 1 and not compartir:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            pendientes = [pool.submit(_paso_cramer_aislado, A, b, i, det_A) for i in range(n)]
+            for f in pendientes:                     # en orden de columna
+                texto, x_i = f.result()
+                print(texto, end="")
+                soluciones.append(x_i)
+    else:
+        if procesos > 1:
+            _precalcular_menores(A, [r for i in range(n) for r in _raices(A, i, b)], cache, procesos)
+        for i in range(n):
+            soluciones.append(_paso_cramer(A, b, i, det_A, compartir, cache))
     
     # Mostrar solución completa
     print("\n" + "=" * 70)
     print("SOLUCIÓN DEL SISTEMA:")
     for i in range(n):
         print(f"x{i+1} = {soluciones[i]}")
+    if cache is not None and cache.fallos + cache.aciertos > 0:
+        print(f"Menores distintos calculados: {cache.fallos}; reutilizados: {cache.aciertos}")
     print("=" * 70)
     
     return soluciones
@@ -3,20 +3,40 @@
 """
 SumayMultiplicaciondeMatrices.py — Operaciones con matrices (Sumar, A×B, A·v)
 UI UAM:
-- Tabs: Sumar | Multiplicar A×B | A·v
+- Tabs: Sumar | Multiplicar A×B | A·v | Aⁿ
 - Controles: Dimensiones, Fracciones exactas, Generar, Ejemplo, Limpiar
 - Resolver (muestra al instante) + Regresar a la derecha (sin botón de pasos)
 """
 
 from __future__ import annotations
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from fractions import Fraction
+from math import gcd
+from multiprocessing import shared_memory
+from operator import mul
 from typing import List, Union
 
+from Freivalds import verificar_producto
+from MatrizDispersa import MatrizCSR, spgemm, spmv, suma_csr
+from Motores import elegir_motor
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
 Number = Union[Fraction, float]
 UI_SCALE = 1.25
 
+# Parámetros de los motores de A×B (flotante); cuál se usa lo decide Motores.
+TAM_BLOQUE = 64          # lado del bloque en k y n
+UMBRAL_STRASSEN = 128    # Strassen-Winograd: bajo este tamaño, producto por bloques
+TAM_TILE = 256           # lado del tile de C que calcula cada trabajador
+
 # --------------------------- utilidades numéricas ---------------------------
 
 def _fmt(x: Number, dec: int = 6) -> str:
@@ -28,11 +48,17 @@ def _fmt(x: Number, dec: int = 6) -> str:
 def _zero(use_frac: bool) -> Number:
     return Fraction(0, 1) if use_frac else 0.0
 
+def _csr(M) -> MatrizCSR:
+    return M if isinstance(M, MatrizCSR) else MatrizCSR.desde_densa(M)
+
 def suma_matrices(A: List[List[Number]], B: List[List[Number]]) -> List[List[Number]]:
+    """A + B. Si alguna es MatrizCSR, la suma es dispersa y devuelve MatrizCSR."""
+    if isinstance(A, MatrizCSR) or isinstance(B, MatrizCSR):
+        return suma_csr(_csr(A), _csr(B))
     m, n = len(A), len(A[0])
     return [[A[i][j] + B[i][j] for j in range(n)] for i in range(m)]
 
-def mult_matrices(A: List[List[Number]], B: List[List[Number]]) -> List[List[Number]]:
+def _mult_clasico(A: List[List[Number]], B: List[List[Number]]) -> List[List[Number]]:
     m, k, n = len(A), len(A[0]), len(B[0])
     use_frac = isinstance(A[0][0], Fraction) or isinstance(B[0][0], Fraction)
     C = []
@@ -46,7 +72,179 @@ def mult_matrices(A: List[List[Number]], B: List[List[Number]]) -> List[List[Num
         C.append(row)
     return C
 
+def _mult_bloques(A: List[List[float]], B: List[List[float]], bloque: int = TAM_BLOQUE) -> List[List[float]]:
+    """Producto por bloques de k sobre buffers contiguos: B se transpone una vez y
+    cada C[i][j] acumula el producto punto de los tramos A[i, t0:t1] y Bᵀ[j, t0:t1]."""
+    m, k, n = len(A), len(A[0]), len(B[0])
+    Bt = [list(col) for col in zip(*B)]
+    C = [[0.0] * n for _ in range(m)]
+    for t0 in range(0, k, bloque):
+        t1 = min(t0 + bloque, k)
+        Bblk = [col[t0:t1] for col in Bt]
+        for i in range(m):
+            a = A[i][t0:t1]
+            C[i] = [c + sum(map(mul, a, b)) for c, b in zip(C[i], Bblk)]
+    return C
+
+def _sum(X: List[List[float]], Y: List[List[float]]) -> List[List[float]]:
+    return [[x + y for x, y in zip(rx, ry)] for rx, ry in zip(X, Y)]
+
+def _res(X: List[List[float]], Y: List[List[float]]) -> List[List[float]]:
+    return [[x - y for x, y in zip(rx, ry)] for rx, ry in zip(X, Y)]
+
+def _strassen(A: List[List[float]], B: List[List[float]], umbral: int = UMBRAL_STRASSEN) -> List[List[float]]:
+    """Strassen-Winograd (7 productos, 15 sumas) para matrices cuadradas.
+    Por debajo del umbral delega en el producto por bloques."""
+    n = len(A)
+    if n <= umbral:
+        return _mult_bloques(A, B)
+    if n % 2:
+        # relleno con una fila/columna de ceros para partir en mitades
+        A = [r + [0.0] for r in A] + [[0.0] * (n + 1)]
+        B = [r + [0.0] for r in B] + [[0.0] * (n + 1)]
+        C = _strassen(A, B, umbral)
+        return [r[:n] for r in C[:n]]
+    h = n // 2
+    A11 = [r[:h] for r in A[:h]]; A12 = [r[h:] for r in A[:h]]
+    A21 = [r[:h] for r in A[h:]]; A22 = [r[h:] for r in A[h:]]
+    B11 = [r[:h] for r in B[:h]]; B12 = [r[h:] for r in B[:h]]
+    B21 = [r[:h] for r in B[h:]]; B22 = [r[h:] for r in B[h:]]
+
+    S1 = _sum(A21, A22); S2 = _res(S1, A11); S3 = _res(A11, A21); S4 = _res(A12, S2)
+    T1 = _res(B12, B11); T2 = _res(B22, T1); T3 = _res(B22, B12); T4 = _res(T2, B21)
+
+    M1 = _strassen(A11, B11, umbral); M2 = _strassen(A12, B21, umbral)
+    M3 = _strassen(S4, B22, umbral);  M4 = _strassen(A22, T4, umbral)
+    M5 = _strassen(S1, T1, umbral);   M6 = _strassen(S2, T2, umbral)
+    M7 = _strassen(S3, T3, umbral)
+
+    C11 = _sum(M1, M2)
+    U2 = _sum(M1, M6); U3 = _sum(U2, M7); U4 = _sum(U2, M5)
+    C12 = _sum(U4, M3); C21 = _res(U3, M4); C22 = _sum(U3, M5)
+    return [r1 + r2 for r1, r2 in zip(C11, C12)] + [r1 + r2 for r1, r2 in zip(C21, C22)]
+
+def _mult_disperso(A: List[List[Number]], B: List[List[Number]]) -> List[List[Number]]:
+    return spgemm(_csr(A), _csr(B)).a_densa()
+
+def _mult_numpy(A: List[List[float]], B: List[List[float]]) -> List[List[float]]:
+    return (np.array(A, dtype=float) @ np.array(B, dtype=float)).tolist()
+
+# --------------------------- producto paralelo (memoria compartida) ---------------------------
+
+def _tile_paralelo(nombres: tuple, m: int, k: int, n: int, i0: int, i1: int, j0: int, j1: int) -> None:
+    """Trabajador: calcula C[i0:i1, j0:j1] leyendo A, Bᵀ y escribiendo C en memoria compartida."""
+    segs = [shared_memory.SharedMemory(name=nom) for nom in nombres]
+    try:
+        bufA, bufBt, bufC = (seg.buf.cast("d") for seg in segs)
+        try:
+            if np is not None:
+                a = np.ndarray((m, k), dtype=float, buffer=bufA)
+                bt = np.ndarray((n, k), dtype=float, buffer=bufBt)
+                c = np.ndarray((m, n), dtype=float, buffer=bufC)
+                c[i0:i1, j0:j1] = a[i0:i1] @ bt[j0:j1].T
+                del a, bt, c
+            else:
+                cols = [bufBt[j * k:(j + 1) * k].tolist() for j in range(j0, j1)]
+                for i in range(i0, i1):
+                    fila = bufA[i * k:(i + 1) * k].tolist()
+                    bufC[i * n + j0:i * n + j1] = array("d", [sum(map(mul, fila, col)) for col in cols])
+        finally:
+            bufA.release(); bufBt.release(); bufC.release()
+    finally:
+        for seg in segs:
+            seg.close()
+
+def mult_matrices_paralelo(A: List[List[float]], B: List[List[float]],
+                           procesos: int | None = None, tile: int = TAM_TILE) -> List[List[float]]:
+    """A×B flotante repartiendo C en tiles entre un pool de procesos.
+    A, Bᵀ y C viven en multiprocessing.shared_memory: a cada trabajador solo se le
+    envían los nombres de los segmentos y los límites de su tile, y escribe en C in situ."""
+    m, k, n = len(A), len(A[0]), len(B[0])
+    procesos = procesos or os.cpu_count() or 1
+    segs = []
+    try:
+        for tam in (m * k, n * k, m * n):
+            segs.append(shared_memory.SharedMemory(create=True, size=max(1, tam) * 8))
+        bufA, bufBt, bufC = (seg.buf.cast("d") for seg in segs)
+        try:
+            for i, fila in enumerate(A):
+                bufA[i * k:(i + 1) * k] = array("d", fila)
+            for j, col in enumerate(zip(*B)):
+                bufBt[j * k:(j + 1) * k] = array("d", col)
+
+            nombres = tuple(seg.name for seg in segs)
+            tiles = [(i0, min(i0 + tile, m), j0, min(j0 + tile, n))
+                     for i0 in range(0, m, tile) for j0 in range(0, n, tile)]
+            with ProcessPoolExecutor(max_workers=min(procesos, len(tiles))) as pool:
+                pendientes = [pool.submit(_tile_paralelo, nombres, m, k, n, *t) for t in tiles]
+                for f in pendientes:
+                    f.result()
+            return [bufC[i * n:(i + 1) * n].tolist() for i in range(m)]
+        finally:
+            bufA.release(); bufBt.release(); bufC.release()
+    finally:
+        for seg in segs:
+            seg.close()
+            seg.unlink()
+
+def motor_mult(A: List[List[Number]], B: List[List[Number]], motor: str | None = None) -> str:
+    """Motor de A×B de menor costo estimado según tipo, tamaño y densidad (Motores):
+    exacto | clasico | bloques | strassen | numpy | paralelo | disperso."""
+    return elegir_motor("mult", A, B, motor=motor).motor
+
+_MOTORES_MULT = {
+    "exacto": _mult_clasico,
+    "clasico": _mult_clasico,
+    "bloques": _mult_bloques,
+    "strassen": _strassen,
+    "numpy": _mult_numpy,
+    "paralelo": mult_matrices_paralelo,
+    "disperso": _mult_disperso,
+}
+
+def mult_matrices(A: List[List[Number]], B: List[List[Number]], motor: str | None = None) -> List[List[Number]]:
+    """A×B. Sin `motor` se elige automáticamente (ver motor_mult).
+    Si A o B es MatrizCSR el producto es disperso (SpGEMM) y devuelve MatrizCSR."""
+    if isinstance(A, MatrizCSR) or isinstance(B, MatrizCSR):
+        return spgemm(_csr(A), _csr(B))
+    motor = motor_mult(A, B, motor)
+    if motor == "numpy" and np is None:
+        raise ValueError("NumPy no está instalado.")
+    if motor == "strassen" and not (len(A) == len(A[0]) == len(B[0])):
+        motor = "bloques"
+    return _MOTORES_MULT[motor](A, B)
+
+def benchmark_mult(tamanos=(8, 16, 32, 64, 128, 256, 512), max_clasico: int = 256) -> None:
+    """Mide cada motor de A×B (flotante, n×n aleatorias) e imprime los puntos de cruce.
+    Uso: python SumayMultiplicaciondeMatrices.py --bench"""
+    import random
+    import time
+
+    motores = ["clasico", "bloques", "strassen"] + (["numpy"] if np is not None else [])
+    print(f"{'n':>6}" + "".join(f"{m:>12}" for m in motores) + "   más rápido")
+    previo = None
+    for n in tamanos:
+        A = [[random.random() for _ in range(n)] for _ in range(n)]
+        B = [[random.random() for _ in range(n)] for _ in range(n)]
+        tiempos = {}
+        for motor in motores:
+            if motor == "clasico" and n > max_clasico:
+                continue
+            t = time.perf_counter()
+            if motor == "strassen":
+                _strassen(A, B, umbral=max(1, n // 2))  # un nivel de recursión
+            else:
+                _MOTORES_MULT[motor](A, B)
+            tiempos[motor] = time.perf_counter() - t
+        mejor = min(tiempos, key=tiempos.get)
+        celdas = "".join(f"{tiempos[m]:>12.4f}" if m in tiempos else f"{'—':>12}" for m in motores)
+        cruce = f"   {mejor}" + ("  ← cruce" if previo is not None and mejor != previo else "")
+        print(f"{n:>6}" + celdas + cruce)
+        previo = mejor
+
 def mult_matriz_vector(A: List[List[Number]], v: List[Number]) -> List[List[Number]]:
+    if isinstance(A, MatrizCSR):
+        return [[x] for x in spmv(A, v)]
     m, n = len(A), len(A[0])
     use_frac = isinstance(A[0][0], Fraction) or isinstance(v[0], Fraction)
     out = [[_zero(use_frac)] for _ in range(m)]
@@ -57,6 +255,253 @@ def mult_matriz_vector(A: List[List[Number]], v: List[Number]) -> List[List[Numb
         out[i][0] = s
     return out
 
+# --------------------------- potencia Aⁿ ---------------------------
+
+def _identidad(n: int, uno: Number) -> List[List[Number]]:
+    cero = uno - uno
+    return [[uno if i == j else cero for j in range(n)] for i in range(n)]
+
+def _estructura_potencia(A: List[List[Number]]) -> str:
+    """'diagonal' | 'superior' | 'inferior' | 'general' (una pasada)."""
+    n = len(A)
+    sup = all(A[i][j] == 0 for i in range(n) for j in range(i))
+    inf = all(A[i][j] == 0 for i in range(n) for j in range(i + 1, n))
+    if sup and inf: return "diagonal"
+    if sup: return "superior"
+    if inf: return "inferior"
+    return "general"
+
+def _mult_triangular(A: List[List[Number]], B: List[List[Number]], superior: bool) -> List[List[Number]]:
+    """Producto de triangulares del mismo tipo: solo recorre t entre i y j (≈ n³/6)."""
+    n = len(A)
+    cero = A[0][0] - A[0][0]
+    C = [[cero] * n for _ in range(n)]
+    for i in range(n):
+        for j in (range(i, n) if superior else range(i + 1)):
+            ts = range(i, j + 1) if superior else range(j, i + 1)
+            C[i][j] = sum((A[i][t] * B[t][j] for t in ts), cero)
+    return C
+
+def _mult_enteros(A: List[List[int]], B: List[List[int]]) -> List[List[int]]:
+    Bt = [list(col) for col in zip(*B)]
+    return [[sum(map(mul, fila, col)) for col in Bt] for fila in A]
+
+def _potencia_binaria(A, e: int, mult, uno) -> tuple:
+    """Exponenciación por cuadrados; devuelve (Aᵉ, cantidad de productos)."""
+    R, P, productos = None, A, 0
+    while e:
+        if e & 1:
+            if R is None:
+                R = P
+            else:
+                R = mult(R, P); productos += 1
+        e >>= 1
+        if e:
+            P = mult(P, P); productos += 1
+    return (R if R is not None else _identidad(len(A), uno)), productos
+
+def potencia_matriz(A: List[List[Number]], e: int) -> tuple:
+    """Aᵉ (A cuadrada, e ≥ 0) por cuadrados sucesivos: O(log e) productos.
+    Devuelve (Aᵉ, productos, estrategia). Atajos:
+    • diagonal → potencia de cada elemento de la diagonal (sin productos)
+    • triangular → producto que solo recorre la mitad no nula
+    • fracciones exactas → A = M/d con M entera; se eleva M con enteros y se divide por dᵉ"""
+    n = len(A)
+    if n != len(A[0]):
+        raise ValueError("Para Aⁿ, A debe ser cuadrada.")
+    if not isinstance(e, int) or e < 0:
+        raise ValueError("El exponente debe ser un entero ≥ 0.")
+    exacta = all(isinstance(x, Fraction) for fila in A for x in fila)
+    uno: Number = Fraction(1) if exacta else 1.0
+    estructura = _estructura_potencia(A)
+
+    if estructura == "diagonal":
+        cero = uno - uno
+        return [[A[i][i] ** e if i == j else cero for j in range(n)] for i in range(n)], 0, "diagonal"
+
+    if exacta:
+        d = 1
+        for fila in A:
+            for x in fila:
+                d = d * x.denominator // gcd(d, x.denominator)
+        M = [[int(x * d) for x in fila] for fila in A]
+        if estructura == "general":
+            P, k = _potencia_binaria(M, e, _mult_enteros, 1)
+        else:
+            P, k = _potencia_binaria(M, e, lambda X, Y: _mult_triangular(X, Y, estructura == "superior"), 1)
+        de = d ** e
+        return [[Fraction(x, de) for x in fila] for fila in P], k, f"enteros ({estructura})"
+
+    if estructura != "general":
+        P, k = _potencia_binaria(A, e, lambda X, Y: _mult_triangular(X, Y, estructura == "superior"), uno)
+        return P, k, estructura
+    P, k = _potencia_binaria(A, e, mult_matrices, uno)
+    return P, k, "general"
+
+# --------------------------- expresiones diferidas ---------------------------
+# A + B, A @ B y A @ v construyen un grafo; evaluar() lo optimiza y luego calcula:
+#   • sumas encadenadas → una sola pasada sin matrices intermedias
+#   • cadenas de productos → paréntesis óptimos (DP de cadena de matrices), lo que
+#     incluye reescribir (A @ B) @ v como A @ (B @ v)
+
+class Expr:
+    forma: tuple  # (filas, columnas); un vector es (n, 1)
+
+    def __add__(self, otra) -> "Expr":
+        otra = diferida(otra)
+        if self.forma != otra.forma:
+            raise ValueError("Para sumar, A y B deben tener la misma dimensión.")
+        if self.es_vector or otra.es_vector:         # una matriz n×1 se suma como vector
+            return Suma([_como_vector(self), _como_vector(otra)])
+        return Suma([self, otra])
+
+    def __radd__(self, otra) -> "Expr":
+        if isinstance(otra, int) and otra == 0:      # sum([...]) empieza en 0
+            return self
+        return diferida(otra) + self
+
+    def __matmul__(self, otra) -> "Expr":
+        otra = diferida(otra)
+        if isinstance(self, Vector):
+            raise ValueError("Un vector solo puede ir a la derecha de un producto.")
+        if self.forma[1] != otra.forma[0]:
+            raise ValueError("Para A×B, columnas de A = filas de B.")
+        return Producto([self, otra])
+
+    def __rmatmul__(self, otra) -> "Expr":
+        return diferida(otra) @ self
+
+    @property
+    def es_vector(self) -> bool:
+        if isinstance(self, Producto):
+            return self.factores[-1].es_vector
+        if isinstance(self, _Mult):
+            return self.der.es_vector
+        if isinstance(self, Suma):
+            return self.terminos[0].es_vector
+        return isinstance(self, Vector)
+
+    def plan(self) -> str:
+        """Orden de evaluación tras optimizar, p. ej. '(A @ (B @ v))'."""
+        return _plan(optimizar(self))
+
+    def evaluar(self) -> List[List[Number]]:
+        """Optimiza y evalúa. Los resultados vectoriales se devuelven como columna m×1."""
+        r = _evaluar(optimizar(self))
+        return [[x] for x in r] if self.es_vector else r
+
+class Matriz(Expr):
+    def __init__(self, M: List[List[Number]], nombre: str = "M"):
+        self.valor, self.nombre = M, nombre
+        self.forma = (len(M), len(M[0]))
+
+class Vector(Expr):
+    def __init__(self, v: List[Number], nombre: str = "v"):
+        self.valor, self.nombre = v, nombre
+        self.forma = (len(v), 1)
+
+class Suma(Expr):
+    def __init__(self, terminos: List[Expr]):
+        self.terminos = terminos
+        self.forma = terminos[0].forma
+
+class Producto(Expr):
+    def __init__(self, factores: List[Expr]):
+        self.factores = factores
+        self.forma = (factores[0].forma[0], factores[-1].forma[1])
+
+class _Mult(Expr):
+    """Producto binario ya parentizado (solo aparece tras optimizar)."""
+    def __init__(self, izq: Expr, der: Expr):
+        self.izq, self.der = izq, der
+        self.forma = (izq.forma[0], der.forma[1])
+
+def diferida(x, nombre: str | None = None) -> Expr:
+    """Envuelve una matriz (lista de listas) o un vector (lista) en una expresión diferida."""
+    if isinstance(x, Expr):
+        return x
+    if x and isinstance(x[0], list):
+        return Matriz(x, nombre or "M")
+    return Vector(x, nombre or "v")
+
+def _como_vector(e: Expr) -> Expr:
+    """La misma expresión con las matrices n×1 que dan su resultado como vectores."""
+    if isinstance(e, Matriz) and e.forma[1] == 1:
+        return Vector([fila[0] for fila in e.valor], e.nombre)
+    if isinstance(e, Suma):
+        return Suma([_como_vector(t) for t in e.terminos])
+    if isinstance(e, Producto):
+        return Producto(e.factores[:-1] + [_como_vector(e.factores[-1])])
+    return e
+
+def optimizar(e: Expr) -> Expr:
+    """Aplana sumas y productos anidados y parentiza cada cadena de productos."""
+    if isinstance(e, Suma):
+        terminos: List[Expr] = []
+        for t in e.terminos:
+            t = optimizar(t)
+            terminos.extend(t.terminos if isinstance(t, Suma) else [t])
+        return Suma(terminos)
+    if isinstance(e, Producto):
+        factores: List[Expr] = []
+        for f in e.factores:
+            factores.extend(_aplanar_producto(f))
+        return _parentizar([optimizar(f) for f in factores])
+    return e
+
+def _aplanar_producto(e: Expr) -> List[Expr]:
+    if isinstance(e, Producto):
+        return [g for f in e.factores for g in _aplanar_producto(f)]
+    return [e]
+
+def _parentizar(factores: List[Expr]) -> Expr:
+    """DP clásica de cadena de matrices: minimiza las multiplicaciones escalares."""
+    k = len(factores)
+    dims = [factores[0].forma[0]] + [f.forma[1] for f in factores]
+    costo = [[0] * k for _ in range(k)]
+    corte = [[0] * k for _ in range(k)]
+    for largo in range(2, k + 1):
+        for i in range(k - largo + 1):
+            j = i + largo - 1
+            costo[i][j] = None
+            for c in range(i, j):
+                q = costo[i][c] + costo[c + 1][j] + dims[i] * dims[c + 1] * dims[j + 1]
+                if costo[i][j] is None or q < costo[i][j]:
+                    costo[i][j], corte[i][j] = q, c
+
+    def armar(i: int, j: int) -> Expr:
+        if i == j:
+            return factores[i]
+        c = corte[i][j]
+        return _Mult(armar(i, c), armar(c + 1, j))
+    return armar(0, k - 1)
+
+def _evaluar(e: Expr):
+    """Evalúa un árbol optimizado. Los vectores viajan como listas planas."""
+    if isinstance(e, (Matriz, Vector)):
+        return e.valor
+    if isinstance(e, _Mult):
+        izq, der = _evaluar(e.izq), _evaluar(e.der)
+        if e.der.es_vector:
+            return [r[0] for r in mult_matriz_vector(izq, der)]
+        return mult_matrices(izq, der)
+    if isinstance(e, Suma):
+        valores = [_evaluar(t) for t in e.terminos]
+        if e.es_vector:
+            return [sum(xs) for xs in zip(*valores)]
+        # suma fusionada: cada celda se acumula una sola vez sobre todos los términos
+        return [[sum(xs) for xs in zip(*filas)] for filas in zip(*valores)]
+    raise TypeError(f"Expresión no soportada: {type(e).__name__}")
+
+def _plan(e: Expr) -> str:
+    if isinstance(e, (Matriz, Vector)):
+        return e.nombre
+    if isinstance(e, _Mult):
+        return f"({_plan(e.izq)} @ {_plan(e.der)})"
+    if isinstance(e, Suma):
+        return "(" + " + ".join(_plan(t) for t in e.terminos) + ")"
+    return "?"
+
 # --------------------------- UI: vista principal ----------------------------
 
 class OpsView(ttk.Frame):
@@ -109,6 +554,7 @@ class OpsView(ttk.Frame):
         self.m_sum = tk.IntVar(value=2); self.n_sum = tk.IntVar(value=2)
         self.m_ab  = tk.IntVar(value=2); self.k_ab = tk.IntVar(value=2); self.n_ab = tk.IntVar(value=2)
         self.m_av  = tk.IntVar(value=3); self.n_av = tk.IntVar(value=2)
+        self.n_pot = tk.IntVar(value=2); self.e_pot = tk.IntVar(value=5)
 
         self.gridA: List[List[tk.Entry]] = []
         self.gridB: List[List[tk.Entry]] = []
@@ -137,7 +583,10 @@ class OpsView(ttk.Frame):
                                   command=lambda: self._switch_tab(2))
         self.btn_sum.grid(row=0, column=0, padx=(0, 6))
         self.btn_axb.grid(row=0, column=1, padx=6)
+        self.btn_pot = ttk.Button(tabs, text="Aⁿ", style="Tab.TButton",
+                                  command=lambda: self._switch_tab(3))
         self.btn_av.grid(row=0, column=2, padx=6)
+        self.btn_pot.grid(row=0, column=3, padx=6)
 
         # Controles superiores (dimensiones + fracciones + botones)
         ctrl_shadow = tk.Frame(root, bg="#dfe7fb"); ctrl_shadow.pack(fill="x", pady=(10,0))
@@ -191,7 +640,7 @@ class OpsView(ttk.Frame):
             ttk.Spinbox(self.ctrl, from_=1, to=12, width=4, textvariable=self.n_ab,
                         command=self._generate).grid(row=0, column=7)
             frac_cb.grid(row=0, column=8, padx=(16,10))
-        else:
+        elif t == 2:
             ttk.Label(self.ctrl, text="A (m×n):", style="Sec.TLabel").grid(row=0, column=0, padx=(0,8))
             ttk.Spinbox(self.ctrl, from_=1, to=12, width=4, textvariable=self.m_av,
                         command=self._generate).grid(row=0, column=1)
@@ -199,6 +648,13 @@ class OpsView(ttk.Frame):
             ttk.Spinbox(self.ctrl, from_=1, to=12, width=4, textvariable=self.n_av,
                         command=self._generate).grid(row=0, column=3)
             frac_cb.grid(row=0, column=4, padx=(16,10))
+        else:
+            ttk.Label(self.ctrl, text="A (n×n):", style="Sec.TLabel").grid(row=0, column=0, padx=(0,8))
+            ttk.Spinbox(self.ctrl, from_=1, to=12, width=4, textvariable=self.n_pot,
+                        command=self._generate).grid(row=0, column=1)
+            ttk.Label(self.ctrl, text="Exponente:", style="Sec.TLabel").grid(row=0, column=2, padx=(16,8))
+            ttk.Spinbox(self.ctrl, from_=0, to=10**6, width=7, textvariable=self.e_pot).grid(row=0, column=3)
+            frac_cb.grid(row=0, column=4, padx=(16,10))
 
         # Botones solicitados (a la derecha)
         ttk.Button(self.ctrl, text="Generar", style="Ghost.TButton",
@@ -253,7 +709,7 @@ class OpsView(ttk.Frame):
             ttk.Button(self.left, text="Regresar", style="Ghost.TButton",
                        command=self._back).grid(row=2, column=1, pady=(12,0), padx=(12,0), sticky="w")
 
-        else:
+        elif t == 2:
             labA, labV, labR = "Matriz A (m×n)", "Vector v (n×1)", "Resultado (m×1)"
             m, n = self.m_av.get(), self.n_av.get()
             a_frame = ttk.Frame(self.left, style="Card.TFrame"); a_frame.grid(row=1, column=0, sticky="nw")
@@ -272,6 +728,21 @@ class OpsView(ttk.Frame):
             ttk.Button(self.left, text="Regresar", style="Ghost.TButton",
                        command=self._back).grid(row=2, column=1, pady=(12,0), padx=(12,0), sticky="w")
 
+        else:
+            n = self.n_pot.get()
+            a_frame = ttk.Frame(self.left, style="Card.TFrame"); a_frame.grid(row=1, column=0, sticky="nw")
+            r_frame = ttk.Frame(self.left, style="Card.TFrame"); r_frame.grid(row=1, column=1, sticky="nw", padx=(24,0))
+            ttk.Label(self.left, text="Matriz A (n×n)", style="Sec.TLabel").grid(row=0, column=0, sticky="w")
+            ttk.Label(self.left, text="Resultado Aⁿ", style="Sec.TLabel").grid(row=0, column=1, sticky="w", padx=(24,0))
+
+            self.gridA = self._build_grid(a_frame, n, n)
+            self.gridR = self._build_table(r_frame, n, n)
+
+            ttk.Button(self.left, text="Resolver", style="Primary.TButton",
+                       command=self._solve).grid(row=2, column=0, pady=(12,0), sticky="w")
+            ttk.Button(self.left, text="Regresar", style="Ghost.TButton",
+                       command=self._back).grid(row=2, column=1, pady=(12,0), padx=(12,0), sticky="w")
+
     # ----------------------- helpers de UI -------------------------
     def _build_grid(self, parent, rows: int, cols: int) -> List[List[tk.Entry]]:
         grid = []
@@ -350,8 +821,9 @@ class OpsView(ttk.Frame):
         # reconstruir panel izquierdo
         for w in self.left.winfo_children(): w.destroy()
         self._render_left_for_tab(t)
-        for b in (self.btn_sum, self.btn_axb, self.btn_av): b.state(["!disabled"])
-        (self.btn_sum if t==0 else self.btn_axb if t==1 else self.btn_av).state(["disabled"])
+        tabs = (self.btn_sum, self.btn_axb, self.btn_av, self.btn_pot)
+        for b in tabs: b.state(["!disabled"])
+        tabs[t].state(["disabled"])
         self._log("Listo para operar.\n", clear=True)
 
     def _generate(self):
@@ -385,6 +857,14 @@ class OpsView(ttk.Frame):
                 for j in range(2):
                     self.gridB[i][j].delete(0,"end"); self.gridB[i][j].insert(0,str(B[i][j]))
             self._log("Ejemplo cargado: A(2×3) × B(3×2).", clear=True)
+        elif t == 3:
+            self.n_pot.set(2); self.e_pot.set(10)
+            self._generate()
+            A = [[1,1],[1,0]]
+            for i in range(2):
+                for j in range(2):
+                    self.gridA[i][j].delete(0,"end"); self.gridA[i][j].insert(0,str(A[i][j]))
+            self._log("Ejemplo cargado: matriz de Fibonacci, A¹⁰.", clear=True)
         else:
             self.m_av.set(3); self.n_av.set(2)
             self._generate()
@@ -427,11 +907,25 @@ class OpsView(ttk.Frame):
                 B = self._read_matrix(self.gridB)
                 if len(A[0]) != len(B):
                     raise ValueError("Para A×B, columnas de A = filas de B.")
-                C = mult_matrices(A,B)
+                motor = motor_mult(A, B)
+                C = mult_matrices(A, B, motor=motor)
                 self._set_table(self.gridR, C)
                 self._log("Multiplicando matrices A × B …", clear=True)
+                self._log(f"Motor: {motor}")
+                ver = verificar_producto(A, B, C)
+                self._log(f"Verificación de Freivalds ({ver.rondas} rondas, O(n²)): " +
+                          ("correcto ✔" if ver.ok else "¡el resultado NO coincide con A×B!"))
                 self._log("Resultado (A × B):")
                 for r in C: self._log("[ " + "  ".join(_fmt(x) for x in r) + " ]")
+            elif t == 3:
+                A = self._read_matrix(self.gridA)
+                e = int(self.e_pot.get())
+                C, productos, estrategia = potencia_matriz(A, e)
+                self._set_table(self.gridR, C)
+                self._log(f"Calculando A^{e} por cuadrados sucesivos …", clear=True)
+                self._log(f"Estrategia: {estrategia} — {productos} producto(s) de matrices (en vez de {max(e-1, 0)}).")
+                self._log(f"Resultado (A^{e}):")
+                for r in C: self._log("[ " + "  ".join(_fmt(x) for x in r) + " ]")
             else:
                 A = self._read_matrix(self.gridA)
                 v = self._read_vector(self.gridV)
@@ -457,6 +951,10 @@ def mount_ops(parent, on_back=None):
     return view
 
 if __name__ == "__main__":
+    import sys
+    if "--bench" in sys.argv:
+        benchmark_mult()
+        sys.exit()
     root = tk.Tk()
     try: root.state("zoomed")
     except Exception: pass
@@ -14,14 +14,18 @@ Coherente con el estilo de tus otras vistas:
 from __future__ import annotations
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import List
+from math import gcd
+from typing import List, Tuple
+
+from AritmeticaModular import rango_modular
 
 Number = float | int
 UI_SCALE = 1.25
+UMBRAL_MODULAR = 48        # min(n, p) desde el que el rango se calcula mod primos (certificado)
 
 
 # --------------------- utilidades numéricas ---------------------
-def _fmt(x: Number) -> str:
+def _fmt(x: Number | str) -> str:
     if isinstance(x, float) and abs(x - round(x)) < 1e-12:
         x = int(round(x))
     return str(x)
@@ -117,6 +121,121 @@ def _limpiar(M: List[List[Number]]) -> None:
             elif isinstance(x, float) and abs(x - round(x)) < 1e-12:
                 M[i][j] = int(round(x))
 
+# --------------------- camino entero exacto ---------------------
+def _racional(a: int, d: int) -> str:
+    """a/d reducido como texto ('3', '-1/2'), solo con enteros."""
+    if d < 0:
+        a, d = -a, -d
+    g = gcd(a, d)
+    a, d = a // g, d // g
+    return str(a) if d == 1 else f"{a}/{d}"
+
+def _rref_entera(M: List[List[int]], log: List[str]) -> int:
+    """Gauss-Jordan libre de fracciones (Bareiss) sobre enteros, en sitio.
+    Cada actualización F_i = (p·F_i − a_ic·F_r) / d es una división exacta (d es el
+    pivote anterior), así que todo se queda en int. Al terminar, todos los pivotes
+    valen el último pivote D y la RREF es M / D. Devuelve D."""
+    n_f = len(M)
+    n_c = len(M[0]) - 1
+    d = 1
+    r = 0
+    paso = 1
+    log.append("\n================= ELIMINACIÓN ENTERA (SIN FRACCIONES) =================")
+    for c in range(n_c):
+        if r >= n_f:
+            break
+        sel = next((k for k in range(r, n_f) if M[k][c] != 0), None)
+        if sel is None:
+            continue
+        if sel != r:
+            M[r], M[sel] = M[sel], M[r]
+            log.append(f"\nPaso {paso}: Intercambiamos F{r+1} ↔ F{sel+1}")
+            log.append("Resultado del intercambio:\n" + _imprimir_matriz_txt(M))
+            paso += 1
+        piv = M[r][c]
+        fila_p = M[r]
+        for k in range(n_f):
+            fac = M[k][c]
+            if k == r or (fac == 0 and piv == d):
+                continue
+            fila = M[k]
+            for j in range(c, n_c + 1):
+                fila[j] = (piv * fila[j] - fac * fila_p[j]) // d
+            for j in range(c):
+                fila[j] = piv * fila[j] // d
+            if fac != 0:
+                op = f"{piv}·F{k+1} - ({fac})·F{r+1}"
+                log.append(f"Paso {paso}: F{k+1} = " + (f"({op}) / {d}" if d != 1 else op))
+            else:
+                log.append(f"Paso {paso}: F{k+1} = ({piv}/{d})·F{k+1}  (mismo denominador común)")
+            log.append("Resultado:\n" + _imprimir_matriz_txt(M))
+            paso += 1
+        d = piv
+        r += 1
+    return d
+
+def rango_vectores(vectores: List[List[int]], certificado: bool = False
+                   ) -> Tuple[int, List[int] | None]:
+    """Rango de {v₁…vₚ} ⊂ ℤⁿ solo con eliminación hacia adelante (Bareiss, enteros).
+    • Termina en cuanto el rango llega a p o no quedan filas no nulas.
+    • Las filas que se anulan dejan de procesarse.
+    • certificado=True y vectores dependientes → x entero no nulo con Σ xⱼ·vⱼ = 0
+      (en otro caso el segundo valor es None).
+    • Conjuntos grandes sin certificado: rango multimodular; si alcanza min(n, p)
+      queda demostrado, si no se confirma con eliminación entera exacta.
+    Devuelve (rango, certificado)."""
+    p = len(vectores)
+    if p == 0:
+        return 0, None
+    n = len(vectores[0])
+    if not certificado and min(n, p) >= UMBRAL_MODULAR:
+        return rango_modular([[v[i] for v in vectores] for i in range(n)], certificar=True).rango, None
+    vivas = [[v[i] for v in vectores] for i in range(n)]     # filas de A = [v₁ … vₚ]
+    vivas = [f for f in vivas if any(f)]
+    escalon: List[Tuple[int, List[int]]] = []                 # (columna pivote, fila)
+    d = 1
+    libre = -1
+    for c in range(p):
+        if len(escalon) == p or not vivas:
+            break
+        sel = next((k for k, f in enumerate(vivas) if f[c] != 0), None)
+        if sel is None:
+            if libre < 0: libre = c
+            continue
+        fila_p = vivas.pop(sel)
+        piv = fila_p[c]
+        siguientes = []
+        for f in vivas:
+            fac = f[c]
+            for j in range(c, p):
+                f[j] = (piv * f[j] - fac * fila_p[j]) // d
+            if any(f[c + 1:]):
+                siguientes.append(f)
+        vivas = siguientes
+        escalon.append((c, fila_p))
+        d = piv
+    r = len(escalon)
+    if r == p or not certificado:
+        return r, None
+
+    # x_libre = 1, resto de libres = 0; regresiva con denominador común entero
+    if libre < 0:
+        pivs = {c for c, _ in escalon}
+        libre = next(c for c in range(p) if c not in pivs)
+    x = [0] * p
+    x[libre] = 1
+    for c, f in reversed(escalon):
+        s = -sum(f[j] * x[j] for j in range(c + 1, p))
+        g = gcd(s, f[c])
+        escala = abs(f[c] // g)
+        if escala != 1:
+            x = [v * escala for v in x]
+        x[c] = s // g * (1 if f[c] > 0 else -1)
+    g = 0
+    for v in x: g = gcd(g, v)
+    signo = -1 if x[next(j for j in range(p) if x[j])] < 0 else 1
+    return r, [signo * v // g for v in x]
+
 def _rango(M: List[List[Number]]) -> int:
     n_c = len(M[0]) - 1
     r = 0
@@ -186,6 +305,8 @@ class VectorValidacionView(ttk.Frame):
         ttk.Button(ctrl, text="Generar", style="Ghost.TButton", command=self._generar).grid(row=0, column=4, padx=4)
         ttk.Button(ctrl, text="Ejemplo", style="Ghost.TButton", command=self._ejemplo).grid(row=0, column=5, padx=4)
         ttk.Button(ctrl, text="Limpiar",  style="Ghost.TButton", command=self._limpiar).grid(row=0, column=6, padx=4)
+        self.var_solo_rango = tk.BooleanVar(value=False)
+        ttk.Checkbutton(ctrl, text="Solo rango", variable=self.var_solo_rango).grid(row=0, column=7, padx=(12, 0))
 
         # área principal
         area = tk.Frame(root, bg=self.bg); area.pack(fill="both", expand=True, pady=(14,0))
@@ -345,14 +466,23 @@ class VectorValidacionView(ttk.Frame):
             messagebox.showerror("Entrada inválida", str(e))
             return
 
+        if self.var_solo_rango.get():
+            self._resolver_rango(M)
+            return
+
         log: List[str] = []
         log.append("Matriz aumentada inicial [A | 0]:\n" + _imprimir_matriz_txt(M))
-        _gauss_adelante(M, log)
-        _retroceso(M, log)
-        _limpiar(M)
+        if all(isinstance(v, int) for fila in M for v in fila):
+            D = _rref_entera(M, log)
+            r = _rango(M)
+            M = [[_racional(v, D) for v in fila] for fila in M]
+        else:
+            _gauss_adelante(M, log)
+            _retroceso(M, log)
+            _limpiar(M)
+            r = _rango(M)
         log.append("\nMatriz aumentada final (RREF):\n" + _imprimir_matriz_txt(M))
 
-        r = _rango(M)
         p = len(M[0]) - 1
         log.append("\n================= ANÁLISIS FINAL =================")
         log.append(f"Rango(A) = {r}")
@@ -368,7 +498,7 @@ class VectorValidacionView(ttk.Frame):
             for fila in M:
                 lhs = []
                 for j, c in enumerate(fila[:-1], start=1):
-                    if abs(c) > 1e-12:
+                    if c != "0" and (isinstance(c, str) or abs(c) > 1e-12):
                         lhs.append(f"{_fmt(c)}·x{j}")
                 ecuaciones.append(" + ".join(lhs) if lhs else "0")
             log.append("\nEcuaciones (RREF):")
@@ -378,6 +508,24 @@ class VectorValidacionView(ttk.Frame):
         self._set_table(self.tbl, M)
         self._set_log("\n".join(log))
 
+    def _resolver_rango(self, M: List[List[int]]):
+        """Modo rápido: solo eliminación hacia adelante, sin RREF."""
+        p = len(M[0]) - 1
+        vectores = [[fila[j] for fila in M] for j in range(p)]
+        r, x = rango_vectores(vectores, certificado=True)
+        log = ["Matriz aumentada inicial [A | 0]:\n" + _imprimir_matriz_txt(M),
+               "\n================= SOLO RANGO =================",
+               f"Rango(A) = {r}",
+               f"Cantidad de vectores p = {p}"]
+        if x is None:
+            log.append("\nConclusión: Los vectores son LINEALMENTE INDEPENDIENTES.")
+        else:
+            comb = " + ".join(f"({c})·v{j+1}" for j, c in enumerate(x) if c != 0)
+            log.append("\nConclusión: Los vectores son LINEALMENTE DEPENDIENTES.")
+            log.append(f"Certificado: {comb} = 0")
+        self._set_table(self.tbl, [])
+        self._set_log("\n".join(log))
+
     # navegación
     def _back(self):
         if callable(self.on_back):
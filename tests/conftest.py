@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""Los módulos del proyecto viven en la raíz del repositorio (sin paquete)."""
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
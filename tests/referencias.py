@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+referencias.py — Caminos de referencia contra los que se comparan los motores
+• det_cofactores: Laplace por la primera fila, sin atajos
+• producto_exacto: A×B triple bucle con Fraction
+• resolver_gauss: gauss_resolver(motor="gauss") con fracciones exactas
+• matrices aleatorias enteras (generales, banda, dispersas, SPD)
+"""
+
+from __future__ import annotations
+import random
+from fractions import Fraction
+from typing import List
+
+
+def fracciones(M) -> List[List[Fraction]]:
+    return [[Fraction(x) for x in fila] for fila in M]
+
+def det_cofactores(A) -> Fraction:
+    n = len(A)
+    if n == 1:
+        return Fraction(A[0][0])
+    det = Fraction(0)
+    for j in range(n):
+        menor = [fila[:j] + fila[j + 1:] for fila in A[1:]]
+        det += (-1) ** j * Fraction(A[0][j]) * det_cofactores(menor)
+    return det
+
+def producto_exacto(A, B) -> List[List[Fraction]]:
+    return [[sum((Fraction(a) * Fraction(b) for a, b in zip(fila, col)), Fraction(0))
+             for col in zip(*B)] for fila in A]
+
+def identidad(n: int) -> List[List[Fraction]]:
+    return [[Fraction(int(i == j)) for j in range(n)] for i in range(n)]
+
+def resolver_gauss(A, b) -> List[Fraction]:
+    from Gauss import gauss_resolver
+    res = gauss_resolver(aumentada(A, b), usar_tol=False, motor="gauss")
+    assert res.estado == "unica"
+    return res.soluciones
+
+def aumentada(A, b) -> List[List[Fraction]]:
+    return [fracciones([fila])[0] + [Fraction(bi)] for fila, bi in zip(A, b)]
+
+def aleatoria(m: int, n: int, rng: random.Random, lo: int = -5, hi: int = 5,
+              densidad: float = 1.0) -> List[List[int]]:
+    return [[rng.randint(lo, hi) if rng.random() < densidad else 0 for _ in range(n)]
+            for _ in range(m)]
+
+def no_singular(n: int, rng: random.Random, **kw) -> List[List[int]]:
+    while True:
+        A = aleatoria(n, n, rng, **kw)
+        if n > 8 or det_cofactores(A) != 0:
+            return A
+
+def banda(n: int, p: int, q: int, rng: random.Random) -> List[List[int]]:
+    """Diagonal dominante (no singular) con p subdiagonales y q superdiagonales."""
+    A = [[rng.randint(-3, 3) if -p <= j - i <= q else 0 for j in range(n)] for i in range(n)]
+    for i in range(n):
+        A[i][i] = 4 * (p + q + 1)
+    return A
+
+def spd(n: int, rng: random.Random) -> List[List[int]]:
+    """MᵀM + n·I: simétrica definida positiva con entradas enteras."""
+    M = aleatoria(n, n, rng, -3, 3)
+    return [[sum(M[t][i] * M[t][j] for t in range(n)) + (n if i == j else 0)
+             for j in range(n)] for i in range(n)]
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Caminos en banda y tridiagonal contra la eliminación general con fracciones."""
+import random
+
+import pytest
+
+from Gauss import _gauss_banda, _gauss_tridiagonal, ancho_de_banda, gauss_resolver
+from referencias import aumentada, banda, det_cofactores, resolver_gauss
+
+
+def _banda_con_intercambios(n, p, q, rng):
+    """Banda sin dominancia diagonal (fuerza intercambios de filas), no singular."""
+    while True:
+        A = [[rng.randint(-4, 4) if -p <= j - i <= q else 0 for j in range(n)] for i in range(n)]
+        if det_cofactores(A) != 0:
+            return A
+
+@pytest.mark.parametrize("n", [1, 2, 9, 30])
+def test_tridiagonal_coincide_con_gauss(n):
+    rng = random.Random(n)
+    A = banda(n, 1, 1, rng)
+    b = [rng.randint(-9, 9) for _ in range(n)]
+    aum = aumentada(A, b)
+    res = _gauss_tridiagonal(aum, usar_tol=False)
+    assert ancho_de_banda(aum) == ((1, 1) if n > 1 else (0, 0))
+    assert res.soluciones == resolver_gauss(A, b)
+    assert list(res.triangular) == gauss_resolver(aum, usar_tol=False, motor="gauss").triangular
+
+@pytest.mark.parametrize("n,p,q", [(10, 2, 1), (12, 1, 3), (20, 3, 2)])
+def test_banda_coincide_con_gauss(n, p, q):
+    rng = random.Random(n * 10 + p)
+    A = banda(n, p, q, rng)
+    b = [rng.randint(-9, 9) for _ in range(n)]
+    res = _gauss_banda(aumentada(A, b), False, p, q)
+    assert res.soluciones == resolver_gauss(A, b)
+
+@pytest.mark.parametrize("p,q", [(1, 1), (2, 1), (2, 2)])
+def test_banda_con_pivoteo_da_la_misma_triangular(p, q):
+    rng = random.Random(p + 3 * q)
+    n = 7
+    A = _banda_con_intercambios(n, p, q, rng)
+    b = [rng.randint(-9, 9) for _ in range(n)]
+    aum = aumentada(A, b)
+    res = _gauss_banda(aum, False, p, q)
+    ref = gauss_resolver(aum, usar_tol=False, motor="gauss")
+    assert res.soluciones == ref.soluciones
+    assert list(res.triangular) == ref.triangular
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""Base incremental contra el rango de Gauss-Jordan exacto sobre los vectores acumulados."""
+import io
+import random
+from fractions import Fraction
+
+import pytest
+
+from BaseIncremental import BaseIncremental, procesar_flujo, vectores_de_texto
+from GaussJordan import rref_with_logs
+from referencias import aleatoria, fracciones
+
+
+def _rango_ref(vectores):
+    A = [[v[i] for v in vectores] + [0] for i in range(len(vectores[0]))]
+    return len(rref_with_logs(fracciones(A), use_tol=False).pivot_cols)
+
+@pytest.mark.parametrize("n,p,r", [(3, 6, 2), (5, 9, 4), (4, 4, 4), (6, 12, 3)])
+def test_flujo_coincide_con_rango_exacto(n, p, r):
+    rng = random.Random(n + p + r)
+    base = aleatoria(r, n, rng, -4, 4)
+    vistos = []
+    b = BaseIncremental()
+    for _ in range(p):
+        coef = [rng.randint(-2, 2) for _ in base]
+        v = [sum(c * x[i] for c, x in zip(coef, base)) for i in range(n)]
+        vistos.append(v)
+        res = b.agregar(v)
+        assert res.rango == _rango_ref(vistos)
+        assert res.independiente == (res.rango > _rango_ref(vistos[:-1] or [[0] * n]))
+        if not res.independiente:
+            # v = Σ c_j·v_j con v_j vectores anteriores de la base
+            assert set(res.combinacion) <= set(b.base)
+            assert [sum((c * vistos[j][i] for j, c in res.combinacion.items()), Fraction(0))
+                    for i in range(n)] == v
+
+def test_texto_y_dimension():
+    lineas = io.StringIO("1 0 1\n# comentario\n\n0, 1/2, 0\n2 1 2\n")
+    res = list(procesar_flujo(vectores_de_texto(lineas)))
+    assert [r.independiente for r in res] == [True, True, False]
+    assert res[2].combinacion == {0: 2, 1: 2}
+    with pytest.raises(ValueError):
+        BaseIncremental(3).agregar([1, 2])
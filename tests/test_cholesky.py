@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Cholesky (LDLᵀ exacta y LLᵀ flotante) contra Gauss con fracciones y cofactores."""
+import random
+from fractions import Fraction
+
+import pytest
+
+from Cholesky import factorizar_cholesky
+from Gauss import _gauss_cholesky
+from MatrizInversa import inverse_with_logs
+from referencias import (aumentada, det_cofactores, fracciones, identidad, producto_exacto,
+                         resolver_gauss, spd)
+
+
+@pytest.mark.parametrize("n", [1, 2, 5, 8])
+def test_ldlt_exacta_resuelve_e_invierte(n):
+    rng = random.Random(n)
+    A = spd(n, rng)
+    b = [rng.randint(-9, 9) for _ in range(n)]
+    F = factorizar_cholesky(fracciones(A))
+    assert F.exacta
+    assert F.resolver(fracciones([b])[0]) == resolver_gauss(A, b)
+    assert producto_exacto(A, F.inversa()) == identidad(n)
+    det = 1
+    for d in F.pivotes:
+        det *= d
+    assert det == det_cofactores(A)
+
+def test_llt_flotante():
+    rng = random.Random(4)
+    A = spd(6, rng)
+    b = [rng.randint(-9, 9) for _ in range(6)]
+    F = factorizar_cholesky([[float(x) for x in f] for f in A])
+    assert not F.exacta
+    x = F.resolver([float(v) for v in b])
+    assert x == pytest.approx([float(v) for v in resolver_gauss(A, b)], rel=1e-9)
+
+def test_no_definida_positiva():
+    assert factorizar_cholesky(fracciones([[1, 2], [2, 1]])) is None
+    assert factorizar_cholesky([[1.0, 2.0], [2.0, 1.0]]) is None
+
+def test_camino_cholesky_de_gauss():
+    rng = random.Random(7)
+    A = spd(6, rng)
+    b = [rng.randint(-9, 9) for _ in range(6)]
+    res = _gauss_cholesky(aumentada(A, b), usar_tol=False)
+    assert res.soluciones == resolver_gauss(A, b)
+    assert all(res.triangular[i][j] == 0 for i in range(6) for j in range(i))
+
+def test_inversa_spd_en_la_vista_muestra_gauss_jordan():
+    A = fracciones([[2, 1], [1, 2]])
+    inv, logs, _ = inverse_with_logs(A, interactivo=True)
+    assert inv == [[Fraction(2, 3), Fraction(-1, 3)], [Fraction(-1, 3), Fraction(2, 3)]]
+    assert not any("Estructura detectada" in linea for linea in logs)
+    assert any(linea.startswith("F2 = F2 -") for linea in logs)
+    inv_directa, logs, _ = inverse_with_logs(A)
+    assert inv_directa == inv and any("Cholesky" in linea for linea in logs)
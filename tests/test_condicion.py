@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Estimador de κ₁(A) contra ‖A‖₁·‖A⁻¹‖₁ exacto (inversa de Gauss-Jordan con fracciones)."""
+import random
+from fractions import Fraction
+
+import pytest
+
+from FactorizacionLU import elegir_precision, estimar_condicion, norma_1
+from Gauss import gauss_resolver
+from MatrizInversa import inverse_with_logs
+from referencias import aumentada, fracciones, no_singular, resolver_gauss
+
+
+def _kappa_exacto(A):
+    Ainv, _, _ = inverse_with_logs(fracciones(A), trazar=False, motor="gauss_jordan")
+    return norma_1(A) * norma_1(Ainv)
+
+def _hilbert(n):
+    return [[Fraction(1, i + j + 1) for j in range(n)] for i in range(n)]
+
+@pytest.mark.parametrize("n", [2, 4, 7, 10])
+def test_estimacion_acota_por_debajo_y_de_cerca(n):
+    A = no_singular(n, random.Random(n))
+    est, ref = estimar_condicion(A), _kappa_exacto(A)
+    assert ref / 3 <= est <= ref * (1 + 1e-9)
+
+def test_elegir_precision():
+    flotante, kappa, F = elegir_precision(fracciones([[2, 1], [1, 3]]))
+    assert flotante and F is not None and kappa == pytest.approx(float(_kappa_exacto([[2, 1], [1, 3]])))
+    flotante, kappa, _ = elegir_precision(_hilbert(12))
+    assert not flotante and kappa > 1e8
+    assert elegir_precision([[1.0, 2.0], [2.0, 4.0]])[:2] == (False, float("inf"))
+    assert elegir_precision([[1, 2, 3]]) == (False, None, None)
+
+def test_la_lu_de_la_estimacion_se_reutiliza():
+    rng = random.Random(5)
+    # filas con denominadores: la LU de A se usa sobre el residuo de las filas escaladas
+    A = [[Fraction(x, i + 2) for x in fila] for i, fila in enumerate(no_singular(6, rng))]
+    b = [Fraction(rng.randint(-9, 9), 5) for _ in range(6)]
+    _, _, F = elegir_precision(fracciones(A))
+    res = gauss_resolver(aumentada(A, b), usar_tol=False, motor="refinado", factor=F)
+    assert res.soluciones == resolver_gauss(A, b)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Cramer con menores compartidos contra Gauss con fracciones y contra Cramer sin compartir."""
+import random
+import re
+from math import comb
+
+import pytest
+
+from Determinantes import CacheMenores
+from ReglaDeCramer import det_por_columna, resolver_sistema_cramer
+from referencias import det_cofactores, fracciones, no_singular, resolver_gauss
+
+
+def _sistema(n, semilla):
+    rng = random.Random(semilla)
+    A = no_singular(n, rng)
+    return fracciones(A), fracciones([[rng.randint(-9, 9) for _ in range(n)]])[0]
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 7])
+def test_compartido_coincide_con_gauss(n, capsys):
+    A, b = _sistema(n, n)
+    assert resolver_sistema_cramer(A, b) == resolver_gauss(A, b)
+    assert resolver_sistema_cramer(A, b, compartir=False) == resolver_gauss(A, b)
+
+@pytest.mark.parametrize("col", [0, 2, 4])
+def test_det_por_columna(col):
+    A, b = _sistema(5, 9)
+    cache = CacheMenores(None)
+    Ai = [f[:col] + [v] + f[col + 1:] for f, v in zip(A, b)]
+    assert det_por_columna(A, col, [f[col] for f in A], cache) == det_cofactores(A)
+    assert det_por_columna(A, col, b, cache) == det_cofactores(Ai)
+
+def test_menores_compartidos_entre_columnas(capsys):
+    n = 6
+    A, b = _sistema(n, 3)
+    resolver_sistema_cramer(A, b)
+    salida = capsys.readouterr().out
+    distintos, reutilizados = map(int, re.search(r"calculados: (\d+); reutilizados: (\d+)", salida).groups())
+    # a lo sumo un menor por par (filas, columnas) de tamaño 2 … n−1
+    assert distintos <= sum(comb(n, k) ** 2 for k in range(2, n))
+    assert reutilizados > 0
+
+@pytest.mark.parametrize("n", [1, 2])
+def test_sin_menores_no_muestra_estadisticas(n, capsys):
+    A, b = _sistema(n, n)
+    resolver_sistema_cramer(A, b)
+    assert "Menores distintos" not in capsys.readouterr().out
+
+def test_singular(capsys):
+    A = fracciones([[1, 2, 3], [2, 4, 6], [1, 1, 1]])
+    assert resolver_sistema_cramer(A, fracciones([[1, 2, 3]])[0]) is None
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Cramer en un pool de procesos: misma solución y misma salida (incluidas las
+estadísticas de menores) que la versión en serie."""
+import random
+import re
+
+import pytest
+
+import ReglaDeCramer
+from ReglaDeCramer import resolver_sistema_cramer
+from referencias import fracciones, no_singular, resolver_gauss
+
+
+def _sistema(n, semilla):
+    rng = random.Random(semilla)
+    return fracciones(no_singular(n, rng)), fracciones([[rng.randint(-9, 9) for _ in range(n)]])[0]
+
+def _normalizar(texto):
+    """La prueba modular usa primos al azar: se quitan de la comparación."""
+    return re.sub(r"\(mod [\d, ]+\)", "(mod …)", texto)
+
+@pytest.mark.parametrize("compartir", [True, False])
+@pytest.mark.parametrize("n", [2, 4, 6])
+def test_paralelo_igual_a_serie(n, compartir, capsys, monkeypatch):
+    monkeypatch.setattr(ReglaDeCramer, "MIN_MENORES_POOL", 2)   # que los niveles vayan al pool
+    A, b = _sistema(n, n)
+    serie = resolver_sistema_cramer(A, b, compartir=compartir)
+    salida_serie = capsys.readouterr().out
+    paralelo = resolver_sistema_cramer(A, b, compartir=compartir, paralelo=True, procesos=2)
+    salida_paralelo = capsys.readouterr().out
+    assert paralelo == serie == resolver_gauss(A, b)
+    assert _normalizar(salida_paralelo) == _normalizar(salida_serie)
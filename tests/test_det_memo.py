@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""Laplace con memoria de menores contra el desarrollo por cofactores sin caché."""
+import random
+from math import comb
+
+import pytest
+
+from Determinantes import CacheMenores, calcular_determinante, calcular_determinante_memo
+from referencias import aleatoria, det_cofactores, fracciones
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 7])
+def test_memo_coincide_con_cofactores(n, capsys):
+    A = fracciones(aleatoria(n, n, random.Random(n), densidad=0.8))
+    cache = CacheMenores()
+    assert calcular_determinante_memo(A, cache=cache) == det_cofactores(A)
+    # a lo sumo un menor por subconjunto de columnas de tamaño ≥ 2
+    assert cache.fallos <= sum(comb(n, k) for k in range(2, n + 1))
+
+def test_los_menores_repetidos_se_reutilizan(capsys):
+    A = fracciones(aleatoria(6, 6, random.Random(1), 1, 9))
+    cache = CacheMenores()
+    calcular_determinante_memo(A, cache=cache)
+    assert cache.aciertos > 0
+    assert "ya calculado" in capsys.readouterr().out
+
+def test_lru_acotada():
+    cache = CacheMenores(2)
+    for k in range(3):
+        cache.put(k, k)
+    assert cache.get(0) is None and cache.get(2) == 2
+    assert (cache.aciertos, cache.fallos) == (1, 1)
+
+def test_vista_con_memo(capsys):
+    A = fracciones(aleatoria(5, 5, random.Random(2)))
+    assert calcular_determinante(A, memo=True) == det_cofactores(A)
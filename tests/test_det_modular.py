@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""det mod p, prueba de singularidad y det por CRT contra el desarrollo por cofactores."""
+import random
+from fractions import Fraction
+
+import pytest
+
+from AritmeticaModular import det_mod_p, det_modular, prueba_singularidad
+from referencias import aleatoria, det_cofactores, fracciones
+
+
+@pytest.mark.parametrize("n", [1, 2, 4, 6])
+@pytest.mark.parametrize("p", [2, 13, 1000003])
+def test_det_mod_p_coincide_con_cofactores(n, p):
+    A = aleatoria(n, n, random.Random(n * p), -20, 20)
+    assert det_mod_p(A, p) == det_cofactores(A) % p
+
+@pytest.mark.parametrize("n", [2, 5, 7])
+def test_det_modular_exacto(n):
+    rng = random.Random(n)
+    A = [[Fraction(rng.randint(-9, 9), rng.randint(1, 4)) for _ in range(n)] for _ in range(n)]
+    assert det_modular(A, semilla=n) == det_cofactores(A)
+
+def test_prueba_singularidad():
+    singular = fracciones([[1, 2, 3], [4, 5, 6], [5, 7, 9]])
+    regular = fracciones([[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+    assert prueba_singularidad(singular, segundo_primo=True).singular
+    assert not prueba_singularidad(regular).singular
+    assert prueba_singularidad([[1.0, 2.0], [3.0, 4.0]]) is None
+
+def test_inversa_estructurada_no_paga_la_prueba_modular(monkeypatch):
+    import MatrizInversa
+
+    def prohibida(*args, **kw):
+        raise AssertionError("prueba modular antes de un atajo O(n²)")
+    monkeypatch.setattr(MatrizInversa, "prueba_singularidad", prohibida)
+    A = fracciones([[2, 1, 0], [0, 3, 5], [0, 0, 4]])
+    inv, _, _ = MatrizInversa.inverse_with_logs(A, trazar=False)
+    assert inv is not None
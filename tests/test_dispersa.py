@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""CSR (SpMV, SpGEMM, suma) y LU dispersa contra el producto exacto y Gauss con fracciones."""
+import random
+from fractions import Fraction
+
+import pytest
+
+from Gauss import _gauss_disperso
+from MatrizDispersa import MatrizCSR, lu_dispersa, resolver_lu_dispersa, spgemm, spmv, suma_csr
+from referencias import aleatoria, aumentada, fracciones, producto_exacto, resolver_gauss
+
+
+def _dispersa_no_singular(n, rng):
+    """Diagonal no nula más unos pocos no ceros: dispersa y no singular."""
+    A = aleatoria(n, n, rng, densidad=0.15)
+    for i in range(n):
+        A[i][i] = rng.choice([-7, -6, 6, 7])
+    return A
+
+def test_csr_ida_y_vuelta_y_transpuesta():
+    A = fracciones(aleatoria(5, 7, random.Random(1), densidad=0.3))
+    csr = MatrizCSR.desde_densa(A)
+    assert csr.a_densa() == A
+    assert csr.transpuesta().a_densa() == [list(c) for c in zip(*A)]
+
+def test_spmv_spgemm_y_suma():
+    rng = random.Random(2)
+    A = fracciones(aleatoria(6, 4, rng, densidad=0.4))
+    B = fracciones(aleatoria(4, 5, rng, densidad=0.4))
+    C = fracciones(aleatoria(6, 4, rng, densidad=0.4))
+    v = [Fraction(rng.randint(-4, 4)) for _ in range(4)]
+    cA = MatrizCSR.desde_densa(A)
+    assert spmv(cA, v) == [fila[0] for fila in producto_exacto(A, [[x] for x in v])]
+    assert spgemm(cA, MatrizCSR.desde_densa(B)).a_densa() == producto_exacto(A, B)
+    assert suma_csr(cA, MatrizCSR.desde_densa(C)).a_densa() == \
+        [[a + c for a, c in zip(fa, fc)] for fa, fc in zip(A, C)]
+
+@pytest.mark.parametrize("n", [1, 5, 12, 25])
+def test_lu_dispersa_exacta_coincide_con_gauss(n):
+    rng = random.Random(n)
+    A = _dispersa_no_singular(n, rng)
+    b = [rng.randint(-9, 9) for _ in range(n)]
+    F = lu_dispersa(MatrizCSR.desde_densa(fracciones(A)), usar_tol=False)
+    x = resolver_lu_dispersa(F, [Fraction(v) for v in b])
+    assert x == resolver_gauss(A, b)
+
+def test_lu_dispersa_singular():
+    A = fracciones([[1, 2, 0], [2, 4, 0], [0, 0, 1]])
+    assert lu_dispersa(MatrizCSR.desde_densa(A), usar_tol=False) is None
+
+def test_camino_disperso_de_gauss_es_triangular_en_orden_de_pivoteo():
+    rng = random.Random(3)
+    n = 15
+    A = _dispersa_no_singular(n, rng)
+    b = [rng.randint(-9, 9) for _ in range(n)]
+    res = _gauss_disperso(aumentada(A, b), usar_tol=False)
+    assert res.soluciones == resolver_gauss(A, b)
+    T = res.triangular
+    assert all(T[i][j] == 0 for i in range(n) for j in range(i))
+    # cada columna de T es la variable res.columnas[k]
+    for i in range(n):
+        fila = sum((T[i][k] * res.soluciones[res.columnas[k]] for k in range(n)), Fraction(0))
+        assert fila == T[i][n]
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Expresiones diferidas (A + B, A @ B @ v) contra el cálculo exacto término a término."""
+import random
+from fractions import Fraction
+
+from referencias import aleatoria, fracciones, producto_exacto
+from SumayMultiplicaciondeMatrices import diferida
+
+
+def _suma(*Ms):
+    return [[sum(xs, Fraction(0)) for xs in zip(*filas)] for filas in zip(*Ms)]
+
+def test_cadena_de_productos_con_vector():
+    rng = random.Random(1)
+    A, B, C = (fracciones(aleatoria(m, n, rng)) for m, n in [(4, 6), (6, 3), (3, 5)])
+    v = [Fraction(rng.randint(-5, 5)) for _ in range(5)]
+    e = diferida(A, "A") @ diferida(B, "B") @ diferida(C, "C") @ diferida(v, "v")
+    esperado = producto_exacto(producto_exacto(producto_exacto(A, B), C), [[x] for x in v])
+    assert e.evaluar() == esperado
+    assert e.plan() == "(A @ (B @ (C @ v)))"
+
+def test_suma_fusionada_y_sum():
+    rng = random.Random(2)
+    A, B, C = (fracciones(aleatoria(3, 4, rng)) for _ in range(3))
+    assert (diferida(A) + diferida(B) + diferida(C)).evaluar() == _suma(A, B, C)
+    assert sum([diferida(A), diferida(A)]).evaluar() == _suma(A, A)
+
+def test_matriz_columna_mas_vector():
+    rng = random.Random(3)
+    A = fracciones(aleatoria(3, 3, rng))
+    col = fracciones(aleatoria(3, 1, rng))
+    v = [Fraction(x) for x in (1, -2, 3)]
+    esperado = _suma(col, producto_exacto(A, [[x] for x in v]))
+    assert (diferida(col) + diferida(A) @ diferida(v)).evaluar() == esperado
+    assert (diferida(A) @ diferida(v) + diferida(col)).evaluar() == esperado
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Freivalds contra el producto exacto y la inversa de Gauss-Jordan con fracciones."""
+import random
+from fractions import Fraction
+
+from Freivalds import verificar_inversa, verificar_producto
+from MatrizDispersa import MatrizCSR
+from MatrizInversa import inverse_with_logs
+from referencias import aleatoria, fracciones, no_singular, producto_exacto
+
+
+def test_producto_exacto_correcto_e_incorrecto():
+    rng = random.Random(1)
+    A, B = fracciones(aleatoria(5, 4, rng)), fracciones(aleatoria(4, 6, rng))
+    C = producto_exacto(A, B)
+    assert verificar_producto(A, B, C, rng=random.Random(0)).ok
+    C[3][2] += Fraction(1, 7)
+    assert not verificar_producto(A, B, C, rng=random.Random(0)).ok
+
+def test_producto_disperso_y_flotante():
+    rng = random.Random(2)
+    A, B = aleatoria(6, 6, rng, densidad=0.3), aleatoria(6, 6, rng, densidad=0.3)
+    C = [[float(x) for x in f] for f in producto_exacto(A, B)]
+    Af = [[float(x) for x in f] for f in A]
+    assert verificar_producto(MatrizCSR.desde_densa(Af), B, C, rng=random.Random(0)).ok
+    C[0][0] += 1.0
+    assert not verificar_producto(Af, B, C, rng=random.Random(0)).ok
+
+def test_inversa():
+    A = fracciones(no_singular(5, random.Random(3)))
+    Ainv, _, _ = inverse_with_logs(A, motor="gauss_jordan")
+    assert verificar_inversa(A, Ainv, rng=random.Random(0)).ok
+    Ainv[1][1] += 1
+    assert not verificar_inversa(A, Ainv, rng=random.Random(0)).ok
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Gauss-Jordan sobre las columnas vivas de [A | I] contra la adjunta por cofactores."""
+import random
+
+import pytest
+
+from MatrizInversa import inverse_with_logs
+from referencias import det_cofactores, fracciones, no_singular
+
+
+def _inversa_adjunta(A):
+    n = len(A)
+    d = det_cofactores(A)
+    def menor(i, j):
+        return [f[:j] + f[j + 1:] for k, f in enumerate(A) if k != i]
+    return [[(-1) ** (i + j) * det_cofactores(menor(j, i)) / d for j in range(n)] for i in range(n)]
+
+@pytest.mark.parametrize("n", [2, 3, 5, 6])
+@pytest.mark.parametrize("trazar", [True, False])
+def test_inversa_exacta_coincide_con_adjunta(n, trazar):
+    A = fracciones(no_singular(n, random.Random(n)))
+    Ainv, logs, aug = inverse_with_logs(A, trazar=trazar, motor="gauss_jordan")
+    assert Ainv == _inversa_adjunta(A)
+    assert [f[:n] for f in aug] == [[int(i == j) for j in range(n)] for i in range(n)]
+
+def test_inversa_dispersa_con_intercambios():
+    A = fracciones([[0, 0, 2, 0], [1, 0, 0, 3], [0, 4, 0, 0], [0, 0, 1, 1]])
+    Ainv, _, _ = inverse_with_logs(A, motor="gauss_jordan")
+    assert Ainv == _inversa_adjunta(A)
+
+def test_singular_sin_prueba_modular():
+    A = fracciones([[1, 2, 3], [2, 4, 6], [1, 0, 1]])
+    Ainv, logs, _ = inverse_with_logs(A, prueba_modular=False, motor="gauss_jordan")
+    assert Ainv is None
+    assert "NO invertible" in logs[-1]
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Jacobi, Gauss-Seidel/SOR y CG precondicionado contra Gauss con fracciones."""
+import random
+
+import pytest
+
+from Gauss import gauss_iterativo
+from Iterativos import METODOS, resolver_iterativo
+from MatrizDispersa import MatrizCSR
+from referencias import aumentada, banda, resolver_gauss, spd
+
+
+@pytest.mark.parametrize("metodo", METODOS)
+def test_converge_a_la_solucion_exacta(metodo):
+    rng = random.Random(len(metodo))
+    n = 12
+    A = spd(n, rng) if metodo == "cg" else banda(n, 2, 2, rng)   # SPD o diagonal dominante
+    b = [rng.randint(-9, 9) for _ in range(n)]
+    R = resolver_iterativo(A, b, metodo, tol=1e-12)
+    assert R.convergio
+    assert R.residuos[-1] <= 1e-12
+    assert R.soluciones == pytest.approx([float(v) for v in resolver_gauss(A, b)], rel=1e-8, abs=1e-10)
+
+def test_acepta_csr_y_valida_entradas():
+    rng = random.Random(3)
+    A = banda(8, 1, 1, rng)
+    b = [1] * 8
+    R = resolver_iterativo(MatrizCSR.desde_densa([[float(x) for x in f] for f in A]), b, "jacobi")
+    assert R.soluciones == pytest.approx([float(v) for v in resolver_gauss(A, b)], rel=1e-8)
+    with pytest.raises(ValueError):
+        resolver_iterativo([[0.0, 1.0], [1.0, 0.0]], [1, 1], "jacobi")
+    with pytest.raises(ValueError):
+        resolver_iterativo(A, b, "newton")
+
+def test_cg_detecta_matriz_no_spd():
+    R = resolver_iterativo([[1.0, 2.0], [2.0, 1.0]], [1.0, -1.0], "cg")
+    assert not R.convergio and "definida positiva" in R.motivo
+
+def test_vista_gauss_iterativo():
+    rng = random.Random(4)
+    A = spd(6, rng)
+    b = [rng.randint(-9, 9) for _ in range(6)]
+    res = gauss_iterativo(aumentada(A, b), "cg", tol=1e-12)
+    assert res.estado == "unica"
+    assert res.soluciones == pytest.approx([float(v) for v in resolver_gauss(A, b)], rel=1e-8)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""Desarrollo por la línea con más ceros contra cofactores por la primera fila."""
+import random
+
+import pytest
+
+from Determinantes import calcular_determinante, calcular_determinante_simple, elegir_linea
+from Motores import det_cofactor
+from referencias import aleatoria, det_cofactores, fracciones
+
+
+@pytest.mark.parametrize("n", [3, 4, 6])
+@pytest.mark.parametrize("densidad", [0.4, 0.8])
+def test_mejor_linea_coincide_con_cofactores(n, densidad, capsys):
+    A = fracciones(aleatoria(n, n, random.Random(n), densidad=densidad))
+    assert calcular_determinante_simple(A, mejor_linea=True) == det_cofactores(A)
+    assert det_cofactor(A) == det_cofactores(A)
+
+def test_elegir_linea():
+    assert elegir_linea([[1, 2, 3], [4, 5, 6], [7, 8, 9]]) == (True, 0)
+    assert elegir_linea([[1, 2, 3], [4, 0, 6], [7, 0, 9]]) == (False, 1)
+    assert elegir_linea([[1, 2, 3], [0, 0, 6], [7, 8, 9]]) == (True, 1)
+
+def test_por_defecto_se_expande_por_la_primera_fila(capsys):
+    A = fracciones([[1, 2, 0, 3], [0, 0, 5, 0], [2, 1, 1, 1], [3, 0, 2, 1]])
+    assert calcular_determinante(A, motor="cofactor") == det_cofactores(A)
+    clasico = capsys.readouterr().out
+    assert "EN LA PRIMERA FILA:" in clasico and "se omite" not in clasico
+    assert calcular_determinante(A, motor="cofactor", mejor_linea=True) == det_cofactores(A)
+    mejor = capsys.readouterr().out
+    assert "EN LA FILA 2 (la de más ceros)" in mejor and "a = 0 en (2,1) → se omite" in mejor
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Selector de motores: cada motor de det contra cofactores y el despacho de gauss_resolver
+hacia los caminos estructurales contra Gauss con fracciones."""
+import random
+from fractions import Fraction
+
+import pytest
+
+import Motores
+from Gauss import gauss_resolver
+from Motores import determinante, elegir_motor, guardar_modelo, presupuesto_pasos
+from referencias import aleatoria, aumentada, banda, det_cofactores, fracciones, resolver_gauss, spd
+
+PASOS = ("gauss", "banda", "disperso", "cholesky")
+
+
+@pytest.fixture(autouse=True)
+def modelo_de_fabrica(tmp_path, monkeypatch):
+    """Sin archivo de calibración ni ALGEBRA_MOTOR: constantes y presupuesto de fábrica."""
+    monkeypatch.setenv(Motores.VAR_CONFIG, str(tmp_path / "motores.json"))
+    monkeypatch.delenv(Motores.VAR_MOTOR, raising=False)
+    Motores.cargar_modelo(recargar=True)
+    yield
+    monkeypatch.undo()
+    Motores.cargar_modelo(recargar=True)
+
+def _dispersa(n, rng):
+    A = aleatoria(n, n, rng, densidad=0.03)
+    for i in range(n):
+        A[i][i] = 9
+    A[2][n - 3], A[n - 3][2] = 1, 2           # no es banda ni simétrica
+    return A
+
+@pytest.mark.parametrize("motor", ["cofactor", "bareiss", "modular", "disperso"])
+@pytest.mark.parametrize("n", [1, 3, 6])
+def test_motores_de_det_exactos(motor, n):
+    A = fracciones(aleatoria(n, n, random.Random(n), densidad=0.7))
+    assert determinante(A, motor) == det_cofactores(A)
+
+def test_det_automatico_y_flotante():
+    A = aleatoria(7, 7, random.Random(2))
+    assert determinante(fracciones(A)) == det_cofactores(A)
+    assert determinante([[float(x) for x in f] for f in A], "lu") == pytest.approx(float(det_cofactores(A)))
+
+@pytest.mark.parametrize("forma,esperado", [("tridiagonal", "banda"), ("banda", "banda"),
+                                            ("spd", "cholesky"), ("dispersa", "disperso")])
+def test_despacho_estructural(forma, esperado):
+    rng = random.Random(3)
+    A = {"tridiagonal": lambda: banda(200, 1, 1, rng), "banda": lambda: banda(60, 2, 3, rng),
+         "spd": lambda: spd(20, rng), "dispersa": lambda: _dispersa(80, rng)}[forma]()
+    assert elegir_motor("resolver", fracciones(A), pasos=PASOS, interactivo=True).motor == esperado
+    b = [rng.randint(-9, 9) for _ in range(len(A))]
+    res = gauss_resolver(aumentada(A, b), usar_tol=False, interactivo=True)
+    assert res.soluciones == resolver_gauss(A, b)
+
+def test_dispersa_pequena_no_va_al_motor_disperso():
+    A = [[float(x) for x in f] for f in _dispersa(20, random.Random(5))]
+    assert elegir_motor("resolver", A, pasos=PASOS, interactivo=True).motor != "disperso"
+    assert elegir_motor("mult", A, A).motor != "disperso"
+
+def test_interactivo_se_queda_con_pasos():
+    A = fracciones(aleatoria(40, 40, random.Random(4)))
+    assert elegir_motor("resolver", A, pasos=PASOS, interactivo=True).motor in PASOS
+    assert elegir_motor("resolver", A, pasos=PASOS).motor == "refinado"
+
+def test_motor_fijado(monkeypatch):
+    A = fracciones([[1, 2], [3, 4]])
+    assert elegir_motor("det", A, motor="bareiss").forzado == "parámetro"
+    monkeypatch.setenv(Motores.VAR_MOTOR, "det=modular,mult=clasico")
+    assert elegir_motor("det", A).motor == "modular"
+    with pytest.raises(ValueError):
+        elegir_motor("det", A, motor="gauss")
+
+def test_presupuesto_persistido():
+    assert presupuesto_pasos() == Motores.PRESUPUESTO_PASOS
+    guardar_modelo(Motores.cargar_modelo(), presupuesto=1.5)
+    assert presupuesto_pasos() == 1.5
+    A = fracciones(aleatoria(40, 40, random.Random(4)))
+    assert elegir_motor("resolver", A, pasos=PASOS).motor in PASOS
+
+def test_entradas_exactas_se_quedan_exactas():
+    rng = random.Random(6)
+    A = aleatoria(40, 40, rng)
+    b = [rng.randint(-9, 9) for _ in range(40)]
+    res = gauss_resolver(aumentada(A, b), usar_tol=False)
+    assert all(isinstance(x, Fraction) for fila in res.triangular for x in fila)
+    assert res.soluciones == resolver_gauss(A, b)
+
+def test_numpy_devuelve_la_triangular():
+    pytest.importorskip("numpy")
+    rng = random.Random(7)
+    A = aleatoria(12, 12, rng)
+    b = [rng.randint(-9, 9) for _ in range(12)]
+    aum = [[float(x) for x in f] for f in aumentada(A, b)]
+    res = gauss_resolver(aum, motor="numpy")
+    ref = gauss_resolver(aum, motor="gauss")
+    assert all(res.triangular[i][j] == 0 for i in range(12) for j in range(i))
+    for fila, fila_ref in zip(res.triangular, ref.triangular):
+        assert fila == pytest.approx(fila_ref, abs=1e-9)
+    assert res.soluciones == pytest.approx(ref.soluciones)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Motores flotantes de A×B (bloques, Strassen-Winograd) contra el producto exacto."""
+import random
+
+import pytest
+
+from referencias import aleatoria, producto_exacto
+from SumayMultiplicaciondeMatrices import _mult_bloques, _strassen, mult_matrices
+
+
+def _flotante(M):
+    return [[float(x) for x in fila] for fila in M]
+
+@pytest.mark.parametrize("m,k,n", [(1, 1, 1), (3, 5, 2), (17, 9, 23), (40, 70, 33)])
+def test_bloques_coincide_con_producto_exacto(m, k, n):
+    rng = random.Random(m * k * n)
+    A, B = aleatoria(m, k, rng), aleatoria(k, n, rng)
+    # entradas enteras pequeñas: el producto flotante es exacto
+    assert _mult_bloques(_flotante(A), _flotante(B), bloque=8) == producto_exacto(A, B)
+
+@pytest.mark.parametrize("n", [2, 7, 16, 33])
+def test_strassen_coincide_con_producto_exacto(n):
+    rng = random.Random(n)
+    A, B = aleatoria(n, n, rng), aleatoria(n, n, rng)
+    # umbral bajo para recorrer la recursión (incluido el relleno de n impar)
+    assert _strassen(_flotante(A), _flotante(B), umbral=2) == producto_exacto(A, B)
+
+@pytest.mark.parametrize("motor", ["clasico", "bloques", "strassen"])
+def test_mult_matrices_con_motor_fijo(motor):
+    rng = random.Random(7)
+    A, B = aleatoria(6, 4, rng), aleatoria(4, 5, rng)
+    assert mult_matrices(_flotante(A), _flotante(B), motor=motor) == producto_exacto(A, B)
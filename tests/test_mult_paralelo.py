@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""A×B por tiles en un pool de procesos (memoria compartida) contra el producto exacto."""
+import random
+
+import pytest
+
+from referencias import aleatoria, producto_exacto
+from SumayMultiplicaciondeMatrices import mult_matrices_paralelo
+
+
+@pytest.mark.parametrize("m,k,n,tile", [(1, 1, 1, 4), (5, 3, 7, 2), (12, 9, 10, 4)])
+def test_paralelo_coincide_con_producto_exacto(m, k, n, tile):
+    rng = random.Random(m + k + n)
+    A, B = aleatoria(m, k, rng), aleatoria(k, n, rng)
+    C = mult_matrices_paralelo([[float(x) for x in f] for f in A],
+                               [[float(x) for x in f] for f in B], procesos=2, tile=tile)
+    assert C == producto_exacto(A, B)
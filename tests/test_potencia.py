@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Aⁿ por cuadrados sucesivos contra productos exactos repetidos."""
+import random
+from fractions import Fraction
+
+import pytest
+
+from referencias import aleatoria, fracciones, identidad, producto_exacto
+from SumayMultiplicaciondeMatrices import potencia_matriz
+
+
+def _repetida(A, e):
+    R = identidad(len(A))
+    for _ in range(e):
+        R = producto_exacto(R, A)
+    return R
+
+@pytest.mark.parametrize("e", [0, 1, 2, 5, 13])
+@pytest.mark.parametrize("forma", ["general", "superior", "inferior", "diagonal"])
+def test_potencia_exacta(forma, e):
+    rng = random.Random(e)
+    n = 4
+    A = [[Fraction(rng.randint(-3, 3), rng.randint(1, 3)) for _ in range(n)] for _ in range(n)]
+    for i in range(n):
+        for j in range(n):
+            if (forma == "superior" and j < i) or (forma == "inferior" and j > i) or \
+               (forma == "diagonal" and i != j):
+                A[i][j] = Fraction(0)
+    P, productos, _ = potencia_matriz(A, e)
+    assert P == _repetida(A, e)
+    assert productos <= 2 * max(1, e.bit_length())
+
+def test_potencia_flotante():
+    A = aleatoria(3, 3, random.Random(9), -2, 2)
+    P, _, _ = potencia_matriz([[float(x) for x in f] for f in A], 6)
+    assert P == _repetida(fracciones(A), 6)
+
+def test_potencia_valida_argumentos():
+    with pytest.raises(ValueError):
+        potencia_matriz([[1.0, 2.0]], 2)
+    with pytest.raises(ValueError):
+        potencia_matriz([[1.0]], -1)
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""Rango multimodular contra el rango de Gauss-Jordan con fracciones."""
+import random
+
+import pytest
+
+from AritmeticaModular import es_primo, primos_aleatorios, rango_mod_p, rango_modular
+from GaussJordan import rref_with_logs
+from referencias import aleatoria, fracciones
+
+
+def _rango_ref(M):
+    return len(rref_with_logs(fracciones([f + [0] for f in M]), use_tol=False).pivot_cols)
+
+def _con_rango(m, n, r, rng):
+    U, V = aleatoria(m, r, rng, -9, 9), aleatoria(r, n, rng, -9, 9)
+    return [[sum(a * b for a, b in zip(fila, col)) for col in zip(*V)] for fila in U]
+
+def test_primos():
+    ps = primos_aleatorios(4, rng=random.Random(0))
+    assert len(set(ps)) == 4 and all(es_primo(p) and p > 2 ** 30 for p in ps)
+    assert [n for n in range(30) if es_primo(n)] == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+
+@pytest.mark.parametrize("m,n,r", [(4, 4, 4), (6, 8, 3), (9, 5, 5), (10, 10, 7)])
+def test_rango_coincide_con_gauss_jordan(m, n, r):
+    M = _con_rango(m, n, r, random.Random(m + n + r))
+    ref = _rango_ref(M)
+    res = rango_modular(M, semilla=1)
+    assert res.rango == ref
+    assert rango_modular(M, certificar=True, semilla=2).certificado
+    assert rango_mod_p(M, 7)[0] <= ref
+
+def test_primo_que_divide_da_cota_inferior():
+    # det = 7: mod 7 el rango cae, pero el máximo sobre varios primos lo recupera
+    M = [[7, 0], [0, 1]]
+    assert rango_mod_p(M, 7)[0] == 1
+    assert rango_modular(M, semilla=0).rango == 2
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Rango con salida temprana (y su certificado de dependencia) contra Gauss-Jordan exacto."""
+import random
+
+import pytest
+
+from GaussJordan import rref_with_logs
+from referencias import aleatoria, fracciones
+from VectorValidacion import rango_vectores
+
+
+def _rango_ref(vectores):
+    A = [[v[i] for v in vectores] + [0] for i in range(len(vectores[0]))]
+    return len(rref_with_logs(fracciones(A), use_tol=False).pivot_cols)
+
+def _vectores(n, p, rango, rng):
+    base = aleatoria(rango, n, rng, -4, 4)
+    vectores = []
+    for _ in range(p):
+        coef = [rng.randint(-2, 2) for _ in base]
+        vectores.append([sum(c * b[i] for c, b in zip(coef, base)) for i in range(n)])
+    return vectores
+
+@pytest.mark.parametrize("n,p,r", [(3, 2, 2), (4, 4, 4), (5, 7, 3), (6, 3, 1), (8, 8, 5)])
+def test_rango_coincide_con_gauss_jordan(n, p, r):
+    V = _vectores(n, p, r, random.Random(n + p + r))
+    rango, cert = rango_vectores(V)
+    assert rango == _rango_ref(V)
+    assert cert is None
+
+@pytest.mark.parametrize("n,p,r", [(3, 4, 3), (5, 6, 2), (4, 3, 2)])
+def test_certificado_de_dependencia(n, p, r):
+    V = _vectores(n, p, r, random.Random(n * p * r))
+    rango, x = rango_vectores(V, certificado=True)
+    assert rango == _rango_ref(V) < p
+    assert any(x)
+    assert all(sum(xj * v[i] for xj, v in zip(x, V)) == 0 for i in range(n))
+
+def test_independientes_sin_certificado():
+    V = [[1, 0, 0], [0, 1, 0], [1, 1, 1]]
+    assert rango_vectores(V, certificado=True) == (3, None)
+    assert rango_vectores([]) == (0, None)
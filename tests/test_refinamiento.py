@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Refinamiento iterativo mixto (LU flotante + residuo exacto) contra Gauss con fracciones."""
+import random
+from fractions import Fraction
+
+import pytest
+
+from FactorizacionLU import resolver_refinado
+from Gauss import gauss_refinado
+from referencias import aumentada, fracciones, no_singular, resolver_gauss
+
+
+@pytest.mark.parametrize("n", [1, 3, 6, 12])
+def test_refinado_exacto_coincide_con_gauss(n):
+    rng = random.Random(n)
+    A = no_singular(n, rng)
+    b = [rng.randint(-9, 9) for _ in range(n)]
+    R = resolver_refinado(fracciones(A), fracciones([b])[0])
+    assert R.exacta
+    assert R.soluciones == resolver_gauss(A, b)
+
+def test_refinado_con_fracciones_en_las_entradas():
+    rng = random.Random(5)
+    A = [[Fraction(rng.randint(-9, 9), rng.randint(1, 7)) for _ in range(4)] for _ in range(4)]
+    for i in range(4):
+        A[i][i] += 10
+    b = [Fraction(rng.randint(-9, 9), 3) for _ in range(4)]
+    assert resolver_refinado(A, b).soluciones == resolver_gauss(A, b)
+
+def test_refinado_flotante():
+    rng = random.Random(6)
+    A = no_singular(5, rng)
+    b = [rng.randint(-9, 9) for _ in range(5)]
+    R = resolver_refinado([[float(x) for x in f] for f in A], [float(v) for v in b])
+    assert not R.exacta
+    assert R.soluciones == pytest.approx([float(v) for v in resolver_gauss(A, b)], rel=1e-14)
+
+def test_singular_y_mal_condicionada_pasan_a_gauss():
+    singular = fracciones([[1, 2], [2, 4]])
+    assert resolver_refinado(singular, [Fraction(1), Fraction(2)]).soluciones is None
+    n = 9   # Hilbert: κ ≈ 5·10¹¹, el resultado sigue siendo exacto
+    H = [[Fraction(1, i + j + 1) for j in range(n)] for i in range(n)]
+    b = [Fraction(1)] * n
+    res = gauss_refinado(aumentada(H, b), usar_tol=False)
+    assert res.soluciones == resolver_gauss(H, b)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""RREF en dos fases contra Gauss-Jordan clásico y Gauss con fracciones."""
+import random
+
+import pytest
+
+from GaussJordan import rref_with_logs
+from referencias import aleatoria, aumentada, no_singular, resolver_gauss
+
+
+@pytest.mark.parametrize("m,n", [(3, 3), (4, 6), (6, 4), (5, 5)])
+def test_misma_rref_que_el_metodo_clasico(m, n):
+    rng = random.Random(m * 7 + n)
+    M = aleatoria(m, n, rng, -3, 3, densidad=0.6)
+    if m > 2:
+        M[-1] = [a + b for a, b in zip(M[0], M[1])]       # rango deficiente
+    aum = aumentada([f[:-1] for f in M], [f[-1] for f in M])
+    clasico = rref_with_logs(aum, use_tol=False)
+    dos = rref_with_logs(aum, use_tol=False, dos_fases=True)
+    assert dos.rref == clasico.rref
+    assert dos.pivot_cols == clasico.pivot_cols
+    assert dos.state == clasico.state
+
+@pytest.mark.parametrize("n", [2, 5, 7])
+def test_solucion_unica_coincide_con_gauss(n):
+    rng = random.Random(n)
+    A = no_singular(n, rng)
+    b = [rng.randint(-9, 9) for _ in range(n)]
+    res = rref_with_logs(aumentada(A, b), use_tol=False, dos_fases=True)
+    assert res.state == "unica"
+    assert res.solutions == resolver_gauss(A, b)
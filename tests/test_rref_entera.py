@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""RREF entera libre de fracciones (Bareiss) contra Gauss-Jordan con fracciones."""
+import random
+from fractions import Fraction
+
+import pytest
+
+from GaussJordan import rref_with_logs
+from referencias import aleatoria, fracciones
+from VectorValidacion import _rref_entera
+
+
+@pytest.mark.parametrize("m,n", [(2, 3), (3, 5), (5, 3), (4, 4), (6, 7)])
+def test_rref_entera_es_la_rref_exacta(m, n):
+    rng = random.Random(m * 10 + n)
+    M = aleatoria(m, n, rng, -6, 6, densidad=0.7)
+    if m > 2:
+        M[1] = [2 * a - b for a, b in zip(M[0], M[2])]     # rango deficiente
+    ref = rref_with_logs(fracciones(M), use_tol=False).rref
+    E = [fila[:] for fila in M]
+    D = _rref_entera(E, [])
+    assert all(isinstance(x, int) for fila in E for x in fila)
+    assert [[Fraction(x, D) for x in fila] for fila in E] == ref
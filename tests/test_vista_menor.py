@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Menores como vistas por índices contra submatrices copiadas y cofactores."""
+import random
+
+import pytest
+
+from Determinantes import VistaMenor, calcular_determinante_simple, obtener_submatriz
+from referencias import aleatoria, det_cofactores, fracciones
+
+
+def _sin(M, i, j):
+    return [f[:j] + f[j + 1:] for k, f in enumerate(M) if k != i]
+
+def test_vista_equivale_a_la_copia():
+    M = aleatoria(8, 8, random.Random(1))
+    V = VistaMenor(M).sin(2, 5)
+    C = _sin(M, 2, 5)
+    assert V.a_lista() == C
+    assert [list(f) for f in V] == C
+    assert [V[i][j] for i in range(7) for j in range(7)] == [x for f in C for x in f]
+    assert V[3][1:4] == C[3][1:4]
+    # un menor de un menor apunta a la base original
+    VV = V.sin(0, 0)
+    assert VV.base is M and VV.a_lista() == _sin(C, 0, 0)
+    assert VistaMenor(V, filas=(0, 1), cols=(2, 3)).a_lista() == [f[2:4] for f in C[:2]]
+    assert V.bloque(1, 3).a_lista() == [f[1:3] for f in C[1:3]]
+
+@pytest.mark.parametrize("n", [3, 5, 8])
+def test_obtener_submatriz(n):
+    M = aleatoria(n, n, random.Random(n))
+    for i, j in [(0, 0), (n - 1, 1), (n // 2, n - 1)]:
+        sub = obtener_submatriz(M, i, j)
+        assert [list(f) for f in sub] == _sin(M, i, j)
+        assert [list(f) for f in obtener_submatriz(sub, 0, 0)] == _sin(_sin(M, i, j), 0, 0)
+
+@pytest.mark.parametrize("n", [6, 7])
+def test_determinante_con_vistas(n, capsys):
+    A = fracciones(aleatoria(n, n, random.Random(n), densidad=0.6))
+    assert calcular_determinante_simple(A) == det_cofactores(A)